@@ -0,0 +1,69 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Create jobs_run_event table."""
+
+import sqlalchemy as sa
+import sqlalchemy_utils
+from alembic import op
+from invenio_db.shared import UTCDateTime
+from sqlalchemy.dialects import postgresql
+from sqlalchemy_utils.types import ChoiceType
+
+from invenio_jobs.models import RunStatusEnum
+
+# revision identifiers, used by Alembic.
+revision = "1792416999"
+down_revision = "1764848648"
+branch_labels = ()
+depends_on = None
+
+
+def upgrade():
+    """Upgrade database."""
+    op.create_table(
+        "jobs_run_event",
+        sa.Column("created", UTCDateTime(), nullable=False),
+        sa.Column("updated", UTCDateTime(), nullable=False),
+        sa.Column(
+            "id",
+            sa.BigInteger().with_variant(sa.Integer(), "sqlite"),
+            autoincrement=True,
+            nullable=False,
+        ),
+        sa.Column("run_id", sqlalchemy_utils.types.uuid.UUIDType(), nullable=False),
+        sa.Column("job_id", sqlalchemy_utils.types.uuid.UUIDType(), nullable=False),
+        sa.Column(
+            "parent_run_id", sqlalchemy_utils.types.uuid.UUIDType(), nullable=True
+        ),
+        sa.Column(
+            "status", ChoiceType(RunStatusEnum, impl=sa.String(1)), nullable=False
+        ),
+        sa.Column(
+            "payload",
+            sa.JSON()
+            .with_variant(sqlalchemy_utils.types.json.JSONType(), "mysql")
+            .with_variant(
+                postgresql.JSONB(none_as_null=True, astext_type=sa.Text()), "postgresql"
+            )
+            .with_variant(sqlalchemy_utils.types.json.JSONType(), "sqlite"),
+            nullable=True,
+        ),
+        sa.Column("dispatched_at", UTCDateTime(), nullable=True),
+        sa.Column(
+            "attempts", sa.Integer(), nullable=False, server_default=sa.text("0")
+        ),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_jobs_run_event")),
+    )
+    op.create_index(
+        op.f("ix_jobs_run_event_dispatched_at"),
+        "jobs_run_event",
+        ["dispatched_at"],
+    )
+
+
+def downgrade():
+    """Downgrade database."""
+    op.drop_index(op.f("ix_jobs_run_event_dispatched_at"), table_name="jobs_run_event")
+    op.drop_table("jobs_run_event")
@@ -0,0 +1,37 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Add timings column to jobs_run."""
+
+import sqlalchemy as sa
+import sqlalchemy_utils
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "1792503399"
+down_revision = "1792416999"
+branch_labels = ()
+depends_on = None
+
+
+def upgrade():
+    """Upgrade database."""
+    op.add_column(
+        "jobs_run",
+        sa.Column(
+            "timings",
+            sa.JSON()
+            .with_variant(sqlalchemy_utils.types.json.JSONType(), "mysql")
+            .with_variant(
+                postgresql.JSONB(none_as_null=True, astext_type=sa.Text()), "postgresql"
+            )
+            .with_variant(sqlalchemy_utils.types.json.JSONType(), "sqlite"),
+            nullable=True,
+        ),
+    )
+
+
+def downgrade():
+    """Downgrade database."""
+    op.drop_column("jobs_run", "timings")
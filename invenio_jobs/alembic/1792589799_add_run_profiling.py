@@ -0,0 +1,43 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Add run profiling."""
+
+import sqlalchemy as sa
+import sqlalchemy_utils
+from alembic import op
+from invenio_db.shared import UTCDateTime
+
+# revision identifiers, used by Alembic.
+revision = "1792589799"
+down_revision = "1792503399"
+branch_labels = ()
+depends_on = None
+
+
+def upgrade():
+    """Upgrade database."""
+    op.add_column(
+        "jobs_run",
+        sa.Column("profile", sa.Boolean(), server_default=sa.false(), nullable=False),
+    )
+    op.create_table(
+        "jobs_run_profile",
+        sa.Column("created", UTCDateTime(), nullable=False),
+        sa.Column("updated", UTCDateTime(), nullable=False),
+        sa.Column("run_id", sqlalchemy_utils.types.uuid.UUIDType(), nullable=False),
+        sa.Column("data", sa.LargeBinary(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["run_id"],
+            ["jobs_run.id"],
+            name=op.f("fk_jobs_run_profile_run_id_jobs_run"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("run_id", name=op.f("pk_jobs_run_profile")),
+    )
+
+
+def downgrade():
+    """Downgrade database."""
+    op.drop_table("jobs_run_profile")
+    op.drop_column("jobs_run", "profile")
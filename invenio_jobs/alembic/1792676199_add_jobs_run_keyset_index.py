@@ -0,0 +1,27 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Add keyset pagination index on runs."""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "1792676199"
+down_revision = "1792589799"
+branch_labels = ()
+depends_on = None
+
+
+def upgrade():
+    """Upgrade database."""
+    op.create_index(
+        "ix_jobs_run_job_id_created_id",
+        "jobs_run",
+        ["job_id", "created", "id"],
+        unique=False,
+    )
+
+
+def downgrade():
+    """Downgrade database."""
+    op.drop_index("ix_jobs_run_job_id_created_id", table_name="jobs_run")
@@ -0,0 +1,28 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Add next_run_at column to jobs_job."""
+
+import sqlalchemy as sa
+from alembic import op
+from invenio_db.shared import UTCDateTime
+
+# revision identifiers, used by Alembic.
+revision = "1792762599"
+down_revision = "1792676199"
+branch_labels = ()
+depends_on = None
+
+
+def upgrade():
+    """Upgrade database."""
+    op.add_column("jobs_job", sa.Column("next_run_at", UTCDateTime(), nullable=True))
+    op.create_index(
+        op.f("ix_jobs_job_next_run_at"), "jobs_job", ["next_run_at"], unique=False
+    )
+
+
+def downgrade():
+    """Downgrade database."""
+    op.drop_index(op.f("ix_jobs_job_next_run_at"), table_name="jobs_job")
+    op.drop_column("jobs_job", "next_run_at")
@@ -0,0 +1,42 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Add search indexes on jobs and runs."""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "1792848999"
+down_revision = "1792762599"
+branch_labels = ()
+depends_on = None
+
+TRIGRAM_INDEXES = [
+    ("ix_jobs_job_title_trgm", "jobs_job", "title"),
+    ("ix_jobs_job_description_trgm", "jobs_job", "description"),
+    ("ix_jobs_run_title_trgm", "jobs_run", "title"),
+]
+
+
+def upgrade():
+    """Upgrade database."""
+    op.create_index(op.f("ix_jobs_run_task_id"), "jobs_run", ["task_id"], unique=False)
+    if op.get_context().dialect.name == "postgresql":
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        for name, table, column in TRIGRAM_INDEXES:
+            op.create_index(
+                name,
+                table,
+                [column],
+                unique=False,
+                postgresql_using="gin",
+                postgresql_ops={column: "gin_trgm_ops"},
+            )
+
+
+def downgrade():
+    """Downgrade database."""
+    if op.get_context().dialect.name == "postgresql":
+        for name, table, _ in TRIGRAM_INDEXES:
+            op.drop_index(name, table_name=table)
+    op.drop_index(op.f("ix_jobs_run_task_id"), table_name="jobs_run")
@@ -0,0 +1,31 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Add keyset pagination indexes on the runs of all jobs."""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "1792935399"
+down_revision = "1792848999"
+branch_labels = ()
+depends_on = None
+
+
+def upgrade():
+    """Upgrade database."""
+    op.create_index(
+        "ix_jobs_run_created_id", "jobs_run", ["created", "id"], unique=False
+    )
+    op.create_index(
+        "ix_jobs_run_status_created_id",
+        "jobs_run",
+        ["status", "created", "id"],
+        unique=False,
+    )
+
+
+def downgrade():
+    """Downgrade database."""
+    op.drop_index("ix_jobs_run_status_created_id", table_name="jobs_run")
+    op.drop_index("ix_jobs_run_created_id", table_name="jobs_run")
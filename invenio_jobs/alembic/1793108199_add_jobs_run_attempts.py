@@ -0,0 +1,26 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Add attempts column to jobs_run."""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "1793108199"
+down_revision = "1793021799"
+branch_labels = ()
+depends_on = None
+
+
+def upgrade():
+    """Upgrade database."""
+    op.add_column(
+        "jobs_run",
+        sa.Column("attempts", sa.Integer(), server_default="0", nullable=False),
+    )
+
+
+def downgrade():
+    """Downgrade database."""
+    op.drop_column("jobs_run", "attempts")
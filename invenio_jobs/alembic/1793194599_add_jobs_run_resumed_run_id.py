@@ -0,0 +1,42 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Add resumed_run_id column to jobs_run."""
+
+import sqlalchemy as sa
+import sqlalchemy_utils
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "1793194599"
+down_revision = "1793108199"
+branch_labels = ()
+depends_on = None
+
+
+def upgrade():
+    """Upgrade database."""
+    op.add_column(
+        "jobs_run",
+        sa.Column(
+            "resumed_run_id",
+            sqlalchemy_utils.types.uuid.UUIDType(),
+            nullable=True,
+        ),
+    )
+    op.create_foreign_key(
+        op.f("fk_jobs_run_resumed_run_id_jobs_run"),
+        "jobs_run",
+        "jobs_run",
+        ["resumed_run_id"],
+        ["id"],
+        ondelete="SET NULL",
+    )
+
+
+def downgrade():
+    """Downgrade database."""
+    op.drop_constraint(
+        op.f("fk_jobs_run_resumed_run_id_jobs_run"), "jobs_run", type_="foreignkey"
+    )
+    op.drop_column("jobs_run", "resumed_run_id")
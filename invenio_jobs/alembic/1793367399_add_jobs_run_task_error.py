@@ -0,0 +1,23 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Add task_error column to jobs_run."""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "1793367399"
+down_revision = "1793280999"
+branch_labels = ()
+depends_on = None
+
+
+def upgrade():
+    """Upgrade database."""
+    op.add_column("jobs_run", sa.Column("task_error", sa.Text(), nullable=True))
+
+
+def downgrade():
+    """Downgrade database."""
+    op.drop_column("jobs_run", "task_error")
@@ -0,0 +1,24 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Add an index on the resumed run of the runs."""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "1793453799"
+down_revision = "1793367399"
+branch_labels = ()
+depends_on = None
+
+
+def upgrade():
+    """Upgrade database."""
+    op.create_index(
+        "ix_jobs_run_resumed_run_id", "jobs_run", ["resumed_run_id"], unique=False
+    )
+
+
+def downgrade():
+    """Downgrade database."""
+    op.drop_index("ix_jobs_run_resumed_run_id", table_name="jobs_run")
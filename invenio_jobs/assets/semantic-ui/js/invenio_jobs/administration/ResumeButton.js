@@ -0,0 +1,53 @@
+/*
+ * SPDX-FileCopyrightText: 2026 CERN
+ * SPDX-License-Identifier: MIT
+ */
+
+import { i18next } from "@translations/invenio_jobs/i18next";
+import PropTypes from "prop-types";
+import React, { useState } from "react";
+import { http, withCancel } from "react-invenio-forms";
+import { Button, Icon } from "semantic-ui-react";
+
+export const ResumeButton = ({ resumeURL, onResumed, onError }) => {
+  const [loading, setLoading] = useState(false);
+
+  const handleClick = async () => {
+    setLoading(true);
+    const cancellableAction = await withCancel(
+      http.post(resumeURL).catch((error) => {
+        if (error.response) {
+          onError(error.response.data);
+        } else {
+          onError(error);
+        }
+      })
+    );
+    const response = await cancellableAction.promise;
+    if (response) {
+      onResumed(response.data);
+    }
+    setLoading(false);
+  };
+
+  return (
+    <Button
+      fluid
+      className="primary outline"
+      size="medium"
+      onClick={handleClick}
+      loading={loading}
+      icon
+      labelPosition="left"
+    >
+      <Icon name="redo" />
+      {i18next.t("Resume")}
+    </Button>
+  );
+};
+
+ResumeButton.propTypes = {
+  resumeURL: PropTypes.string.isRequired,
+  onResumed: PropTypes.func.isRequired,
+  onError: PropTypes.func.isRequired,
+};
@@ -328,6 +328,23 @@ export class RunsLogs extends Component {
                       </List.Content>
                     </List.Item>
                   </List>
+                  {run.timings && Object.keys(run.timings).length > 0 && (
+                    <>
+                      <Header as="h4" color="grey">
+                        {i18next.t("Timings")}
+                      </Header>
+                      <List>
+                        {Object.entries(run.timings).map(([span, seconds]) => (
+                          <List.Item key={span}>
+                            <List.Content floated="right">
+                              {seconds.toFixed(2)} {i18next.t("s")}
+                            </List.Content>
+                            <List.Content>{span}</List.Content>
+                          </List.Item>
+                        ))}
+                      </List>
+                    </>
+                  )}
                 </Grid.Column>
                 <Grid.Column className="job-log-table" width={13}>
                   {/* Display error message for failed jobs */}
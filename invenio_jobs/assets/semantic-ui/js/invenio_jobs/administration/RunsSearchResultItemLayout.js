@@ -11,6 +11,7 @@ import { DateTime } from "luxon";
 import { UserListItemCompact } from "react-invenio-forms";
 import { withState } from "react-searchkit";
 import { Button, Table } from "semantic-ui-react";
+import { ResumeButton } from "./ResumeButton";
 import { StatusFormatter } from "./StatusFormatter";
 import { StopButton } from "./StopButton";
 import { diffTimestamps } from "./utils/diffTimestamps";
@@ -45,6 +46,15 @@ class SearchResultItemComponent extends Component {
     console.error(e);
   };
 
+  onResumed = (run) => {
+    const { addNotification } = this.context;
+    addNotification({
+      title: i18next.t("Run resumed"),
+      content: i18next.t("The run is resumed in run {{id}}.", { id: run.id }),
+      type: "success",
+    });
+  };
+
   render() {
     const { result } = this.props;
     const { msgShowAll, status } = this.state;
@@ -139,6 +149,12 @@ class SearchResultItemComponent extends Component {
               }}
               onError={this.onError}
             />
+          ) : result.links.resume ? (
+            <ResumeButton
+              resumeURL={result.links.resume}
+              onResumed={this.onResumed}
+              onError={this.onError}
+            />
           ) : (
             ""
           )}
@@ -0,0 +1,91 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Cooperative cancellation of the runs.
+
+Stopping a run (see ``RunsService.stop``) cancels it together with its queued
+or running subtasks, and revokes their tasks. Tasks which are already executing
+finish their current unit of work, and are expected to check whether their run
+was cancelled before starting the next one, e.g.:
+
+.. code-block:: python
+
+    for batch in batches:
+        check_cancelled()
+        process(batch)
+
+The chunked jobs check it before processing (or dispatching) each chunk, see
+``invenio_jobs.chunks``. The status of a run is read from the database at most
+once every ``JOBS_RUNS_CANCELLATION_CHECK_INTERVAL`` seconds per process.
+"""
+
+import time
+from collections import OrderedDict
+
+import sqlalchemy as sa
+from flask import current_app
+from invenio_db import db
+
+from .errors import RunCancelledError
+from .logging.jobs import EMPTY_JOB_CTX, job_context
+from .models import Run, RunStatusEnum
+
+CANCELLED_STATUSES = (RunStatusEnum.CANCELLING, RunStatusEnum.CANCELLED)
+
+ACTIVE_STATUSES = (RunStatusEnum.QUEUED, RunStatusEnum.RUNNING)
+
+CANCELLATION_CACHE_SIZE = 1024
+"""Maximum number of runs whose cancellation status is cached per process."""
+
+# Run ID -> (monotonic time of the check, cancelled)
+_cancellation_cache = OrderedDict()
+
+
+def is_cancelled(run_id):
+    """Return whether a run was cancelled (or is being cancelled)."""
+    run_id = str(run_id)
+    now = time.monotonic()
+    interval = current_app.config["JOBS_RUNS_CANCELLATION_CHECK_INTERVAL"]
+    checked_at, cancelled = _cancellation_cache.get(run_id, (None, False))
+    # Cancellations are final, and don't need to be checked again
+    if cancelled or (checked_at is not None and now - checked_at < interval):
+        return cancelled
+
+    status = db.session.execute(sa.select(Run.status).where(Run.id == run_id)).scalar()
+    cancelled = status in CANCELLED_STATUSES
+    _cancellation_cache[run_id] = (now, cancelled)
+    _cancellation_cache.move_to_end(run_id)
+    if len(_cancellation_cache) > CANCELLATION_CACHE_SIZE:
+        _cancellation_cache.popitem(last=False)
+    return cancelled
+
+
+def check_cancelled(run_id=None):
+    """Raise a :class:`RunCancelledError` if a run was cancelled.
+
+    :param run_id: The ID of the run, defaults to the run being executed.
+    """
+    if run_id is None:
+        context = job_context.get()
+        if context is EMPTY_JOB_CTX:
+            return
+        run_id = context["run_id"]
+    if is_cancelled(run_id):
+        raise RunCancelledError(run_id)
+
+
+def active_descendants(run):
+    """Return the IDs and task IDs of the queued or running descendants of a run."""
+    descendants = []
+    parent_ids = [run.id]
+    while parent_ids:
+        rows = db.session.execute(
+            sa.select(Run.id, Run.task_id, Run.status).where(
+                Run.parent_run_id.in_(parent_ids)
+            )
+        ).all()
+        descendants.extend(
+            (id_, task_id) for id_, task_id, status in rows if status in ACTIVE_STATUSES
+        )
+        parent_ids = [id_ for id_, _, _ in rows]
+    return descendants
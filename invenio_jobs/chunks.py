@@ -0,0 +1,307 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Chunked execution of jobs.
+
+A :class:`ChunkedJobType` splits the entries of a run into chunks, which are
+fanned out as subtasks of the run (with a bounded number of them being queued
+or running at once), or processed one after the other by the run itself.
+
+The task of the run only dispatches the first chunks. The next ones are
+dispatched each time a subtask finishes (see ``dispatch_run_chunks``), so that
+no worker waits on the subtasks, and the subtasks are closed once the last
+chunk is dispatched.
+
+The position after the last dispatched (or processed) chunk is stored as the
+``checkpoint`` of the run, in the same transaction as its subtask (or its
+counters). A run which is executed again, e.g. after its worker crashed,
+continues after its checkpoint instead of starting over.
+
+Runs check whether they were stopped before processing (or dispatching) each
+chunk, see ``invenio_jobs.cancellation``.
+"""
+
+from collections.abc import Sized
+
+import sqlalchemy as sa
+from flask import current_app
+from invenio_access.permissions import system_identity
+from invenio_db import db
+from invenio_records_resources.services.uow import TaskOp, UnitOfWork
+
+from .cancellation import ACTIVE_STATUSES, check_cancelled, is_cancelled
+from .errors import TaskExecutionPartialError
+from .jobs import JobType
+from .models import Run, RunStatusEnum
+from .proxies import current_runs_service
+from .services.errors import RunStatusChangeError
+from .tasks import dispatch_run_chunks, execute_chunk, execute_chunks
+
+
+class ChunkedJobType(JobType):
+    """Base class of jobs processing their entries by chunks.
+
+    Implementations provide :meth:`iter_chunks` and :meth:`process_chunk`,
+    e.g.:
+
+    .. code-block:: python
+
+        class ReindexJob(ChunkedJobType):
+
+            @classmethod
+            def iter_chunks(cls, cursor=None, **kwargs):
+                query = Record.query.order_by(Record.id)
+                if cursor:
+                    query = query.filter(Record.id > cursor)
+                for chunk in batched(query.with_entities(Record.id), 500):
+                    ids = [str(id_) for id_, in chunk]
+                    yield ids[-1], ids
+
+            @classmethod
+            def process_chunk(cls, chunk, **kwargs):
+                current_records_service.reindex(system_identity, chunk)
+                return {"updated_entries": len(chunk)}
+    """
+
+    task = execute_chunks
+    resumable = True
+    subtasks_closed_on_return = False
+
+    max_parallel_chunks = 4
+    """Maximum number of subtasks queued or running at once.
+
+    With ``0``, the chunks are processed by the run itself, without subtasks.
+    """
+
+    @classmethod
+    def iter_chunks(cls, cursor=None, **kwargs):
+        """Yield the chunks of entries to process, after a cursor.
+
+        :param cursor: The cursor of the last dispatched chunk, or ``None`` to
+            start from the first chunk.
+        :param kwargs: The arguments of the run.
+        :return: An iterable of ``(cursor, chunk)`` pairs, where the cursor is
+            the position after the chunk. Both must be JSON serializable.
+        """
+        raise NotImplementedError()
+
+    @classmethod
+    def process_chunk(cls, chunk, **kwargs):
+        """Process a chunk of entries.
+
+        :param chunk: The chunk, as yielded by :meth:`iter_chunks`.
+        :param kwargs: The arguments of the run.
+        :return: A dict of the counters of the processed entries (see
+            ``Run.entry_counters``), where ``total_entries`` defaults to the
+            length of the chunk.
+        """
+        raise NotImplementedError()
+
+    @classmethod
+    def chunk_counters(cls, chunk, counters=None):
+        """Return the entry counters reported for a chunk."""
+        counters = dict(counters or {})
+        unknown = set(counters) - set(Run.entry_counters)
+        if unknown:
+            raise ValueError(f"Unknown counters: {', '.join(sorted(unknown))}.")
+        if "total_entries" not in counters and isinstance(chunk, Sized):
+            counters["total_entries"] = len(chunk)
+        return counters
+
+    #
+    # Run execution
+    #
+    @classmethod
+    def run_chunks(cls, run, **kwargs):
+        """Process the chunks of a run, after its checkpoint."""
+        if not cls.max_parallel_chunks:
+            for cursor, chunk in cls.iter_chunks(cursor=run.checkpoint, **kwargs):
+                check_cancelled(run.id)
+                counters = cls.chunk_counters(chunk, cls.process_chunk(chunk, **kwargs))
+                cls._checkpoint(run, cursor, counters)
+            cls._check_errors(run)
+            return
+
+        # The subtasks are closed again once the last chunk is dispatched
+        run.subtasks_closed = False
+        run.task_error = None
+        db.session.commit()
+
+        # Subtasks dispatched before the run was interrupted may have lost their
+        # task, and are sent again (a subtask is only processed once)
+        for subtask in run.subtasks.filter(Run.status == RunStatusEnum.QUEUED):
+            cls._send_chunk(subtask)
+
+        cls.dispatch_chunks(run)
+
+    @classmethod
+    def dispatch_chunks(cls, run):
+        """Dispatch the next chunks of a run, to its free subtask slots.
+
+        Called by the task of the run, and then each time one of its subtasks
+        finishes. If the chunks can't be iterated, the chunks iterated until
+        then are dispatched before the error is raised.
+        """
+        # Concurrent dispatches of a run wait on the lock of its row
+        run = Run.query.filter_by(id=run.id).with_for_update().populate_existing().one()
+        slots = cls.max_parallel_chunks - cls._active_subtasks(run)
+        if run.status != RunStatusEnum.RUNNING or run.subtasks_closed or slots <= 0:
+            db.session.commit()
+            return
+
+        chunks, exhausted, error = [], False, None
+        try:
+            iterator = iter(cls.iter_chunks(cursor=run.checkpoint, **(run.args or {})))
+            while len(chunks) < slots:
+                chunks.append(next(iterator))
+            # Peek at the next chunk, to close the subtasks with the last one
+            exhausted = next(iterator, None) is None
+        except StopIteration:
+            exhausted = True
+        except Exception as e:
+            error = e
+
+        with UnitOfWork() as uow:
+            for cursor, chunk in chunks:
+                cls._dispatch_chunk(run, cursor, chunk, uow)
+            if exhausted:
+                current_runs_service.close_subtasks(
+                    system_identity, run.id, run.job_id, uow=uow
+                )
+            uow.commit()
+        if error:
+            raise error
+
+    @classmethod
+    def run_chunk(cls, subtask):
+        """Process the chunk of a subtask, and report its counters to its run."""
+        try:
+            current_runs_service.start_processing_subtask(
+                system_identity, subtask.id, subtask.job_id
+            )
+        except RunStatusChangeError:
+            return
+
+        chunk = subtask.args["chunk"]
+        try:
+            counters = cls.chunk_counters(
+                chunk, cls.process_chunk(chunk, **(subtask.parent_run.args or {}))
+            )
+        except Exception as e:
+            # The failure is reported in a new transaction, e.g. after a DB error
+            db.session.rollback()
+            current_app.logger.error(
+                f"Subtask {subtask.id} failed to process its chunk: {e}"
+            )
+            policy = cls.retry_policy
+            retry = policy and policy.should_retry(e, subtask.attempts)
+            try:
+                if retry and not is_cancelled(subtask.id):
+                    # The run's counters are only updated by the last attempt
+                    current_runs_service.retry_subtask(
+                        system_identity,
+                        subtask.id,
+                        subtask.job_id,
+                        message=f"{e.__class__.__name__}: {e}",
+                    )
+                    cls._send_chunk(
+                        subtask, countdown=policy.countdown(subtask.attempts)
+                    )
+                    return
+                current_runs_service.finalize_subtask(
+                    system_identity, subtask.id, subtask.job_id, success=False
+                )
+            except RunStatusChangeError:
+                # The subtask was cancelled with its run meanwhile
+                return
+            cls._send_dispatch(subtask)
+            return
+
+        try:
+            current_runs_service.finalize_subtask(
+                system_identity,
+                subtask.id,
+                subtask.job_id,
+                errored_entries_count=counters.get("errored_entries", 0),
+                inserted_entries_count=counters.get("inserted_entries", 0),
+                updated_entries_count=counters.get("updated_entries", 0),
+                total_entries_count=counters.get("total_entries", 0),
+            )
+        except RunStatusChangeError:
+            # The subtask was cancelled with its run meanwhile
+            return
+        cls._send_dispatch(subtask)
+
+    #
+    # Helpers
+    #
+    @classmethod
+    def _checkpoint(cls, run, cursor, counters):
+        """Store the checkpoint of a run together with the counters of a chunk."""
+        db.session.execute(
+            sa.update(Run)
+            .where(Run.id == run.id)
+            .values(
+                checkpoint=cursor,
+                **{name: getattr(Run, name) + n for name, n in counters.items()},
+            )
+        )
+        db.session.commit()
+
+    @classmethod
+    def _dispatch_chunk(cls, run, cursor, chunk, uow):
+        """Create the subtask of a chunk, and store the checkpoint of the run."""
+        item = current_runs_service.create_subtask_run(
+            system_identity,
+            run.id,
+            run.job_id,
+            args={"custom_args": {"chunk": chunk}},
+            uow=uow,
+        )
+        run.checkpoint = cursor
+        cls._send_chunk(db.session.get(Run, item.id), uow=uow)
+
+    @classmethod
+    def _send_chunk(cls, subtask, uow=None, countdown=None):
+        """Send the task processing the chunk of a subtask."""
+        celery_kwargs = {
+            "kwargs": {"run_id": str(subtask.id), "job_id": str(subtask.job_id)},
+            "task_id": str(subtask.task_id),
+            "queue": subtask.queue,
+        }
+        if countdown:
+            celery_kwargs["countdown"] = countdown
+        if uow:
+            uow.register(TaskOp.for_async_apply(execute_chunk, **celery_kwargs))
+        else:
+            execute_chunk.apply_async(**celery_kwargs)
+
+    @staticmethod
+    def _send_dispatch(subtask):
+        """Send the task dispatching the next chunks, once a subtask finished."""
+        dispatch_run_chunks.apply_async(
+            kwargs={
+                "run_id": str(subtask.parent_run_id),
+                "job_id": str(subtask.job_id),
+            },
+            queue=subtask.queue,
+        )
+
+    @staticmethod
+    def _active_subtasks(run):
+        """Return the number of queued or running subtasks of a run."""
+        return run.subtasks.filter(Run.status.in_(ACTIVE_STATUSES)).count()
+
+    @staticmethod
+    def _check_errors(run):
+        """Raise a partial error if entries or subtasks of the run failed."""
+        db.session.refresh(run)
+        if run.errored_entries or run.failed_subtasks:
+            parts = []
+            if run.failed_subtasks:
+                parts.append(f"{run.failed_subtasks} subtasks failed.")
+            if run.errored_entries:
+                parts.append(
+                    f"{run.errored_entries}/{run.total_entries} entries errored."
+                )
+            raise TaskExecutionPartialError(" ".join(parts))
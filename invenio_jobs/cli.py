@@ -27,6 +27,8 @@ from invenio_jobs.proxies import (
     current_jobs_service,
     current_runs_service,
 )
+from invenio_jobs.services.results import RunTree
+from invenio_jobs.services.services import get_run_tree
 
 LOG_LEVEL_STYLE = {
     "ERROR": "red",
@@ -264,37 +266,21 @@ def list_job_runs(job_id):
         raise
 
 
+def _get_run_tree(run):
+    """Collect the tree of the subtasks of a run."""
+    rows = get_run_tree(run.id)
+    return RunTree(current_runs_service, system_identity, rows).to_dict()
+
+
 def get_run_summary(run):
     """Collect run task and subtasks summary."""
-    run_summary = {
-        "total_subtasks": run.total_subtasks,
-        "completed_subtasks": run.completed_subtasks,
-        "failed_subtasks": run.failed_subtasks,
-        "errored_entries": run.errored_entries,
-        "inserted_entries": run.inserted_entries,
-        "updated_entries": run.updated_entries,
-        "total_entries": run.total_entries,
-    }
-    for subtask in run.substasks:
-        if subtask:
-            summary = get_run_summary(subtask)
-            for key, value in summary.items():
-                run_summary[key] += value
-    return run_summary
+    return _get_run_tree(run)["totals"]
 
 
 def print_run_log_table(instance_id):
     """Print table with run log."""
     run = _get_run(instance_id)
-    run_summary = {
-        "total_subtasks": run.total_subtasks,
-        "completed_subtasks": run.completed_subtasks,
-        "failed_subtasks": run.failed_subtasks,
-        "errored_entries": run.errored_entries,
-        "inserted_entries": run.inserted_entries,
-        "updated_entries": run.updated_entries,
-        "total_entries": run.total_entries,
-    }
+    run_summary = get_run_summary(run)
 
     console = Console()
     table = Table(
@@ -315,11 +301,60 @@ def print_run_log_table(instance_id):
     console.print(table)
 
 
+def print_run_log_summary_table(instance_id):
+    """Print table with the aggregated run log."""
+    run = _get_run(instance_id)
+    summary = current_jobs_logs_service.aggregate(system_identity, run.id).to_dict()
+
+    console = Console()
+    table = Table(
+        title="Invenio Run Log Summary", show_header=True, header_style="bold magenta"
+    )
+    table.add_column("Task", style="cyan")
+    table.add_column("Lines")
+    table.add_column("First")
+    table.add_column("Last")
+    table.add_column("Levels")
+
+    def _levels(levels):
+        return ", ".join(
+            f"[{LOG_LEVEL_STYLE.get(k, 'green')}]{k}: {v}[/]" for k, v in levels.items()
+        )
+
+    def _add_rows(nodes, depth=0):
+        for node in nodes:
+            table.add_row(
+                f"{'  ' * depth}{node['task_id']}",
+                str(node["count"]),
+                str(node["first"] or ""),
+                str(node["last"] or ""),
+                _levels(node["levels"]),
+            )
+            _add_rows(node["children"], depth + 1)
+
+    table.add_row(
+        "[bold cyan]Run",
+        str(summary["total"]),
+        str(summary["first"] or ""),
+        str(summary["last"] or ""),
+        _levels(summary["levels"]),
+    )
+    table.add_section()
+    _add_rows(summary["tasks"])
+    console.print(table)
+
+
 @jobs.command("log")
 @click.argument("instance_id")
 @click.option("-f", "--follow", is_flag=True, help="Follow run log until finished")
+@click.option(
+    "-s",
+    "--summary",
+    is_flag=True,
+    help="Print aggregated log counts per level and task instead of log lines",
+)
 @with_appcontext
-def print_run_log(instance_id, follow=False, interval=1):
+def print_run_log(instance_id, follow=False, summary=False, interval=1):
     """Print log of a job run."""
     try:
         while True:
@@ -328,7 +363,10 @@ def print_run_log(instance_id, follow=False, interval=1):
             if run is None:
                 click.echo(f"Run not found for ID: {instance_id}", err=True)
                 break
-            print_run_log_table(instance_id)
+            if summary:
+                print_run_log_summary_table(instance_id)
+            else:
+                print_run_log_table(instance_id)
             # if run.status not in (RunStatusEnum.QUEUED, RunStatusEnum.RUNNING, RunStatusEnum.CANCELLING):
             if run.status in (
                 RunStatusEnum.SUCCESS,
@@ -346,15 +384,57 @@ def print_run_log(instance_id, follow=False, interval=1):
         raise
 
 
+@jobs.command("tree")
+@click.argument("instance_id")
+@with_appcontext
+def print_run_tree(instance_id):
+    """Print the tree of the subtasks of a job run."""
+    run = _get_run(instance_id)
+    if not run:
+        click.echo(f"Run not found for ID: {instance_id}", err=True)
+        return
+
+    console = Console()
+    table = Table(
+        title="Invenio Run Tree", show_header=True, header_style="bold magenta"
+    )
+    table.add_column("Run", style="cyan")
+    table.add_column("Status")
+    table.add_column("Subtasks (completed/failed/total)")
+    table.add_column("Entries (errored/total)")
+
+    def _add_rows(node):
+        totals = node["totals"]
+        table.add_row(
+            f"{'  ' * node['depth']}{node['title'] or node['id']}",
+            node["status"].lower(),
+            f"{totals['completed_subtasks']}/{totals['failed_subtasks']}"
+            f"/{totals['total_subtasks']}",
+            f"{totals['errored_entries']}/{totals['total_entries']}",
+        )
+        for child in node["children"]:
+            _add_rows(child)
+
+    _add_rows(_get_run_tree(run))
+    console.print(table)
+
+
 @jobs.command("run")
 @click.argument("job_id")
+@click.option(
+    "--profile",
+    is_flag=True,
+    help="Profile the execution of the run (downloadable from the runs API).",
+)
 @with_appcontext
-def create_run_for_job(job_id):
+def create_run_for_job(job_id, profile=False):
     """Create a run for a job."""
     try:
         job = _get_job(job_id)
         run = current_runs_service.create(
-            system_identity, job.id, {"title": job.title, "default_queue": "celery"}
+            system_identity,
+            job.id,
+            {"title": job.title, "default_queue": "celery", "profile": profile},
         )
         console = Console()
         console.print(
@@ -365,6 +445,23 @@ def create_run_for_job(job_id):
         click.echo(f"Error creating job run: {e}", err=True)
 
 
+@jobs.command("resume")
+@click.argument("instance_id")
+@with_appcontext
+def resume_run(instance_id):
+    """Resume a failed or cancelled run, queueing only its unfinished subtasks."""
+    try:
+        run = _get_run(instance_id)
+        resumed = current_runs_service.resume(system_identity, run.job_id, run.id)
+        console = Console()
+        console.print(
+            f"[green]✓[/green] Run {run.id} resumed successfully in run {resumed.id}"
+        )
+    except Exception as e:
+        db.session.rollback()
+        click.echo(f"Error resuming run: {e}", err=True)
+
+
 @jobs.command("update")
 @click.argument("job_id")
 @with_appcontext
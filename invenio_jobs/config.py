@@ -75,6 +75,25 @@ JOBS_SEARCH = {
 }
 """Jobs search configuration."""
 
+JOBS_RUNS_TIMINGS_AGGREGATION_SIZE = 100
+"""Number of latest finished runs over which the timings of a job are aggregated."""
+
+JOBS_RUNS_CANCELLATION_CHECK_INTERVAL = 2
+"""Seconds during which a run's cancellation status is cached by the tasks.
+
+Executing tasks notice that their run was stopped within this interval (see
+``invenio_jobs.cancellation``).
+"""
+
+JOBS_RATE_LIMIT_BACKEND = None
+"""Storage of the token buckets of the job types' rate limits.
+
+A :class:`invenio_jobs.ratelimits.RateLimitBackend` instance (or an import string
+to it). Defaults to the database, where the buckets are shared by all the
+workers. Use a ``LocalRateLimitBackend()`` to limit the rate of each process
+separately.
+"""
+
 JOBS_LOGGING_LEVEL = "DEBUG"
 """Logging level for jobs."""
 
@@ -92,3 +111,55 @@ JOBS_LOGS_MAX_RESULTS = 2_000
 
 JOBS_LOGS_BATCH_SIZE = 500
 """Number of log results to fetch per batch from the search backend."""
+
+JOBS_LOGS_AGGREGATION_MAX_TASKS = 1_000
+"""Maximum number of distinct tasks returned when aggregating the logs of a run."""
+
+JOBS_LOGS_AGGREGATION_HISTOGRAM_BUCKETS = 50
+"""Target number of buckets of the date histogram when aggregating run logs."""
+
+JOBS_NOTIFICATIONS_QUEUE = None
+"""Celery queue to which run email notifications are sent.
+
+Defaults to the Celery default queue.
+"""
+
+JOBS_NOTIFICATIONS_DIGEST_WINDOW = 0
+"""Window in seconds over which run email notifications are coalesced.
+
+All the runs finishing within the same window are sent as a single email per
+recipient once the window is over. Set to ``0`` to send one email per run as soon
+as it finishes.
+"""
+
+JOBS_NOTIFICATIONS_DIGEST_DELAY = 30
+"""Grace period in seconds after the end of a digest window before sending it."""
+
+JOBS_RUN_EVENTS_SINKS = []
+"""Sinks to which run lifecycle events are delivered.
+
+List of :class:`invenio_jobs.events.RunEventSink` instances (or import strings to
+them), e.g. ``[WebhookSink("https://hooks.example.org/runs")]``. Events are only
+recorded if at least one sink is configured.
+"""
+
+JOBS_RUN_EVENTS_QUEUE = None
+"""Celery queue to which the run events dispatching task is sent."""
+
+JOBS_RUN_EVENTS_BATCH_SIZE = 100
+"""Maximum number of run events delivered to the sinks in a single batch."""
+
+JOBS_RUN_EVENTS_MAX_ATTEMPTS = 10
+"""Number of failed deliveries after which a run event is no longer retried.
+
+Undelivered events are retried on each dispatch; add the
+``invenio_jobs.tasks.dispatch_run_events`` task to ``CELERY_BEAT_SCHEDULE`` to
+retry them periodically.
+"""
+
+JOBS_METRICS_ENABLED = False
+"""Expose the jobs metrics in the Prometheus text format at ``/metrics/jobs``.
+
+Requires ``prometheus-client`` (``invenio-jobs[metrics]``). The endpoint is not
+access controlled, so it should only be reachable by the monitoring system.
+"""
@@ -31,3 +31,24 @@ class TaskExecutionError(Exception):
         )
         self.message = message
         super().__init__(message)
+
+
+class RunCancelledError(Exception):
+    """Exception raised when the run being executed was cancelled."""
+
+    def __init__(self, run_id):
+        """Constructor for the RunCancelledError class."""
+        self.run_id = run_id
+        self.message = f"Run {run_id} was cancelled."
+        super().__init__(self.message)
+
+
+class RateLimitExceededError(Exception):
+    """Exception raised when a rate limit doesn't allow a call in time."""
+
+    def __init__(self, key, wait):
+        """Constructor for the RateLimitExceededError class."""
+        self.key = key
+        self.wait = wait
+        self.message = f"Rate limit {key} exceeded, next call allowed in {wait:.1f}s."
+        super().__init__(self.message)
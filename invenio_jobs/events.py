@@ -0,0 +1,93 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Run event sinks.
+
+Run lifecycle events (created, started, finished, ...) are stored in the
+``jobs_run_event`` table in the same transaction as the status change of the
+run, and are then delivered in batches by the ``dispatch_run_events`` task to
+the sinks configured in ``JOBS_RUN_EVENTS_SINKS``.
+
+Delivery is at-least-once: a batch which fails on any sink is retried as a
+whole, so sinks must be idempotent (e.g. using the ``id`` of the events).
+"""
+
+import json
+import time
+import urllib.request
+
+from celery.utils.dispatch import Signal
+
+run_event = Signal(name="run_event")
+"""Celery signal sent for each run event by :class:`CelerySignalSink`."""
+
+
+class RunEventSink:
+    """Base class for run event sinks."""
+
+    def send(self, events):
+        """Deliver a batch of dumped events.
+
+        Raising an exception marks the whole batch as undelivered.
+        """
+        raise NotImplementedError()
+
+
+class CallbackSink(RunEventSink):
+    """Deliver events to an in-process callback."""
+
+    def __init__(self, callback):
+        """Constructor."""
+        self.callback = callback
+
+    def send(self, events):
+        """Call the callback with the batch of events."""
+        self.callback(events)
+
+
+class CelerySignalSink(RunEventSink):
+    """Deliver events through the ``run_event`` Celery signal."""
+
+    def __init__(self, signal=run_event):
+        """Constructor."""
+        self.signal = signal
+
+    def send(self, events):
+        """Send the signal once per event."""
+        for event in events:
+            self.signal.send(sender=self.__class__, event=event)
+
+
+class WebhookSink(RunEventSink):
+    """Deliver events to an HTTP endpoint as a JSON list.
+
+    Failed requests are retried with an exponential backoff, before giving up
+    and leaving the batch to the next dispatch.
+    """
+
+    def __init__(self, url, headers=None, timeout=5, retries=3, backoff=1):
+        """Constructor."""
+        self.url = url
+        self.headers = {"Content-Type": "application/json", **(headers or {})}
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+
+    def post(self, body):
+        """Post the body to the webhook URL."""
+        request = urllib.request.Request(
+            self.url, data=body, headers=self.headers, method="POST"
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout):
+            pass
+
+    def send(self, events):
+        """Post the batch of events, retrying on errors."""
+        body = json.dumps(events).encode("utf-8")
+        for attempt in range(self.retries + 1):
+            try:
+                return self.post(body)
+            except OSError:
+                if attempt == self.retries:
+                    raise
+                time.sleep(self.backoff * 2**attempt)
@@ -4,11 +4,14 @@
 
 """Jobs extension."""
 
+from functools import cached_property
+
 from celery import current_app as current_celery_app
 from flask import current_app
-from invenio_base.utils import entry_points
+from invenio_base.utils import entry_points, obj_or_import_string
 
 from . import config
+from .ratelimits import DatabaseRateLimitBackend
 from .registry import JobsRegistry
 from .resources import (
     JobLogResource,
@@ -95,6 +98,22 @@ class InvenioJobs:
             or current_celery_app.conf.task_default_queue
         )
 
+    @property
+    def run_event_sinks(self):
+        """Return the run event sinks."""
+        return [
+            obj_or_import_string(sink)
+            for sink in current_app.config["JOBS_RUN_EVENTS_SINKS"]
+        ]
+
+    @cached_property
+    def rate_limit_backend(self):
+        """Return the storage of the rate limits' token buckets."""
+        backend = current_app.config["JOBS_RATE_LIMIT_BACKEND"]
+        if backend:
+            return obj_or_import_string(backend)
+        return DatabaseRateLimitBackend()
+
     @property
     def tasks(self):
         """Return the tasks."""
@@ -113,6 +132,7 @@ def finalize_app(app):
     ext = app.extensions["invenio-jobs"]
     for ep in ext.load_entry_point_group():
         ext.registry.register(ep)
+    ext.registry.freeze()
 
     # services
     rr_ext.registry.register(ext.service, service_id="jobs")
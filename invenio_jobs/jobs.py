@@ -53,6 +53,34 @@ class JobType(ABC):
 
     arguments_schema = PredefinedArgsSchema
 
+    # Retries of the failed runs, see ``invenio_jobs.retries``
+    retry_policy = None
+
+    # Whether the failed runs can continue where they stopped, in a new run
+    resumable = False
+
+    # Whether all the subtasks of a run are spawned once its task returns. Job
+    # types spawning subtasks afterwards (e.g. the chunked jobs) close them
+    # with ``RunsService.close_subtasks``
+    subtasks_closed_on_return = True
+
+    # Rate limit of the calls to external services, see ``invenio_jobs.ratelimits``
+    rate_limit = None
+
+    # Whether the default arguments only depend on the job and its last
+    # successful run (see ``Job.default_args_revision``), and can be cached
+    cache_default_args = False
+
+    @classmethod
+    def acquire(cls, tokens=1, timeout=None):
+        """Wait until the rate limit of the job type allows a call.
+
+        Meant to be called by the tasks before each call to the rate-limited
+        service. Returns right away if the job type has no rate limit.
+        """
+        if cls.rate_limit:
+            cls.rate_limit.acquire(tokens, timeout=timeout, key=cls.id)
+
     @classmethod
     def create(
         cls, job_cls_name, arguments_schema, id_, task, description, title, attrs=None
@@ -21,7 +21,7 @@ from invenio_search.utils import prefix_index
 
 from invenio_jobs.services import JobLogEntrySchema
 
-from .. import config
+from .. import config, metrics
 
 # Define a global context variable to enrich logs
 EMPTY_JOB_CTX = object()
@@ -56,7 +56,8 @@ class ContextAwareOSHandler(logging.Handler):
     def index_in_os(self, log_data):
         """Send log data to OpenSearch."""
         full_index_name = prefix_index(current_app.config["JOBS_LOGGING_INDEX"])
-        current_search_client.index(index=full_index_name, body=log_data)
+        with metrics.log_ship_latency.time():
+            current_search_client.index(index=full_index_name, body=log_data)
 
 
 @contextmanager
@@ -0,0 +1,173 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Prometheus metrics for job execution and scheduling.
+
+Metrics are only collected if ``prometheus-client`` is installed (e.g. with the
+``metrics`` extra), otherwise all the hooks are no-ops. Celery workers and beat
+run in separate processes, so for the values they collect to be scraped from
+the web application, ``PROMETHEUS_MULTIPROC_DIR`` must be set to a directory
+shared by all processes (see the ``prometheus-client`` documentation).
+"""
+
+import os
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+from invenio_db import db
+from sqlalchemy import func
+
+from .models import Run, RunStatusEnum
+
+try:
+    import prometheus_client
+    from prometheus_client.core import GaugeMetricFamily
+except ImportError:  # pragma: no cover
+    prometheus_client = None
+
+DURATION_BUCKETS = (1, 5, 15, 30, 60, 300, 900, 1800, 3600, 7200, 21600, 86400)
+"""Buckets (in seconds) of the run duration and queue wait histograms."""
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+"""Buckets (in seconds) of the scheduler lag and log shipping histograms."""
+
+
+class _NoopMetric:
+    """Metric used when ``prometheus-client`` is not installed."""
+
+    def labels(self, *args, **kwargs):
+        return self
+
+    def inc(self, amount=1):
+        pass
+
+    def observe(self, amount):
+        pass
+
+    @contextmanager
+    def time(self):
+        yield
+
+
+def _metric(type_, name, documentation, **kwargs):
+    """Create a metric, or a no-op one if ``prometheus-client`` is missing."""
+    if prometheus_client is None:  # pragma: no cover
+        return _NoopMetric()
+    return getattr(prometheus_client, type_)(name, documentation, **kwargs)
+
+
+runs_finished = _metric(
+    "Counter",
+    "invenio_jobs_runs_finished_total",
+    "Number of finished runs.",
+    labelnames=["task", "status"],
+)
+run_duration = _metric(
+    "Histogram",
+    "invenio_jobs_run_duration_seconds",
+    "Time between the start and the end of a run.",
+    labelnames=["task", "status"],
+    buckets=DURATION_BUCKETS,
+)
+run_queue_wait = _metric(
+    "Histogram",
+    "invenio_jobs_run_queue_wait_seconds",
+    "Time a run spent queued before starting.",
+    labelnames=["task", "queue"],
+    buckets=DURATION_BUCKETS,
+)
+subtasks_finalized = _metric(
+    "Counter",
+    "invenio_jobs_subtasks_finalized_total",
+    "Number of finalized subtask runs.",
+    labelnames=["task", "status"],
+)
+scheduler_lag = _metric(
+    "Histogram",
+    "invenio_jobs_scheduler_lag_seconds",
+    "Delay between the due time of a scheduled job and its run being sent.",
+    buckets=LATENCY_BUCKETS,
+)
+scheduler_errors = _metric(
+    "Counter",
+    "invenio_jobs_scheduler_errors_total",
+    "Number of scheduled jobs which failed to be sent.",
+)
+log_ship_latency = _metric(
+    "Histogram",
+    "invenio_jobs_log_ship_seconds",
+    "Time spent indexing a job log record.",
+    buckets=LATENCY_BUCKETS,
+)
+
+
+def _seconds(start, end):
+    """Return the seconds between two datetimes, if both are set."""
+    if not start or not end:
+        return None
+    if start.tzinfo is None:
+        start = start.replace(tzinfo=timezone.utc)
+    if end.tzinfo is None:
+        end = end.replace(tzinfo=timezone.utc)
+    return max((end - start).total_seconds(), 0)
+
+
+def observe_run_started(run):
+    """Record the queue wait time of a run which just started."""
+    wait = _seconds(run.created, run.started_at)
+    if wait is not None:
+        run_queue_wait.labels(task=run.job.task, queue=run.queue).observe(wait)
+
+
+def observe_run_finished(run, status):
+    """Record the outcome and duration of a finished run."""
+    task = run.job.task
+    runs_finished.labels(task=task, status=status.name).inc()
+    duration = _seconds(run.started_at, run.finished_at or datetime.now(timezone.utc))
+    if duration is not None:
+        run_duration.labels(task=task, status=status.name).observe(duration)
+
+
+def observe_subtask_finalized(run, status):
+    """Record a finalized subtask run."""
+    subtasks_finalized.labels(task=run.job.task, status=status.name).inc()
+
+
+def observe_scheduler_lag(entry):
+    """Record how late a schedule entry is being applied."""
+    remaining = entry.schedule.remaining_estimate(entry.last_run_at)
+    scheduler_lag.observe(max(-remaining.total_seconds(), 0))
+
+
+class RunsCollector:
+    """Collect the number of runs per status from the database at scrape time."""
+
+    def collect(self):
+        """Yield the runs gauge."""
+        gauge = GaugeMetricFamily(
+            "invenio_jobs_runs",
+            "Number of runs per status.",
+            labels=["status"],
+        )
+        counts = dict(
+            db.session.query(Run.status, func.count(Run.id)).group_by(Run.status)
+        )
+        for status in RunStatusEnum:
+            gauge.add_metric([status.name], counts.get(status, 0))
+        yield gauge
+
+
+def generate_latest():
+    """Render the metrics in the Prometheus text format."""
+    from prometheus_client import CollectorRegistry, multiprocess
+
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = prometheus_client.REGISTRY
+    output = prometheus_client.generate_latest(registry)
+
+    runs_registry = CollectorRegistry(auto_describe=False)
+    runs_registry.register(RunsCollector())
+    return output + prometheus_client.generate_latest(runs_registry)
@@ -8,8 +8,9 @@
 import enum
 import json
 import uuid
+from collections import OrderedDict
 from copy import deepcopy
-from datetime import timedelta
+from datetime import datetime, timedelta, timezone
 
 import sqlalchemy as sa
 from celery.schedules import crontab
@@ -21,7 +22,12 @@ from sqlalchemy_utils.types import ChoiceType, JSONType, UUIDType
 from werkzeug.utils import cached_property
 
 from invenio_jobs.proxies import current_jobs
-from invenio_jobs.utils import job_arg_json_dumper
+from invenio_jobs.utils import normalize_job_args
+
+DEFAULT_ARGS_CACHE_SIZE = 1024
+"""Number of job revisions whose normalized default arguments are kept."""
+
+_default_args_cache = OrderedDict()
 
 JSON = (
     db.JSON()
@@ -32,8 +38,12 @@ JSON = (
 
 
 def _dump_dict(model):
-    """Dump a model to a dictionary."""
-    return {c.key: getattr(model, c.key) for c in sa.inspect(model).mapper.column_attrs}
+    """Dump the (non deferred) columns of a model to a dictionary."""
+    return {
+        c.key: getattr(model, c.key)
+        for c in sa.inspect(model).mapper.column_attrs
+        if not c.deferred
+    }
 
 
 def _split_task_arguments(task_arguments=None):
@@ -47,6 +57,21 @@ class Job(db.Model, db.Timestamp):
     """Job model."""
 
     __tablename__ = "jobs_job"
+    __table_args__ = (
+        # Substring search of the jobs, on PostgreSQL only
+        db.Index(
+            "ix_jobs_job_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+        db.Index(
+            "ix_jobs_job_description_trgm",
+            "description",
+            postgresql_using="gin",
+            postgresql_ops={"description": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
 
     id = db.Column(UUIDType, primary_key=True, default=uuid.uuid4)
     active = db.Column(db.Boolean, default=True, nullable=False)
@@ -57,6 +82,7 @@ class Job(db.Model, db.Timestamp):
     schedule = db.Column(JSON, nullable=True)
     run_args = db.Column(JSON, nullable=True)
     notifications = db.Column(JSON, nullable=True, default=None)
+    next_run_at = db.Column(db.UTCDateTime, nullable=True, index=True)
 
     @property
     def last_run(self):
@@ -83,6 +109,59 @@ class Job(db.Model, db.Timestamp):
             custom_args=custom_args, job_obj=self, **task_arguments
         )
 
+    @property
+    def default_args_revision(self):
+        """Revision of the job from which its default arguments are computed.
+
+        Default arguments depend on the job and on its last successful run
+        (e.g. ``since``).
+        """
+        last_success = (
+            self.runs.filter_by(status=RunStatusEnum.SUCCESS)
+            .order_by(Run.created.desc())
+            .with_entities(Run.id)
+            .first()
+        )
+        return (self.id, self.updated, last_success and last_success.id)
+
+    def _normalized_default_args(self):
+        """Return the normalized default arguments and their JSON.
+
+        They are only cached per revision for the job types declaring that
+        their default arguments depend on the revision alone (see
+        ``JobType.cache_default_args``).
+        """
+        state = sa.inspect(self)
+        job_type = current_jobs.registry.get(self.task)
+        # Pending changes are not part of any revision yet
+        if not job_type.cache_default_args or not state.persistent or state.modified:
+            args = normalize_job_args(self.default_args)
+            return args, json.dumps(args)
+
+        key = self.default_args_revision
+        try:
+            _default_args_cache.move_to_end(key)
+            return _default_args_cache[key]
+        except KeyError:
+            args = normalize_job_args(self.default_args)
+            value = _default_args_cache[key] = (args, json.dumps(args))
+            if len(_default_args_cache) > DEFAULT_ARGS_CACHE_SIZE:
+                _default_args_cache.popitem(last=False)
+            return value
+
+    @property
+    def normalized_default_args(self):
+        """Default job arguments as JSON values, possibly cached per revision.
+
+        The cached arguments are shared, and must not be modified.
+        """
+        return self._normalized_default_args()[0]
+
+    @property
+    def default_args_json(self):
+        """Default job arguments serialized to JSON, possibly cached per revision."""
+        return self._normalized_default_args()[1]
+
     @property
     def parsed_schedule(self):
         """Return schedule parsed as crontab or timedelta."""
@@ -96,6 +175,22 @@ class Job(db.Model, db.Timestamp):
         elif stype == "interval":
             return timedelta(**schedule)
 
+    def compute_next_run_at(self, last_run_at=None):
+        """Compute the next time the job is due, following its last run.
+
+        Jobs which never ran are due one interval (or crontab occurrence) from
+        now, like Celery beat entries. Inactive and unscheduled jobs are never due.
+        """
+        schedule = self.parsed_schedule
+        if not self.active or schedule is None:
+            return None
+
+        last_run_at = last_run_at or datetime.now(timezone.utc)
+        if isinstance(schedule, timedelta):
+            return last_run_at + schedule
+        start, ends_in, _ = schedule.remaining_delta(last_run_at)
+        return (start + ends_in).astimezone(timezone.utc)
+
     def set_run_args(self, value):
         """Custom setter for run_args.
 
@@ -113,6 +208,14 @@ class Job(db.Model, db.Timestamp):
         return _dump_dict(self)
 
 
+# The trigram indexes of the search require the ``pg_trgm`` extension
+sa.event.listen(
+    Job.__table__,
+    "before_create",
+    sa.DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+
+
 class RunStatusEnum(enum.Enum):
     """Enumeration of a run's possible states."""
 
@@ -129,7 +232,38 @@ class RunStatusEnum(enum.Enum):
 class Run(db.Model, db.Timestamp):
     """Run model."""
 
+    # Statuses of the finished runs which can be resumed
+    resumable_statuses = (
+        RunStatusEnum.FAILED,
+        RunStatusEnum.CANCELLED,
+        RunStatusEnum.PARTIAL_SUCCESS,
+    )
+
+    finished_statuses = (
+        RunStatusEnum.SUCCESS,
+        RunStatusEnum.FAILED,
+        RunStatusEnum.WARNING,
+        RunStatusEnum.CANCELLED,
+        RunStatusEnum.PARTIAL_SUCCESS,
+    )
+
     __tablename__ = "jobs_run"
+    __table_args__ = (
+        # Keyset pagination of the runs of a job
+        db.Index("ix_jobs_run_job_id_created_id", "job_id", "created", "id"),
+        # Keyset pagination of the runs of all jobs, optionally by status
+        db.Index("ix_jobs_run_created_id", "created", "id"),
+        db.Index("ix_jobs_run_status_created_id", "status", "created", "id"),
+        # Runs resuming a run, e.g. to tell whether it was already resumed
+        db.Index("ix_jobs_run_resumed_run_id", "resumed_run_id"),
+        # Substring search of the runs, on PostgreSQL only
+        db.Index(
+            "ix_jobs_run_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
 
     id = db.Column(UUIDType, primary_key=True, default=uuid.uuid4)
 
@@ -148,7 +282,7 @@ class Run(db.Model, db.Timestamp):
     started_at = db.Column(db.UTCDateTime, nullable=True)
     finished_at = db.Column(db.UTCDateTime, nullable=True)
 
-    task_id = db.Column(UUIDType, nullable=True)
+    task_id = db.Column(UUIDType, nullable=True, index=True)
     status = db.Column(
         ChoiceType(RunStatusEnum, impl=db.String(1)),
         nullable=False,
@@ -169,10 +303,20 @@ class Run(db.Model, db.Timestamp):
         backref=db.backref("parent_run", remote_side=[id]),
         cascade="all, delete-orphan",
         lazy="dynamic",
+        foreign_keys=[parent_run_id],
+    )
+    # The run resumed by this run, see ``RunsService.resume``
+    resumed_run_id = db.Column(
+        UUIDType, db.ForeignKey("jobs_run.id", ondelete="SET NULL"), nullable=True
     )
+
     # Meant to mark if the sibtasks of this run have been all spawned.
     subtasks_closed = db.Column(db.Boolean, default=False, nullable=False)
 
+    # Error of the run's task, if it failed while its subtasks were running.
+    # Reported by the last subtask when it finalizes the run.
+    task_error = db.Column(db.Text, nullable=True)
+
     total_subtasks = db.Column(
         db.Integer, default=0, server_default="0", nullable=False
     )
@@ -193,6 +337,39 @@ class Run(db.Model, db.Timestamp):
     )
     total_entries = db.Column(db.Integer, default=0, server_default="0", nullable=False)
 
+    # Number of executions of the run, see ``invenio_jobs.retries``
+    attempts = db.Column(db.Integer, default=0, server_default="0", nullable=False)
+
+    # Counters summed over the subtasks of a run, see ``get_run_tree``
+    counters = (
+        "total_subtasks",
+        "completed_subtasks",
+        "failed_subtasks",
+        "errored_entries",
+        "inserted_entries",
+        "updated_entries",
+        "total_entries",
+    )
+
+    # Counters of the entries processed by a run
+    entry_counters = (
+        "errored_entries",
+        "inserted_entries",
+        "updated_entries",
+        "total_entries",
+    )
+
+    # Duration in seconds of the phases of the run, see ``invenio_jobs.timings``
+    timings = db.Column(JSON, nullable=True)
+
+    # Position after the last chunk of the run, see ``invenio_jobs.chunks``
+    checkpoint = db.Column(JSON, nullable=True)
+
+    # Whether to profile the execution of the run, see ``invenio_jobs.profiling``
+    profile = db.Column(
+        db.Boolean, default=False, server_default=sa.false(), nullable=False
+    )
+
     @classmethod
     def create(cls, job, **kwargs):
         """Create a new run."""
@@ -212,11 +389,7 @@ class Run(db.Model, db.Timestamp):
         args = Task.get(job.task)._build_task_arguments(
             job_obj=job, custom_args=custom_args, **task_arguments
         )
-
-        args = json.dumps(args, default=job_arg_json_dumper)
-        args = json.loads(args)
-
-        return args
+        return normalize_job_args(args)
 
     def dump(self):
         """Dump the run as a dictionary."""
@@ -229,6 +402,99 @@ class Run(db.Model, db.Timestamp):
         return dict_run
 
 
+_resuming_run = Run.__table__.alias("resuming_run")
+
+# Whether the run was resumed by another run, see ``RunsService.resume``. Only
+# loaded by the queries which undefer it, e.g. to render the resume links.
+Run.was_resumed = sa.orm.column_property(
+    sa.select(_resuming_run.c.id)
+    .where(_resuming_run.c.resumed_run_id == Run.id)
+    .exists(),
+    deferred=True,
+)
+
+
+class RunEvent(db.Model, db.Timestamp):
+    """Run lifecycle event.
+
+    Events are written to this table (the "outbox") in the same transaction as
+    the run's status change, and are later delivered to the configured sinks.
+    """
+
+    __tablename__ = "jobs_run_event"
+
+    id = db.Column(
+        db.BigInteger().with_variant(db.Integer, "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+    )
+    # No foreign keys, so that events survive the deletion of their run/job
+    run_id = db.Column(UUIDType, nullable=False)
+    job_id = db.Column(UUIDType, nullable=False)
+    parent_run_id = db.Column(UUIDType, nullable=True)
+    status = db.Column(ChoiceType(RunStatusEnum, impl=db.String(1)), nullable=False)
+    payload = db.Column(JSON, default=lambda: dict(), nullable=True)
+
+    dispatched_at = db.Column(db.UTCDateTime, nullable=True, index=True)
+    attempts = db.Column(db.Integer, default=0, server_default="0", nullable=False)
+    last_error = db.Column(db.Text, nullable=True)
+
+    @classmethod
+    def create(cls, run, status=None):
+        """Create an event for the current status of a run."""
+        return cls(
+            run_id=run.id,
+            job_id=run.job.id,
+            parent_run_id=run.parent_run_id,
+            status=status or run.status or RunStatusEnum.QUEUED,
+            payload={"title": run.title, "queue": run.queue},
+        )
+
+    def dump(self):
+        """Dump the event as it is delivered to the sinks."""
+        return {
+            "id": self.id,
+            "type": f"run.{self.status.name.lower()}",
+            "run_id": str(self.run_id),
+            "job_id": str(self.job_id),
+            "parent_run_id": str(self.parent_run_id) if self.parent_run_id else None,
+            "status": self.status.name,
+            "created": self.created.isoformat(),
+            **(self.payload or {}),
+        }
+
+
+class RunProfile(db.Model, db.Timestamp):
+    """Profiling statistics of a run execution, in the ``pstats`` format."""
+
+    __tablename__ = "jobs_run_profile"
+
+    run_id = db.Column(
+        UUIDType, db.ForeignKey(Run.id, ondelete="CASCADE"), primary_key=True
+    )
+    run = db.relationship(
+        Run,
+        backref=db.backref(
+            "profile_stats", uselist=False, cascade="all, delete-orphan"
+        ),
+    )
+    data = db.Column(db.LargeBinary, nullable=False)
+
+
+class RateLimitBucket(db.Model):
+    """Token bucket of a rate limit, shared by all the workers.
+
+    See ``invenio_jobs.ratelimits``.
+    """
+
+    __tablename__ = "jobs_rate_limit_bucket"
+
+    key = db.Column(db.String(255), primary_key=True)
+    tokens = db.Column(db.Float, nullable=False)
+    # Seconds since the epoch of the last refill, comparable across hosts
+    refilled_at = db.Column(db.Float, nullable=False)
+
+
 class Task:
     """Celery Task model."""
 
@@ -0,0 +1,56 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""On-demand profiling of run executions.
+
+When a run is created with ``profile`` set, its task is executed under
+:mod:`cProfile`, and the resulting statistics are stored with the run. They can
+be downloaded from ``/jobs/<job_id>/runs/<run_id>/profile``, either in the binary
+``pstats`` format (to be loaded with :class:`pstats.Stats` or visualisation
+tools such as snakeviz), or as a text summary with ``?format=text``.
+"""
+
+import cProfile
+import io
+import marshal
+import pstats
+from contextlib import contextmanager
+
+from invenio_db import db
+
+from .models import RunProfile
+
+
+class _LoadedProfile:
+    """Profile-like object wrapping dumped statistics, as loaded by ``pstats``."""
+
+    def __init__(self, data):
+        """Constructor."""
+        self.stats = marshal.loads(data)
+
+    def create_stats(self):
+        """Statistics are already created."""
+
+
+@contextmanager
+def profile_run(run):
+    """Profile the block, and store the statistics on the run.
+
+    The statistics are added to the session, and saved with the next commit.
+    """
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+        profiler.create_stats()
+        db.session.merge(RunProfile(run_id=run.id, data=marshal.dumps(profiler.stats)))
+
+
+def format_profile(data, sort="cumulative", limit=50):
+    """Render dumped statistics as a text summary."""
+    stream = io.StringIO()
+    stats = pstats.Stats(_LoadedProfile(data), stream=stream)
+    stats.sort_stats(sort).print_stats(limit)
+    return stream.getvalue()
@@ -0,0 +1,166 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Rate limits of the job types.
+
+A job type calling a rate-limited service declares a :class:`RateLimit` as its
+``rate_limit``, and acquires a token before each call to the service, e.g.:
+
+.. code-block:: python
+
+    class OrcidSyncJob(ChunkedJobType):
+
+        rate_limit = RateLimit(rate=20, burst=40, key="orcid")
+
+        @classmethod
+        def process_chunk(cls, chunk, **kwargs):
+            for orcid in chunk:
+                cls.acquire()
+                sync_orcid_record(orcid)
+
+The rate limits are token buckets: a bucket holds up to ``burst`` tokens, is
+refilled with ``rate`` tokens per second, and each call takes a token (waiting
+for it if the bucket is empty). The buckets are shared by all the runs and
+subtasks of the job types using the same key, on all the workers, as they are
+stored in the database by default (see ``JOBS_RATE_LIMIT_BACKEND``). If the
+database can't be reached, each process falls back to buckets of its own.
+"""
+
+import threading
+import time
+
+import sqlalchemy as sa
+from flask import current_app
+from invenio_db import db
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+
+from .errors import RateLimitExceededError
+from .models import RateLimitBucket
+from .proxies import current_jobs
+
+
+def _take(available, tokens, rate):
+    """Take tokens from the available ones, if there are enough of them.
+
+    :return: The tokens left, and the seconds to wait for enough tokens (``0``
+        if they were taken).
+    """
+    if available >= tokens:
+        return available - tokens, 0
+    return available, (tokens - available) / rate
+
+
+class RateLimitBackend:
+    """Base class of the storages of the token buckets."""
+
+    def consume(self, key, rate, burst, tokens):
+        """Take tokens from a bucket, if it holds enough of them.
+
+        :return: ``0`` if the tokens were taken, or else the seconds to wait
+            until the bucket holds enough of them.
+        """
+        raise NotImplementedError()
+
+
+class LocalRateLimitBackend(RateLimitBackend):
+    """Token buckets of the current process."""
+
+    def __init__(self):
+        """Constructor."""
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def consume(self, key, rate, burst, tokens):
+        """Take tokens from a bucket of the process."""
+        with self._lock:
+            now = time.monotonic()
+            available, refilled_at = self._buckets.get(key, (burst, now))
+            available = min(burst, available + (now - refilled_at) * rate)
+            available, wait = _take(available, tokens, rate)
+            self._buckets[key] = (available, now)
+            return wait
+
+
+class DatabaseRateLimitBackend(RateLimitBackend):
+    """Token buckets stored in the database, shared by all the workers."""
+
+    def __init__(self):
+        """Constructor."""
+        self.fallback = LocalRateLimitBackend()
+
+    def consume(self, key, rate, burst, tokens):
+        """Take tokens from a bucket of the database, or of the process."""
+        try:
+            return self._consume(key, rate, burst, tokens)
+        except IntegrityError:
+            # The bucket was created concurrently
+            return self._consume(key, rate, burst, tokens)
+        except SQLAlchemyError as e:
+            current_app.logger.warning(
+                f"Rate limit {key} falls back to a bucket of the process: {e}"
+            )
+            return self.fallback.consume(key, rate, burst, tokens)
+
+    def _consume(self, key, rate, burst, tokens):
+        """Take tokens from a bucket, locking its row."""
+        table = RateLimitBucket.__table__
+        # In a transaction of its own, which doesn't commit the task's changes
+        with db.engine.begin() as conn:
+            row = conn.execute(
+                sa.select(table.c.tokens, table.c.refilled_at)
+                .where(table.c.key == key)
+                .with_for_update()
+            ).first()
+            now = time.time()
+            if row is None:
+                available = burst
+            else:
+                elapsed = max(now - row.refilled_at, 0)
+                available = min(burst, row.tokens + elapsed * rate)
+            available, wait = _take(available, tokens, rate)
+            values = {"tokens": available, "refilled_at": now}
+            if row is None:
+                conn.execute(table.insert().values(key=key, **values))
+            else:
+                conn.execute(table.update().where(table.c.key == key).values(values))
+        return wait
+
+
+class RateLimit:
+    """Rate limit of the calls to a service."""
+
+    def __init__(self, rate, burst=None, key=None):
+        """Constructor.
+
+        :param rate: The sustained number of calls per second.
+        :param burst: The maximum number of calls made at once, after a pause.
+            Defaults to the rate (and at least ``1``).
+        :param key: The key of the bucket, defaults to the ID of the job type.
+            Job types calling the same service should share a key.
+        """
+        if rate <= 0:
+            raise ValueError("The rate of a rate limit must be positive.")
+        self.rate = rate
+        self.burst = burst if burst is not None else max(rate, 1)
+        self.key = key
+
+    def acquire(self, tokens=1, timeout=None, key=None):
+        """Wait until the rate limit allows a call, and take its tokens.
+
+        :param tokens: The number of tokens of the call.
+        :param timeout: The maximum number of seconds to wait, after which a
+            :class:`RateLimitExceededError` is raised (e.g. to be retried with
+            the retry policy of the job type). Waits as long as needed if
+            ``None``.
+        :param key: The key of the bucket, if the rate limit has none.
+        """
+        key = self.key or key
+        if tokens > self.burst:
+            raise ValueError(f"Can't acquire more than {self.burst} tokens at once.")
+
+        backend = current_jobs.rate_limit_backend
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while wait := backend.consume(key, self.rate, self.burst, tokens):
+            if deadline is not None and time.monotonic() + wait > deadline:
+                raise RateLimitExceededError(key, wait)
+            time.sleep(wait)
@@ -3,21 +3,44 @@
 
 """Registry of jobs."""
 
+from types import MappingProxyType
+
 
 class JobsRegistry:
-    """A simple class to register jobs."""
+    """A simple class to register jobs.
+
+    The registry is frozen once the application is finalized, after which the
+    values derived from the registered jobs (e.g. their schemas) are computed
+    only once.
+    """
 
     def __init__(self):
         """Initialize the registry."""
         self._jobs = {}
+        self._job_ids = {}
+        self._cache = {}
+        self._frozen = False
 
     def register(self, job_instance, job_id=None):
         """Register a new job instance."""
+        if self._frozen:
+            raise RuntimeError("Jobs can't be registered once the registry is frozen.")
         if job_id is None:
             job_id = job_instance.id
         if job_id in self._jobs:
             raise RuntimeError(f"Job with job id '{job_id}' is already registered.")
         self._jobs[job_id] = job_instance
+        self._job_ids.setdefault(job_instance, job_id)
+        self._cache.clear()
+
+    def freeze(self):
+        """Freeze the registry, and precompute the values derived from it."""
+        if self._frozen:
+            return
+        self._frozen = True
+        self._jobs = MappingProxyType(self._jobs)
+        self._cache.clear()
+        self.schemas
 
     def get(self, job_id):
         """Get a job for a given job_id."""
@@ -25,18 +48,35 @@ class JobsRegistry:
 
     def get_job_id(self, instance):
         """Get the service id for a specific instance."""
-        for job_id, job_instance in self._jobs.items():
-            if instance == job_instance:
-                return job_id
-        raise KeyError("Job not found in registry.")
+        try:
+            return self._job_ids[instance]
+        except KeyError:
+            raise KeyError("Job not found in registry.")
 
     def get_all(self):
         """Return a list of available tasks."""
         return self._jobs
 
+    @property
+    def ids(self):
+        """Return the ids of the registered jobs, e.g. as validation choices."""
+        return self._jobs.keys()
+
+    def cached(self, key, factory):
+        """Return a value derived from the registered jobs, computed once.
+
+        Cached values are cleared whenever a job is registered.
+        """
+        if key not in self._cache:
+            self._cache[key] = factory()
+        return self._cache[key]
+
     @property
     def schemas(self):
         """Return all schemas registered for tasks."""
+        return self.cached("schemas", self._build_schemas)
+
+    def _build_schemas(self):
         schemas = {}
         for id_, registered_task in self._jobs.items():
             schema = registered_task.arguments_schema
@@ -5,14 +5,20 @@
 
 """Resources config."""
 
+import pstats
+from datetime import timezone
+
 import marshmallow as ma
-from flask_resources import HTTPJSONException, ResourceConfig, create_error_handler
+from flask_resources import (
+    HTTPJSONException,
+    MultiDictSchema,
+    ResourceConfig,
+    create_error_handler,
+)
 from invenio_records_resources.resources.errors import ErrorHandlersMixin
 from invenio_records_resources.resources.records.args import SearchRequestArgsSchema
 from invenio_records_resources.services.base.config import ConfiguratorMixin
 
-from invenio_jobs.models import RunStatusEnum
-
 from ..services import errors
 
 response_handlers = {
@@ -35,9 +41,18 @@ error_handlers = {
     errors.RunNotFoundError: create_error_handler(
         lambda e: HTTPJSONException(code=404, description=e.description)
     ),
+    errors.RunProfileNotFoundError: create_error_handler(
+        lambda e: HTTPJSONException(code=404, description=e.description)
+    ),
+    errors.InvalidCursorError: create_error_handler(
+        lambda e: HTTPJSONException(code=400, description=e.description)
+    ),
     errors.RunStatusChangeError: create_error_handler(
         lambda e: HTTPJSONException(code=400, description=e.description)
     ),
+    errors.RunNotResumableError: create_error_handler(
+        lambda e: HTTPJSONException(code=400, description=e.description)
+    ),
 }
 
 
@@ -61,7 +76,8 @@ class TasksResourceConfig(ResourceConfig, ConfiguratorMixin):
 class JobsSearchRequestArgsSchema(SearchRequestArgsSchema):
     """Jobs search request parameters."""
 
-    active = ma.fields.Boolean()
+    after = ma.fields.String()
+    total = ma.fields.Boolean()
 
 
 class JobsResourceConfig(ResourceConfig, ConfiguratorMixin):
@@ -89,8 +105,17 @@ class JobsResourceConfig(ResourceConfig, ConfiguratorMixin):
 class RunsSearchRequestArgsSchema(SearchRequestArgsSchema):
     """Runs search request parameters."""
 
-    status = ma.fields.Enum(RunStatusEnum)
     include_subtasks = ma.fields.Boolean()
+    parent_run_id = ma.fields.UUID()
+    created_after = ma.fields.AwareDateTime(default_timezone=timezone.utc)
+    created_before = ma.fields.AwareDateTime(default_timezone=timezone.utc)
+    # Only used by the search of the runs of all jobs
+    job_id = ma.fields.UUID()
+    expand = ma.fields.Boolean()
+    # Comma-separated fields to project the runs on, e.g. ``id,status``
+    fields = ma.fields.String()
+    after = ma.fields.String()
+    total = ma.fields.Boolean()
 
 
 class JobsSearchRequestArgsSchema(SearchRequestArgsSchema):
@@ -99,6 +124,19 @@ class JobsSearchRequestArgsSchema(SearchRequestArgsSchema):
     status = ma.fields.Boolean()
 
 
+class RunProfileRequestArgsSchema(MultiDictSchema):
+    """Run profile request parameters."""
+
+    format = ma.fields.String(
+        validate=ma.validate.OneOf(["pstats", "text"]), load_default="pstats"
+    )
+    sort = ma.fields.String(
+        validate=ma.validate.OneOf([key.value for key in pstats.SortKey]),
+        load_default="cumulative",
+    )
+    limit = ma.fields.Integer(validate=ma.validate.Range(min=1), load_default=50)
+
+
 class RunsResourceConfig(ResourceConfig, ConfiguratorMixin):
     """Runs resource config."""
 
@@ -107,14 +145,20 @@ class RunsResourceConfig(ResourceConfig, ConfiguratorMixin):
     url_prefix = ""
 
     routes = {
+        "search_all": "/runs",
         "list": "/jobs/<job_id>/runs",
+        "timings": "/jobs/<job_id>/runs/timings",
         "item": "/jobs/<job_id>/runs/<run_id>",
+        "tree": "/jobs/<job_id>/runs/<run_id>/tree",
         "logs_list": "/jobs/<job_id>/runs/<run_id>/logs",
+        "profile": "/jobs/<job_id>/runs/<run_id>/profile",
         "actions_stop": "/jobs/<job_id>/runs/<run_id>/actions/stop",
+        "actions_resume": "/jobs/<job_id>/runs/<run_id>/actions/resume",
     }
 
     # Request handling
     request_read_args = {}
+    request_profile_args = RunProfileRequestArgsSchema
     request_view_args = {
         "job_id": ma.fields.UUID(),
         "run_id": ma.fields.UUID(),
@@ -139,11 +183,11 @@ class JobLogResourceConfig(ResourceConfig, ConfiguratorMixin):
     # Blueprint configuration
     blueprint_name = "jobs-logs"
     url_prefix = "/logs/jobs"
-    routes = {"list": ""}
+    routes = {"list": "", "aggregate": "/<run_id>/aggregations"}
 
     # Request handling
     request_read_args = {}
-    request_view_args = {}
+    request_view_args = {"run_id": ma.fields.UUID()}
     request_search_args = JobLogsSearchRequestArgsSchema
     request_body_parsers = request_body_parsers
 
@@ -4,9 +4,20 @@
 
 """Resources definitions."""
 
-from flask import g
-from flask_resources import Resource, resource_requestctx, response_handler, route
+import hashlib
+import io
+
+from flask import current_app, g, request, send_file
+from flask_resources import (
+    Resource,
+    from_conf,
+    request_parser,
+    resource_requestctx,
+    response_handler,
+    route,
+)
 from invenio_administration.marshmallow_utils import jsonify_schema
+from invenio_i18n import get_locale
 from invenio_records_resources.resources.errors import ErrorHandlersMixin
 from invenio_records_resources.resources.records.resource import (
     request_data,
@@ -15,6 +26,14 @@ from invenio_records_resources.resources.records.resource import (
     request_view_args,
 )
 
+from ..profiling import format_profile
+from ..proxies import current_jobs
+from ..utils import is_static_schema
+
+request_profile_args = request_parser(
+    from_conf("request_profile_args"), location="args"
+)
+
 
 class TasksResource(ErrorHandlersMixin, Resource):
     """Tasks resource."""
@@ -50,13 +69,33 @@ class TasksResource(ErrorHandlersMixin, Resource):
 
     @request_view_args
     def read_arguments(self):
-        """Read arguments schema of task resource."""
+        """Read arguments schema of task resource.
+
+        The JSON schema of the arguments is tagged so that clients can
+        revalidate it with ``If-None-Match``. It is only built once per task and
+        locale, unless the schema has callable defaults or lazy choices, which
+        are evaluated on every request (see ``is_static_schema``).
+        """
         identity = g.identity
         registered_task_id = resource_requestctx.view_args["registered_task_id"]
         arguments_schema = self.service.read_registered_task_arguments(
             identity, registered_task_id
         )
-        return jsonify_schema(arguments_schema) if arguments_schema else {}
+
+        def dump():
+            data = jsonify_schema(arguments_schema) if arguments_schema else {}
+            body = current_app.json.dumps(data)
+            return body, hashlib.sha1(body.encode()).hexdigest()
+
+        if arguments_schema and not is_static_schema(arguments_schema):
+            body, etag = dump()
+        else:
+            body, etag = current_jobs.registry.cached(
+                ("arguments_json_schema", registered_task_id, str(get_locale())), dump
+            )
+        response = current_app.response_class(body, mimetype="application/json")
+        response.set_etag(etag)
+        return response.make_conditional(request)
 
 
 class JobsResource(ErrorHandlersMixin, Resource):
@@ -150,12 +189,17 @@ class RunsResource(ErrorHandlersMixin, Resource):
         """Create the URL rules for runs resource."""
         routes = self.config.routes
         url_rules = [
+            route("GET", routes["search_all"], self.search_all),
             route("GET", routes["list"], self.search),
             route("POST", routes["list"], self.create),
+            route("GET", routes["timings"], self.timings),
             route("GET", routes["item"], self.read),
+            route("GET", routes["tree"], self.tree),
             route("DELETE", routes["item"], self.delete),
             route("GET", routes["logs_list"], self.logs),
+            route("GET", routes["profile"], self.profile),
             route("POST", routes["actions_stop"], self.stop),
+            route("POST", routes["actions_resume"], self.resume),
         ]
 
         return url_rules
@@ -173,6 +217,19 @@ class RunsResource(ErrorHandlersMixin, Resource):
             identity=identity,
             job_id=resource_requestctx.view_args["job_id"],
             params=resource_requestctx.args,
+            expand=resource_requestctx.args.get("expand", False),
+        )
+        return hits.to_dict(), 200
+
+    @request_search_args
+    @response_handler(many=True)
+    def search_all(self):
+        """Search the runs of all jobs."""
+        identity = g.identity
+        hits = self.service.search_all(
+            identity=identity,
+            params=resource_requestctx.args,
+            expand=resource_requestctx.args.get("expand", False),
         )
         return hits.to_dict(), 200
 
@@ -199,6 +256,27 @@ class RunsResource(ErrorHandlersMixin, Resource):
         )
         return item.to_dict(), 200
 
+    @request_view_args
+    @response_handler()
+    def tree(self):
+        """Read a run with the tree of its subtasks."""
+        result = self.service.read_tree(
+            g.identity,
+            job_id=resource_requestctx.view_args["job_id"],
+            run_id=resource_requestctx.view_args["run_id"],
+        )
+        return result.to_dict(), 200
+
+    @request_view_args
+    @response_handler()
+    def timings(self):
+        """Aggregate the timings of the runs of a job."""
+        result = self.service.aggregate_timings(
+            g.identity,
+            job_id=resource_requestctx.view_args["job_id"],
+        )
+        return result.to_dict(), 200
+
     @request_view_args
     @response_handler()
     def logs(self):
@@ -212,6 +290,29 @@ class RunsResource(ErrorHandlersMixin, Resource):
         )
         return hits.to_dict(), 200
 
+    @request_profile_args
+    @request_view_args
+    def profile(self):
+        """Download the profiling statistics of a run."""
+        run_id = resource_requestctx.view_args["run_id"]
+        run_profile = self.service.read_profile(
+            g.identity,
+            job_id=resource_requestctx.view_args["job_id"],
+            run_id=run_id,
+        )
+        args = resource_requestctx.args
+        if args["format"] == "text":
+            text = format_profile(
+                run_profile.data, sort=args["sort"], limit=args["limit"]
+            )
+            return text, 200, {"Content-Type": "text/plain; charset=utf-8"}
+        return send_file(
+            io.BytesIO(run_profile.data),
+            mimetype="application/octet-stream",
+            as_attachment=True,
+            download_name=f"run-{run_id}.pstats",
+        )
+
     @request_view_args
     @response_handler()
     def stop(self):
@@ -224,6 +325,17 @@ class RunsResource(ErrorHandlersMixin, Resource):
         )
         return hits.to_dict(), 202
 
+    @request_view_args
+    @response_handler()
+    def resume(self):
+        """Resume an item, in a new item."""
+        item = self.service.resume(
+            identity=g.identity,
+            job_id=resource_requestctx.view_args["job_id"],
+            run_id=resource_requestctx.view_args["run_id"],
+        )
+        return item.to_dict(), 202
+
     @request_headers
     @request_data
     @request_view_args
@@ -264,6 +376,7 @@ class JobLogResource(ErrorHandlersMixin, Resource):
         routes = self.config.routes
         url_rules = [
             route("GET", routes["list"], self.search),
+            route("GET", routes["aggregate"], self.aggregate),
         ]
 
         return url_rules
@@ -281,3 +394,13 @@ class JobLogResource(ErrorHandlersMixin, Resource):
         )
 
         return hits.to_dict(), 200
+
+    @request_view_args
+    @response_handler()
+    def aggregate(self):
+        """Aggregate the logs of a run."""
+        result = self.service.aggregate(
+            g.identity,
+            resource_requestctx.view_args["run_id"],
+        )
+        return result.to_dict(), 200
@@ -0,0 +1,65 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Retry policies of the runs.
+
+A job type declares a :class:`RetryPolicy` as its ``retry_policy``, e.g.:
+
+.. code-block:: python
+
+    class HarvestJob(JobType):
+
+        retry_policy = RetryPolicy(
+            max_attempts=5,
+            retry_on=(OperationalError, ConnectionError),
+        )
+
+Runs (and the subtasks of chunked jobs) failing with one of the retryable
+exceptions are then queued again after an exponential backoff, until they
+reach the maximum number of attempts. The attempts of a run are counted on its
+``attempts`` column.
+"""
+
+import random
+
+
+class RetryPolicy:
+    """Policy of the retries of a failed run."""
+
+    def __init__(
+        self,
+        max_attempts=3,
+        backoff=10,
+        max_backoff=3600,
+        jitter=True,
+        retry_on=(Exception,),
+    ):
+        """Constructor.
+
+        :param max_attempts: The maximum number of attempts, including the first.
+        :param backoff: Seconds to wait before the second attempt, doubled
+            before each following attempt.
+        :param max_backoff: The maximum number of seconds to wait.
+        :param jitter: Whether to randomize the delays (between half and all of
+            the backoff), so that runs failing together are not retried together.
+        :param retry_on: The exception classes which are retried.
+        """
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_on = tuple(retry_on)
+
+    def should_retry(self, exc, attempts):
+        """Return whether to retry after an attempt failed with an exception.
+
+        :param attempts: The number of attempts made so far.
+        """
+        return attempts < self.max_attempts and isinstance(exc, self.retry_on)
+
+    def countdown(self, attempts):
+        """Return the seconds to wait before the next attempt."""
+        delay = min(self.max_backoff, self.backoff * 2 ** max(attempts - 1, 0))
+        if self.jitter:
+            delay = random.uniform(delay / 2, delay)
+        return delay
@@ -6,6 +6,7 @@
 
 from functools import partial
 
+from invenio_db import db
 from invenio_i18n import gettext as _
 from invenio_records_resources.records.systemfields import IndexField
 from invenio_records_resources.services import EndpointLink, pagination_endpoint_links
@@ -17,8 +18,14 @@ from invenio_records_resources.services.records.config import (
 from sqlalchemy import asc, desc
 
 from ..models import Job, Run, Task
-from . import results
-from .links import JobEndpointLink, RunEndpointLink, vars_func_set_querystring
+from ..proxies import current_jobs
+from . import facets, results
+from .links import (
+    JobEndpointLink,
+    RunEndpointLink,
+    keyset_pagination_endpoint_links,
+    vars_func_set_querystring,
+)
 from .permissions import (
     JobLogsPermissionPolicy,
     JobPermissionPolicy,
@@ -26,6 +33,15 @@ from .permissions import (
     TasksPermissionPolicy,
 )
 from .schema import JobLogEntrySchema, JobSchema, RunSchema, TaskSchema
+from .sorting import jobs_sort_planner, runs_sort_planner
+
+
+def is_resumable(run):
+    """Return whether a run (or its dump) can be resumed in a new run."""
+    if run.status not in Run.resumable_statuses or run.was_resumed:
+        return False
+    job = db.session.get(Job, run.job_id)
+    return current_jobs.registry.get(job.task).resumable
 
 
 class TasksSearchOptions(SearchOptionsBase):
@@ -78,7 +94,22 @@ class JobSearchOptions(SearchOptionsBase):
         "asc": dict(title=_("Ascending"), fn=asc),
         "desc": dict(title=_("Descending"), fn=desc),
     }
-    sort_options = {"title": dict(title=_("Title"), fields=["title"])}
+    sort_options = {
+        "title": dict(title=_("Title"), fields=["title"]),
+        # Sort options of the administration jobs list (``JOBS_SORT_OPTIONS``)
+        "jobs": dict(title=_("Jobs"), fields=["title"]),
+        "last_run_start_time": dict(
+            title=_("Last run"), fields=["last_run_start_time"]
+        ),
+        "user": dict(title=_("Started by"), fields=["user"]),
+        "next_run": dict(title=_("Next run"), fields=["next_run"]),
+    }
+    sort_planner = jobs_sort_planner
+    facets = {
+        "active": facets.job_active,
+        "queue": facets.job_queue,
+        "task": facets.job_task,
+    }
 
     pagination_options = {"default_results_per_page": 25}
 
@@ -112,6 +143,7 @@ class JobsServiceConfig(ServiceConfig, ConfiguratorMixin):
     }
 
     links_search = pagination_endpoint_links("jobs.search")
+    links_search_keyset = keyset_pagination_endpoint_links("jobs.search")
 
 
 class RunSearchOptions(SearchOptionsBase):
@@ -124,6 +156,13 @@ class RunSearchOptions(SearchOptionsBase):
         "desc": dict(title=_("Descending"), fn=desc),
     }
     sort_options = {"created": dict(title=_("Created"), fields=["created"])}
+    sort_planner = runs_sort_planner
+    facets = {
+        "status": facets.run_status,
+        "queue": facets.run_queue,
+        "started_by": facets.run_started_by,
+        "created": facets.run_created,
+    }
 
     pagination_options = {"default_results_per_page": 25}
 
@@ -143,17 +182,29 @@ class RunsServiceConfig(ServiceConfig, ConfiguratorMixin):
     )
 
     result_item_cls = results.Item
-    result_list_cls = results.List
+    result_list_cls = results.RunList
+    result_timings_cls = results.RunTimingsAggregation
+    result_tree_cls = results.RunTree
 
     links_item = {
         "self": RunEndpointLink("job_runs.read"),
         "stop": RunEndpointLink("job_runs.stop"),
+        "resume": RunEndpointLink(
+            "job_runs.resume",
+            when=lambda run, ctx: is_resumable(run),
+        ),
+        "tree": RunEndpointLink("job_runs.tree"),
         "logs": EndpointLink(
             "jobs-logs.search",
             vars=vars_func_set_querystring(lambda obj, vars: {"q": obj.id}),
         ),
     }
     links_search = pagination_endpoint_links("job_runs.search", params=["job_id"])
+    links_search_keyset = keyset_pagination_endpoint_links(
+        "job_runs.search", params=["job_id"]
+    )
+    links_search_all = pagination_endpoint_links("job_runs.search_all")
+    links_search_all_keyset = keyset_pagination_endpoint_links("job_runs.search_all")
 
 
 class JobLogSearchOptions(SearchOptionsBase):
@@ -191,4 +242,5 @@ class JobLogServiceConfig(ServiceConfig, ConfiguratorMixin):
     links_item = None
     result_item_cls = results.Item
     result_list_cls = results.AppLogsList
+    result_aggregation_cls = results.AppLogsAggregation
     record_cls = JobLog
@@ -40,6 +40,26 @@ class RunNotFoundError(JobsError):
         super().__init__(description=description)
 
 
+class RunProfileNotFoundError(JobsError):
+    """Run profile not found error."""
+
+    def __init__(self, id):
+        """Initialise error."""
+        super().__init__(
+            description=_("Run with ID %(id)s has no profiling statistics.", id=id)
+        )
+
+
+class InvalidCursorError(JobsError):
+    """Invalid pagination cursor error."""
+
+    def __init__(self, cursor):
+        """Initialise error."""
+        super().__init__(
+            description=_("Invalid pagination cursor %(cursor)s.", cursor=cursor)
+        )
+
+
 class RunStatusChangeError(JobsError):
     """Run status change error."""
 
@@ -70,3 +90,24 @@ class RunTooManyResults(JobsError):
                 max_docs=max_docs,
             )
         )
+
+
+class RunNotResumableError(JobsError):
+    """Run not resumable error."""
+
+    def __init__(self, run, resumed_by_id=None):
+        """Initialise error."""
+        self.run = run
+        if resumed_by_id:
+            description = _(
+                "Run with ID %(id)s was already resumed by run %(resumed_by_id)s.",
+                id=run.id,
+                resumed_by_id=resumed_by_id,
+            )
+        else:
+            description = _(
+                "Run with ID %(id)s can't be resumed from status %(status)s.",
+                id=run.id,
+                status=run.status.name,
+            )
+        super().__init__(description=description)
@@ -0,0 +1,264 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Facets of DB-backed searches.
+
+Facets are aggregated with ``GROUP BY`` in a single query, and their selected
+values are applied as filters on the searched model, following the
+conventions of the search engine facets (e.g. ``value_labels``).
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import sqlalchemy as sa
+from invenio_accounts.models import User
+from invenio_db import db
+from invenio_i18n import lazy_gettext as _
+from marshmallow import ValidationError, fields
+
+from ..models import Job, Run, RunStatusEnum, Task
+from ..proxies import current_jobs
+
+
+class TermsFacet:
+    """Facet over the distinct values of a column."""
+
+    def __init__(self, field, label, value_labels=None):
+        """Constructor.
+
+        :param field: The model attribute of the column.
+        :param label: The label of the facet.
+        :param value_labels: A dict of labels by value, or a function mapping a
+            list of values to such a dict.
+        """
+        self.field = field
+        self._label = label
+        self._value_labels = value_labels
+
+    def parse(self, value):
+        """Parse a selected value into a value of the column."""
+        return value
+
+    def key(self, value):
+        """Return the key of a bucket from the value of the column as text."""
+        return value
+
+    def filter(self, values):
+        """Return the filter matching any of the selected values."""
+        try:
+            return self.field.in_([self.parse(value) for value in values])
+        except (KeyError, ValueError):
+            raise ValidationError(
+                {self.field.key: [f"Invalid value among {', '.join(values)}."]}
+            )
+
+    def aggregations(self, name, column):
+        """Return the selects counting the rows per bucket."""
+        return [
+            sa.select(
+                sa.literal(name).label("facet"),
+                sa.cast(column, sa.String).label("key"),
+                sa.func.count().label("count"),
+            )
+            .where(column.isnot(None))
+            .group_by(column)
+        ]
+
+    def get_labelled_values(self, counts, selected):
+        """Return the buckets of the facet, in the search engine format."""
+        buckets = {self.key(value): count for value, count in counts.items()}
+        labels = self._value_labels or {}
+        if callable(labels):
+            labels = labels(list(buckets))
+        return {
+            "buckets": [
+                {
+                    "key": key,
+                    "doc_count": count,
+                    "label": str(labels.get(key, key)),
+                    "is_selected": key in selected,
+                }
+                for key, count in sorted(buckets.items(), key=lambda b: (-b[1], b[0]))
+            ],
+            "label": str(self._label),
+        }
+
+
+class EnumFacet(TermsFacet):
+    """Facet over the values of an enumeration column, keyed by name."""
+
+    def __init__(self, field, label, enum, value_labels=None):
+        """Constructor."""
+        self.enum = enum
+        super().__init__(field, label, value_labels=value_labels)
+
+    def parse(self, value):
+        """Parse the name of a member."""
+        return self.enum[value]
+
+    def key(self, value):
+        """Return the name of the member of a stored value."""
+        return self.enum(value).name
+
+
+class BooleanFacet(TermsFacet):
+    """Facet over a boolean column, keyed by ``true`` and ``false``."""
+
+    def parse(self, value):
+        """Parse a boolean (e.g. ``true`` or ``0``)."""
+        try:
+            return fields.Boolean().deserialize(value)
+        except ValidationError:
+            raise ValueError(value)
+
+    def key(self, value):
+        """Return the key of a boolean stored as text (e.g. ``1`` or ``true``)."""
+        return "true" if value.lower() in ("1", "t", "true") else "false"
+
+
+class UserFacet(TermsFacet):
+    """Facet over a column of user ids, labelled by email."""
+
+    def __init__(self, field, label):
+        """Constructor."""
+        super().__init__(field, label, value_labels=self.users_labels)
+
+    def parse(self, value):
+        """Parse a user id."""
+        return int(value)
+
+    @staticmethod
+    def users_labels(keys):
+        """Label users by email."""
+        users = User.query.filter(User.id.in_([int(key) for key in keys]))
+        return {str(user.id): user.email for user in users}
+
+
+class DateRangeFacet(TermsFacet):
+    """Facet over the time elapsed since a date, by ranges ending now."""
+
+    def __init__(self, field, label, ranges):
+        """Constructor.
+
+        :param ranges: A dict of ``(label, timedelta)`` by key.
+        """
+        self.ranges = ranges
+        value_labels = {key: label for key, (label, _) in ranges.items()}
+        super().__init__(field, label, value_labels=value_labels)
+
+    def parse(self, value):
+        """Parse the key of a range into its start."""
+        return datetime.now(timezone.utc) - self.ranges[value][1]
+
+    def filter(self, values):
+        """Return the filter matching the widest of the selected ranges."""
+        try:
+            return self.field >= min(self.parse(value) for value in values)
+        except KeyError:
+            raise ValidationError(
+                {self.field.key: [f"Invalid value among {', '.join(values)}."]}
+            )
+
+    def aggregations(self, name, column):
+        """Return a select counting the rows of each range."""
+        return [
+            sa.select(
+                sa.literal(name).label("facet"),
+                sa.literal(key).label("key"),
+                sa.func.count().label("count"),
+            ).where(column >= self.parse(key))
+            for key in self.ranges
+        ]
+
+    def get_labelled_values(self, counts, selected):
+        """Return the buckets of the facet, in the order of the ranges."""
+        values = super().get_labelled_values(counts, selected)
+        order = list(self.ranges)
+        values["buckets"].sort(key=lambda bucket: order.index(bucket["key"]))
+        return values
+
+
+def aggregate(facets, query, selected=None):
+    """Aggregate the facets over the rows matched by a query, in one query."""
+    selected = selected or {}
+    columns = {facet.field.key: facet.field for facet in facets.values()}
+    matched = query.with_entities(*columns.values()).subquery()
+    selects = [
+        select
+        for name, facet in facets.items()
+        for select in facet.aggregations(name, matched.c[facet.field.key])
+    ]
+
+    counts = {name: {} for name in facets}
+    for name, key, count in db.session.execute(sa.union_all(*selects)):
+        if count:
+            counts[name][key] = count
+    return {
+        name: facet.get_labelled_values(counts[name], selected.get(name, []))
+        for name, facet in facets.items()
+    }
+
+
+def filters(facets, selected):
+    """Return the filters of the selected values of the facets."""
+    return [
+        facets[name].filter(values)
+        for name, values in (selected or {}).items()
+        if name in facets and values
+    ]
+
+
+def _queues_labels(keys):
+    """Label queues by title."""
+    return {
+        key: queue["title"] for key, queue in current_jobs.queues.items() if key in keys
+    }
+
+
+def _tasks_labels(keys):
+    """Label tasks by title."""
+    tasks = Task.all()
+    return {key: tasks[key].title for key in keys if key in tasks}
+
+
+run_status = EnumFacet(
+    field=Run.status,
+    label=_("Status"),
+    enum=RunStatusEnum,
+    value_labels={
+        RunStatusEnum.QUEUED.name: _("Queued"),
+        RunStatusEnum.RUNNING.name: _("Running"),
+        RunStatusEnum.SUCCESS.name: _("Success"),
+        RunStatusEnum.FAILED.name: _("Failed"),
+        RunStatusEnum.WARNING.name: _("Warning"),
+        RunStatusEnum.CANCELLING.name: _("Cancelling"),
+        RunStatusEnum.CANCELLED.name: _("Cancelled"),
+        RunStatusEnum.PARTIAL_SUCCESS.name: _("Partial success"),
+    },
+)
+
+run_queue = TermsFacet(field=Run.queue, label=_("Queue"), value_labels=_queues_labels)
+
+run_started_by = UserFacet(field=Run.started_by_id, label=_("Started by"))
+
+run_created = DateRangeFacet(
+    field=Run.created,
+    label=_("Created"),
+    ranges={
+        "day": (_("Last 24 hours"), timedelta(days=1)),
+        "week": (_("Last 7 days"), timedelta(days=7)),
+        "month": (_("Last 30 days"), timedelta(days=30)),
+    },
+)
+
+job_active = BooleanFacet(
+    field=Job.active,
+    label=_("Status"),
+    value_labels={"true": _("Active"), "false": _("Inactive")},
+)
+
+job_queue = TermsFacet(
+    field=Job.default_queue, label=_("Queue"), value_labels=_queues_labels
+)
+
+job_task = TermsFacet(field=Job.task, label=_("Task"), value_labels=_tasks_labels)
@@ -63,3 +63,18 @@ def vars_func_set_querystring(func_qs=lambda obj, vars: {}):
         vars["args"].update(func_qs(obj, vars))
 
     return _inner
+
+
+def keyset_pagination_endpoint_links(endpoint, params=None):
+    """Create pagination links (self/next) following the ``after`` cursor."""
+    return {
+        "self": EndpointLink(endpoint, params=params),
+        "next": EndpointLink(
+            endpoint,
+            when=lambda pagination, ctx: pagination.has_next,
+            vars=lambda pagination, vars: vars["args"].update(
+                {"after": pagination.next_cursor}
+            ),
+            params=params,
+        ),
+    }
@@ -0,0 +1,118 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Keyset pagination of DB-backed searches."""
+
+import base64
+import json
+import uuid
+from datetime import datetime
+
+import sqlalchemy as sa
+
+from .errors import InvalidCursorError
+from .sorting import nulls_last
+
+
+def encode_cursor(value, id_):
+    """Encode the sort key of a row as an opaque cursor."""
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    key = json.dumps([value, str(id_)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(key.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor, python_type=datetime):
+    """Decode a cursor into the sort key of a row."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        value, id_ = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if value is not None and python_type is datetime:
+            value = datetime.fromisoformat(value)
+        elif value is not None and not isinstance(value, python_type):
+            raise TypeError(value)
+        return value, uuid.UUID(id_)
+    except (TypeError, ValueError):
+        raise InvalidCursorError(cursor)
+
+
+class KeysetPagination:
+    """Page of a query ordered by a sort key and the id, resumed after a cursor.
+
+    Unlike offset pagination, the cost of fetching a page doesn't depend on how
+    deep it is, and rows inserted while paging don't shift the following pages.
+    Counting the total number of matches is optional, since it requires a full
+    scan of the matching rows.
+
+    The sort key is a :class:`~invenio_jobs.services.sorting.SortKey`, and
+    defaults to the creation time. ``NULL`` values of nullable keys come last.
+    """
+
+    page = 1
+
+    def __init__(
+        self,
+        query,
+        model,
+        size,
+        after=None,
+        descending=True,
+        count=False,
+        key=None,
+    ):
+        """Fetch the page of ``query`` following the ``after`` cursor."""
+        self.size = size
+        self.after = after
+        self.total = query.order_by(None).count() if count else None
+
+        expression = model.created if key is None else key.expression
+        nullable = key is not None and key.nullable
+        order = sa.desc if descending else sa.asc
+        if after:
+            query = query.filter(
+                self._after(expression, nullable, model.id, after, descending)
+            )
+
+        sort_value = expression.label("sort_value")
+        rows = (
+            query.add_columns(sort_value)
+            .order_by(*nulls_last(sort_value, order, nullable), order(model.id))
+            .limit(size + 1)
+            .all()
+        )
+        self.items = [row[0] for row in rows[:size]]
+        self.has_next = len(rows) > size
+        self._last = rows[size - 1] if self.has_next else None
+
+    @staticmethod
+    def _after(expression, nullable, id_column, cursor, descending):
+        """Filter the rows following the cursor."""
+        # Type decorators (e.g. ``UTCDateTime``) don't define their Python type
+        type_ = getattr(expression.type, "impl_instance", expression.type)
+        try:
+            python_type = type_.python_type
+        except NotImplementedError:
+            python_type = object
+        value, id_ = decode_cursor(cursor, python_type)
+        id_ = sa.literal(id_, id_column.type)
+        if value is None:
+            # Only rows without a value are left, which are ordered by id
+            id_after = id_column < id_ if descending else id_column > id_
+            return sa.and_(expression.is_(None), id_after)
+
+        key = sa.tuple_(expression, id_column)
+        bound = sa.tuple_(sa.literal(value, expression.type), id_)
+        after = key < bound if descending else key > bound
+        return sa.or_(after, expression.is_(None)) if nullable else after
+
+    @property
+    def next_cursor(self):
+        """Cursor of the next page, if any."""
+        if self._last is not None:
+            row, value = self._last
+            return encode_cursor(value, row.id)
+
+    @property
+    def has_prev(self):
+        """Keyset pages can only be followed forward."""
+        return False
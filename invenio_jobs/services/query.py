@@ -0,0 +1,62 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Query string matching of DB-backed searches."""
+
+import string
+import uuid
+
+import sqlalchemy as sa
+
+from ..models import Job, Run
+
+
+def parse_uuid(query):
+    """Return the UUID of a UUID-shaped query, if it is one."""
+    try:
+        return uuid.UUID(query.strip())
+    except ValueError:
+        return None
+
+
+def uuid_prefix_range(query):
+    """Return the lowest and highest UUIDs starting with a hexadecimal prefix.
+
+    Matching a prefix as a range of UUIDs, rather than as a pattern on their
+    textual representation, can be served by the index of the column.
+    """
+    prefix = query.strip().replace("-", "").lower()
+    if not 0 < len(prefix) <= 32 or not set(prefix) <= set(string.hexdigits):
+        return None
+    return uuid.UUID(prefix.ljust(32, "0")), uuid.UUID(prefix.ljust(32, "f"))
+
+
+def text_match(column, query):
+    """Match a substring of a text column, case-insensitively.
+
+    On PostgreSQL, the match is served by the trigram index of the column.
+    """
+    return column.icontains(query, autoescape=True)
+
+
+def jobs_query_filter(query):
+    """Filter matching the jobs, by id or by title and description."""
+    id_ = parse_uuid(query)
+    if id_:
+        return Job.id == id_
+    return sa.or_(text_match(Job.title, query), text_match(Job.description, query))
+
+
+def runs_query_filter(query):
+    """Filter matching the runs, by id or task id (or a prefix of them), or title."""
+    id_ = parse_uuid(query)
+    if id_:
+        return sa.or_(Run.id == id_, Run.task_id == id_)
+
+    clauses = [text_match(Run.title, query)]
+    prefix_range = uuid_prefix_range(query)
+    if prefix_range:
+        clauses.extend(
+            [Run.id.between(*prefix_range), Run.task_id.between(*prefix_range)]
+        )
+    return sa.or_(*clauses)
@@ -5,7 +5,6 @@
 
 """Service results."""
 
-import json
 from collections.abc import Iterable, Sized
 
 from invenio_i18n import gettext as _
@@ -14,9 +13,10 @@ from invenio_records_resources.services.records.results import (
     RecordList,
 )
 
-from invenio_jobs.utils import job_arg_json_dumper
-
 from ..api import AttrDict
+from ..models import Run
+from .pagination import KeysetPagination
+from .schema import JobArgumentsSchema
 
 try:
     # flask_sqlalchemy<3.0.0
@@ -48,9 +48,7 @@ class JobItem(Item):
         if self._obj.last_run:
             job_dict["last_run"] = self._obj.last_run.dump()
             job_dict["last_runs"] = self._obj.last_runs
-        job_dict["default_args"] = json.dumps(
-            self._obj.default_args, default=job_arg_json_dumper
-        )
+        job_dict["default_args"] = self._obj.default_args_json
         job_record = AttrDict(job_dict)
 
         self._data = self._schema.dump(
@@ -72,7 +70,7 @@ class List(RecordList):
     @property
     def items(self):
         """Iterator over the items."""
-        if isinstance(self._results, Pagination):
+        if isinstance(self._results, (Pagination, KeysetPagination)):
             return self._results.items
         elif isinstance(self._results, Iterable):
             return self._results
@@ -83,17 +81,27 @@ class List(RecordList):
         """Get total number of hits."""
         if hasattr(self._results, "hits"):
             return self._results.hits.total["value"]
-        if isinstance(self._results, Pagination):
+        if isinstance(self._results, (Pagination, KeysetPagination)):
             return self._results.total
         elif isinstance(self._results, Sized):
             return len(self._results)
         else:
             return None
 
+    @property
+    def pagination(self):
+        """Create a pagination object."""
+        if isinstance(self._results, KeysetPagination):
+            return self._results
+        return super().pagination
+
     # TODO: See if we need to override this
     @property
     def aggregations(self):
         """Get the search result aggregations."""
+        if isinstance(self._results, (Pagination, KeysetPagination)):
+            # Aggregated in SQL by the service
+            return getattr(self._results, "aggregations", None)
         try:
             return self._results.labelled_facets.to_dict()
         except AttributeError:
@@ -118,6 +126,77 @@ class List(RecordList):
 
             yield projection
 
+    def to_dict(self):
+        """Return result as a dictionary."""
+        res = super().to_dict()
+        if isinstance(self._results, KeysetPagination):
+            # Keyset pages are not numbered, but resumed from a cursor
+            res.pop("page", None)
+            res["hits"]["after"] = self._results.next_cursor
+        return res
+
+
+class RunList(List):
+    """Runs list result."""
+
+    def __init__(self, *args, expand=False, fields=None, **kwargs):
+        """Constructor.
+
+        :param expand: Whether to resolve the users who started the runs.
+        :param fields: The fields to project the runs on, instead of all fields.
+        """
+        super().__init__(*args, **kwargs)
+        self._expand_started_by = expand
+        self._fields = fields
+        self._started_by = {}
+
+    def started_by(self, run):
+        """Return the aggregate of the user who started a run, once per user."""
+        if run.started_by_id not in self._started_by:
+            self._started_by[run.started_by_id] = run.started_by
+        return self._started_by[run.started_by_id]
+
+    def _run_dict(self, hit):
+        """Return the values of the projected fields of a run."""
+        if self._fields is None:
+            return hit.dump()
+        # Arguments are only loaded through their schema if requested
+        run_dict = {
+            field: getattr(hit, field, None)
+            for field in self._fields - {"args", "started_by"}
+        }
+        if "args" in self._fields:
+            run_dict["args"] = JobArgumentsSchema().load({"args": hit.args})
+        return run_dict
+
+    @property
+    def hits(self):
+        """Iterator over the hits."""
+        for hit in self.items:
+            # Project the hit
+            run_dict = self._run_dict(hit)
+            if self._expand_started_by:
+                run_dict["started_by"] = self.started_by(hit)
+            run_record = AttrDict(run_dict)
+            projection = self._schema.dump(
+                run_record,
+                context=dict(identity=self._identity, record=hit),
+            )
+            if self._fields is not None:
+                # Leave out the default values of the other fields
+                projection = {
+                    key: value
+                    for key, value in projection.items()
+                    if key in self._fields
+                }
+            if self._links_item_tpl:
+                projection["links"] = self._links_item_tpl.expand(self._identity, hit)
+            if self._nested_links_item:
+                for link in self._nested_links_item:
+                    link.expand(self._identity, hit, projection)
+
+            yield projection
+
 
 class JobList(List):
     """List result."""
@@ -130,9 +209,7 @@ class JobList(List):
             job_dict = hit.dump()
             job_dict["last_run"] = hit.last_run
             job_dict["last_runs"] = hit.last_runs
-            job_dict["default_args"] = json.dumps(
-                hit.default_args, default=job_arg_json_dumper
-            )
+            job_dict["default_args"] = hit.default_args_json
             job_record = AttrDict(job_dict)
             projection = self._schema.dump(
                 job_record,
@@ -191,3 +268,168 @@ class AppLogsList(List):
                     }
                 ]
         return res
+
+
+class AppLogsAggregation:
+    """Aggregated summary of the logs of a run."""
+
+    def __init__(self, service, identity, results, run_id=None):
+        """Constructor."""
+        self._service = service
+        self._identity = identity
+        self._results = results
+        self._run_id = run_id
+
+    @staticmethod
+    def _levels(agg):
+        """Return a mapping of log level to number of log lines."""
+        return {b["key"]: b["doc_count"] for b in agg.get("buckets", [])}
+
+    @staticmethod
+    def _timestamp(agg):
+        """Return the formatted value of a min/max timestamp aggregation."""
+        return agg.get("value_as_string") if agg.get("value") is not None else None
+
+    @property
+    def total(self):
+        """Get total number of log lines of the run."""
+        return self._results.hits.total["value"]
+
+    @property
+    def tasks(self):
+        """Task hierarchy built from the ``task_id``/``parent_task_id`` context."""
+        aggs = self._results.aggregations.to_dict()
+        nodes = {}
+        for bucket in aggs["tasks"]["buckets"]:
+            parents = bucket["parent"]["buckets"]
+            nodes[bucket["key"]] = {
+                "task_id": bucket["key"],
+                "parent_task_id": parents[0]["key"] if parents else None,
+                "count": bucket["doc_count"],
+                "first": self._timestamp(bucket["first"]),
+                "last": self._timestamp(bucket["last"]),
+                "levels": self._levels(bucket["levels"]),
+                "children": [],
+            }
+
+        roots = []
+        for node in nodes.values():
+            parent = nodes.get(node["parent_task_id"])
+            if parent is not None:
+                parent["children"].append(node)
+            else:
+                roots.append(node)
+
+        for node in nodes.values():
+            node["children"].sort(key=lambda n: n["first"] or "")
+        return sorted(roots, key=lambda n: n["first"] or "")
+
+    def to_dict(self):
+        """Return result as a dictionary."""
+        aggs = self._results.aggregations.to_dict()
+        histogram = aggs["histogram"]
+        return {
+            "run_id": str(self._run_id) if self._run_id else None,
+            "total": self.total,
+            "first": self._timestamp(aggs["first"]),
+            "last": self._timestamp(aggs["last"]),
+            "levels": self._levels(aggs["levels"]),
+            "tasks": self.tasks,
+            "histogram": {
+                "interval": histogram.get("interval"),
+                "buckets": [
+                    {"timestamp": b["key_as_string"], "count": b["doc_count"]}
+                    for b in histogram["buckets"]
+                ],
+            },
+        }
+
+
+class RunTimingsAggregation:
+    """Per-phase timings aggregated over the latest runs of a job."""
+
+    def __init__(self, service, identity, runs, job_id=None):
+        """Constructor."""
+        self._service = service
+        self._identity = identity
+        self._runs = runs
+        self._job_id = job_id
+
+    @property
+    def spans(self):
+        """Statistics of each span, over the runs which recorded it."""
+        durations = {}
+        for run in self._runs:
+            for name, duration in (run.timings or {}).items():
+                durations.setdefault(name, []).append(duration)
+
+        spans = {}
+        for name, values in sorted(durations.items()):
+            values.sort()
+            spans[name] = {
+                "count": len(values),
+                "mean": sum(values) / len(values),
+                "median": values[len(values) // 2],
+                "min": values[0],
+                "max": values[-1],
+            }
+        return spans
+
+    def to_dict(self):
+        """Return result as a dictionary."""
+        return {
+            "job_id": str(self._job_id) if self._job_id else None,
+            "runs": len(self._runs),
+            "spans": self.spans,
+        }
+
+
+class RunTree:
+    """A run with the tree of its subtasks, and the counters of each subtree."""
+
+    def __init__(self, service, identity, rows):
+        """Constructor.
+
+        :param rows: The runs of the tree, parents first (see ``get_run_tree``).
+        """
+        self._service = service
+        self._identity = identity
+        self._rows = rows
+
+    @staticmethod
+    def _isoformat(value):
+        return value.isoformat() if value else None
+
+    @property
+    def root(self):
+        """The root run of the tree, with its nested subtasks."""
+        nodes = {}
+        for row in self._rows:
+            counters = {counter: getattr(row, counter) for counter in Run.counters}
+            nodes[row.id] = {
+                "id": str(row.id),
+                "parent_run_id": str(row.parent_run_id) if row.parent_run_id else None,
+                "job_id": str(row.job_id),
+                "title": row.title,
+                "status": row.status.name,
+                "task_id": str(row.task_id) if row.task_id else None,
+                "created": self._isoformat(row.created),
+                "started_at": self._isoformat(row.started_at),
+                "finished_at": self._isoformat(row.finished_at),
+                "depth": row.depth,
+                **counters,
+                "totals": dict(counters),
+                "children": [],
+            }
+
+        # Children come after their parent, so totals are summed bottom-up
+        for row in reversed(self._rows[1:]):
+            node, parent = nodes[row.id], nodes[row.parent_run_id]
+            parent["children"].insert(0, node)
+            for counter, value in node["totals"].items():
+                parent["totals"][counter] += value
+        return nodes[self._rows[0].id]
+
+    def to_dict(self):
+        """Return result as a dictionary."""
+        return self.root
@@ -4,17 +4,24 @@
 
 """Custom Celery RunScheduler."""
 
-import json
 import traceback
 import uuid
+from datetime import datetime, timezone
 
 from celery.beat import ScheduleEntry, Scheduler, logger
+from celery.schedules import schedstate
 from invenio_access.permissions import system_user_id
 from invenio_db import db
 
+from invenio_jobs import metrics
 from invenio_jobs.models import Job, Run
-from invenio_jobs.tasks import execute_run
-from invenio_jobs.utils import job_arg_json_dumper
+from invenio_jobs.tasks import (
+    emit_run_event,
+    execute_run,
+    schedule_run_events_dispatch,
+)
+from invenio_jobs.timings import collect_run_timings, run_span
+from invenio_jobs.utils import normalize_job_args
 
 
 class JobEntry(ScheduleEntry):
@@ -22,16 +29,28 @@ class JobEntry(ScheduleEntry):
 
     job = None
 
-    def __init__(self, job, *args, **kwargs):
+    def __init__(self, job, *args, next_run_at=None, **kwargs):
         """Initialise entry."""
         self.job = job
+        self.next_run_at = next_run_at
         super().__init__(*args, **kwargs)
 
+    def is_due(self):
+        """Return whether the entry is due, from the job's next run time if known."""
+        if self.next_run_at is None:
+            return super().is_due()
+        remaining = (self.next_run_at - datetime.now(timezone.utc)).total_seconds()
+        if remaining > 0:
+            return schedstate(is_due=False, next=remaining)
+        return schedstate(is_due=True, next=super().is_due().next)
+
     @classmethod
     def from_job(cls, job):
         """Create JobEntry from job."""
-        args = json.dumps(job.run_args or job.default_args, default=job_arg_json_dumper)
-        args = json.loads(args)
+        if job.run_args:
+            args = normalize_job_args(job.run_args)
+        else:
+            args = job.normalized_default_args
         return cls(
             job=job,
             name=job.title,
@@ -40,6 +59,7 @@ class JobEntry(ScheduleEntry):
             task=execute_run.name,
             options={"queue": job.default_queue},
             last_run_at=(job.last_run and job.last_run.created),
+            next_run_at=job.next_run_at,
         )
 
 
@@ -64,19 +84,25 @@ class RunScheduler(Scheduler):
     def reserve(self, entry):
         """Update entry to next run execution time."""
         new_entry = self.schedule[entry.job.id] = next(entry)
+        # Until the run is created, fall back to the schedule of the entry
+        new_entry.next_run_at = None
         return new_entry
 
     def apply_entry(self, entry, producer=None):
         """Create and apply a JobEntry."""
         with self.app.flask_app.app_context():
             logger.info("Scheduler: Sending due task %s (%s)", entry.name, entry.task)
+            metrics.observe_scheduler_lag(entry)
             try:
                 # TODO Only create and send task if there is no "stale" run (status running, starttime > hour, Run pending for > 1 hr)
                 run = self.create_run(entry)
+                if entry.job.id in self.schedule:
+                    self.schedule[entry.job.id].next_run_at = run.job.next_run_at
                 entry.options["task_id"] = str(run.task_id)
                 entry.args = (str(run.id), system_user_id)
                 result = self.apply_async(entry, producer=producer, advance=False)
             except Exception as exc:
+                metrics.scheduler_errors.inc()
                 logger.error(
                     "Message Error: %s\n%s",
                     exc,
@@ -96,7 +122,15 @@ class RunScheduler(Scheduler):
             jobs = Job.query.filter(
                 Job.active.is_(True),
                 Job.schedule.isnot(None),
-            )
+            ).all()
+            # e.g. jobs scheduled before the next run time was stored
+            unplanned = [job for job in jobs if job.next_run_at is None]
+            for job in unplanned:
+                last_run = job.last_run
+                job.next_run_at = job.compute_next_run_at(last_run and last_run.created)
+            if unplanned:
+                db.session.commit()
+
             self.entries = {}  # because some jobs might be deactivated
             for job in jobs:
                 self.entries[job.id] = JobEntry.from_job(job)
@@ -109,7 +143,18 @@ class RunScheduler(Scheduler):
         job = db.session.get(Job, entry.job.id)
         # at this point, job arguments should be set, so we send them from here
         # to avoid recomputing them
-        run = Run.create(job=job, task_id=uuid.uuid4(), args=entry.kwargs.get("kwargs"))
+        with collect_run_timings() as timings, run_span("args"):
+            run = Run.create(
+                job=job,
+                id=uuid.uuid4(),
+                task_id=uuid.uuid4(),
+                args=entry.kwargs.get("kwargs"),
+            )
+        run.timings = timings
+        job.next_run_at = job.compute_next_run_at()
         db.session.add(run)
+        event = emit_run_event(run)
         db.session.commit()
+        if event:
+            schedule_run_events_dispatch()
         return run
@@ -7,7 +7,6 @@
 
 import inspect
 import json
-from copy import deepcopy
 from datetime import datetime, timezone
 
 from dateutil.parser import isoparse
@@ -19,7 +18,7 @@ from marshmallow_utils.fields import SanitizedUnicode, TZDateTime
 from marshmallow_utils.permissions import FieldPermissionsMixin
 from marshmallow_utils.validators import LazyOneOf
 
-from ..models import RunStatusEnum, Task
+from ..models import RunStatusEnum
 from ..proxies import current_jobs
 
 
@@ -119,11 +118,14 @@ class JobArgumentsSchema(OneOfSchema):
     type_field_remove = False
     type_field = "job_arg_schema"
 
-    def __init__(self, *args, **kwargs):
-        """Constructor."""
-        self.type_schemas = deepcopy(current_jobs.registry.schemas)
-        self.type_schemas["custom"] = CustomArgsSchema
-        super().__init__(*args, **kwargs)
+    @property
+    def type_schemas(self):
+        """Argument schemas of the registered tasks, and of custom arguments."""
+        registry = current_jobs.registry
+        return registry.cached(
+            "arguments_type_schemas",
+            lambda: {**registry.schemas, "custom": CustomArgsSchema},
+        )
 
     def get_obj_type(self, obj):
         """Return object type."""
@@ -161,7 +163,7 @@ class JobSchema(Schema, FieldPermissionsMixin):
 
     task = fields.String(
         required=True,
-        validate=LazyOneOf(choices=lambda: [name for name, t in Task.all().items()]),
+        validate=LazyOneOf(choices=lambda: current_jobs.registry.ids),
     )
     default_queue = fields.String(
         validate=LazyOneOf(choices=lambda: current_jobs.queues.keys()),
@@ -186,11 +188,7 @@ class JobSchema(Schema, FieldPermissionsMixin):
     )
 
     notification_statuses = fields.List(
-        fields.String(
-            validate=LazyOneOf(
-                choices=lambda: [status.name for status in RunStatusEnum]
-            )
-        ),
+        fields.String(validate=LazyOneOf(choices=RunStatusEnum.__members__.keys())),
         allow_none=True,
         load_default=None,
         metadata={
@@ -201,6 +199,9 @@ class JobSchema(Schema, FieldPermissionsMixin):
 
     last_run = fields.Nested(lambda: RunSchema, dump_only=True)
     last_runs = fields.Raw(dump_only=True)
+    next_run = TZDateTime(
+        timezone=timezone.utc, format="iso", dump_only=True, attribute="next_run_at"
+    )
 
     @post_load
     def nest_notifications(self, data, many=False, **kwargs):
@@ -265,7 +266,7 @@ class JobEditSchema(JobSchema):
 
     task = fields.String(
         dump_only=True,
-        validate=LazyOneOf(choices=lambda: [name for name, t in Task.all().items()]),
+        validate=LazyOneOf(choices=lambda: current_jobs.registry.ids),
     )
     args = fields.Nested(
         lambda: JobArgumentsSchema,
@@ -331,6 +332,14 @@ class RunSchema(Schema, FieldPermissionsMixin):
             "title": "Parent Run ID",
         },
     )
+    resumed_run_id = fields.UUID(
+        dump_only=True,
+        allow_none=True,
+        metadata={
+            "description": "ID of the run resumed by this run.",
+            "title": "Resumed Run ID",
+        },
+    )
     subtasks = fields.List(
         fields.Nested(lambda: RunSchema(exclude=("subtasks",))),
         dump_only=True,
@@ -356,6 +365,30 @@ class RunSchema(Schema, FieldPermissionsMixin):
             "title": "Total Entries",
         },
     )
+    timings = fields.Dict(
+        keys=fields.String(),
+        values=fields.Float(),
+        dump_only=True,
+        metadata={
+            "description": "Duration in seconds of the phases of the run.",
+            "title": "Timings",
+        },
+    )
+    attempts = fields.Integer(
+        dump_only=True,
+        dump_default=0,
+        metadata={
+            "description": "Number of executions of the run, including retries.",
+            "title": "Attempts",
+        },
+    )
+    checkpoint = fields.Raw(
+        dump_only=True,
+        metadata={
+            "description": "Position after the last chunk of the run.",
+            "title": "Checkpoint",
+        },
+    )
 
     # Input fields
     title = SanitizedUnicode(validate=_not_blank(max=250), dump_default="Manual run")
@@ -378,6 +411,12 @@ class RunSchema(Schema, FieldPermissionsMixin):
     queue = fields.String(
         validate=LazyOneOf(choices=lambda: current_jobs.queues.keys()),
     )
+    profile = fields.Boolean(
+        metadata={
+            "title": "Profile",
+            "description": "Profile the execution of the run.",
+        },
+    )
 
     @post_load
     def load_custom_args(self, obj, many, **kwargs):
@@ -8,9 +8,11 @@
 
 import json
 import uuid
+from copy import deepcopy
 from datetime import datetime, timezone
 
 import sqlalchemy as sa
+from celery import current_app as current_celery_app
 from flask import current_app
 from invenio_access.permissions import system_user_id
 from invenio_db import db
@@ -20,22 +22,50 @@ from invenio_records_resources.services.records import RecordService
 from invenio_records_resources.services.uow import (
     ModelCommitOp,
     ModelDeleteOp,
+    Operation,
     TaskOp,
-    TaskRevokeOp,
     unit_of_work,
 )
+from invenio_search.engine import dsl
+from marshmallow import ValidationError
+from sqlalchemy.orm import load_only, selectinload, undefer
 
+from invenio_jobs import metrics
 from invenio_jobs.logging.jobs import EMPTY_JOB_CTX, with_job_context
-from invenio_jobs.tasks import execute_run
-from invenio_jobs.utils import send_run_notification
+from invenio_jobs.tasks import (
+    emit_run_event,
+    execute_run,
+    schedule_run_notification,
+)
 
 from ..api import AttrDict
+from ..cancellation import CANCELLED_STATUSES, active_descendants
 from ..models import Job, Run, RunStatusEnum, Task
+from ..proxies import current_jobs
+from ..timings import add_span, collect_run_timings, run_span
+from . import facets
 from .errors import (
     JobNotFoundError,
     RunNotFoundError,
+    RunNotResumableError,
+    RunProfileNotFoundError,
     RunStatusChangeError,
 )
+from .pagination import KeysetPagination
+from .query import jobs_query_filter, runs_query_filter
+
+
+class TasksRevokeOp(Operation):
+    """Revoke (and terminate) several Celery tasks at once, after the commit."""
+
+    def __init__(self, task_ids):
+        """Constructor."""
+        self.task_ids = task_ids
+
+    def on_post_commit(self, uow):
+        """Revoke the tasks with a single broadcast."""
+        if self.task_ids:
+            current_celery_app.control.revoke(self.task_ids, terminate=True)
 
 
 class BaseService(RecordService):
@@ -49,6 +79,58 @@ class BaseService(RecordService):
         """Raise error since services are not backed by search indices."""
         raise NotImplementedError()
 
+    def filter_facets(self, query, params):
+        """Filter a search query by the selected values of the facets.
+
+        Returns the filtered query, and the aggregations of the facets over the
+        unfiltered one. Aggregations are skipped on the pages following a cursor.
+        """
+        search_facets = self.config.search.facets
+        selected = params.get("facets", {})
+        aggregations = None
+        if search_facets and not params.get("after"):
+            aggregations = facets.aggregate(search_facets, query, selected)
+        return query.filter(*facets.filters(search_facets, selected)), aggregations
+
+    def paginate(self, query, search_params, params):
+        """Paginate a search query.
+
+        The query is ordered by the keys planned by the ``sort_planner`` of the
+        search options, then by id. Pages are numbered by default. Passing an
+        ``after`` parameter (empty for the first page) switches to keyset
+        pagination over the first sort key and the id, in which case the total
+        is only counted if ``total`` is set.
+        """
+        model = self.record_cls
+        planner = self.config.search.sort_planner
+        direction = search_params["sort_direction"]
+        query, keys = planner.plan(query, search_params["sort"])
+        if "after" in params:
+            return KeysetPagination(
+                query,
+                model,
+                search_params["size"],
+                after=params["after"],
+                descending=direction is sa.desc,
+                count=params.get("total", False),
+                key=keys[0],
+            )
+        return query.order_by(
+            *(clause for key in keys for clause in planner.order_by(key, direction)),
+            direction(model.id),
+        ).paginate(
+            page=search_params["page"],
+            per_page=search_params["size"],
+            error_out=False,
+        )
+
+    def search_links_tpl(self, results, context):
+        """Return the links template matching the pagination of the results."""
+        links = self.config.links_search
+        if isinstance(results, KeysetPagination):
+            links = self.config.links_search_keyset
+        return LinksTemplate(links, context=context)
+
 
 class TasksService(BaseService):
     """Tasks service."""
@@ -59,7 +141,9 @@ class TasksService(BaseService):
 
         task = Task.get(registered_task_id)
         if task.arguments_schema:
-            return task.arguments_schema()
+            return current_jobs.registry.cached(
+                ("arguments_schema", registered_task_id), task.arguments_schema
+            )
 
 
 def get_job(job_id):
@@ -81,6 +165,39 @@ def get_run(run_id=None, job_id=None):
     return run
 
 
+def get_run_tree(run_id):
+    """Get a run and all the levels of its subtasks, in a single query.
+
+    The tree is walked with a recursive CTE, and only the columns summarizing
+    the runs are selected. Runs are returned ordered by depth then creation.
+    """
+    columns = [
+        Run.id,
+        Run.parent_run_id,
+        Run.job_id,
+        Run.title,
+        Run.status,
+        Run.task_id,
+        Run.created,
+        Run.started_at,
+        Run.finished_at,
+        *(getattr(Run, counter) for counter in Run.counters),
+    ]
+    tree = (
+        sa.select(*columns, sa.literal(0).label("depth"))
+        .where(Run.id == run_id)
+        .cte("run_tree", recursive=True)
+    )
+    tree = tree.union_all(
+        sa.select(*columns, (tree.c.depth + 1).label("depth")).where(
+            Run.parent_run_id == tree.c.id
+        )
+    )
+    return db.session.execute(
+        sa.select(tree).order_by(tree.c.depth, tree.c.created)
+    ).all()
+
+
 class JobsService(BaseService):
     """Jobs service."""
 
@@ -103,6 +220,7 @@ class JobsService(BaseService):
         )
 
         job = Job(**valid_data)
+        job.next_run_at = job.compute_next_run_at()
         uow.register(ModelCommitOp(job))
         return self.result_item(self, identity, job, links_tpl=self.links_item_tpl)
 
@@ -115,33 +233,18 @@ class JobsService(BaseService):
 
         query_param = search_params["q"]
         if query_param:
-            filters.append(
-                sa.or_(
-                    Job.title.ilike(f"%{query_param}%"),
-                    Job.description.ilike(f"%{query_param}%"),
-                )
-            )
+            filters.append(jobs_query_filter(query_param))
 
-        jobs = (
-            Job.query.filter(*filters)
-            .order_by(
-                search_params["sort_direction"](
-                    sa.text(",".join(search_params["sort"]))
-                )
-            )
-            .paginate(
-                page=search_params["page"],
-                per_page=search_params["size"],
-                error_out=False,
-            )
-        )
+        query, aggregations = self.filter_facets(Job.query.filter(*filters), params)
+        jobs = self.paginate(query, search_params, params)
+        jobs.aggregations = aggregations
 
         return self.result_list(
             self,
             identity,
             jobs,
             params=search_params,
-            links_tpl=LinksTemplate(self.config.links_search, context={"args": params}),
+            links_tpl=self.search_links_tpl(jobs, context={"args": params}),
             links_item_tpl=self.links_item_tpl,
         )
 
@@ -169,6 +272,8 @@ class JobsService(BaseService):
                 job.set_run_args(value)
             else:
                 setattr(job, key, value)
+        last_run = job.last_run
+        job.next_run_at = job.compute_next_run_at(last_run and last_run.created)
         uow.register(ModelCommitOp(job))
         return self.result_item(self, identity, job, links_tpl=self.links_item_tpl)
 
@@ -185,6 +290,21 @@ class JobsService(BaseService):
         return True
 
 
+# Columns of a run from which the progress of its subtasks is reported
+SUBTASKS_PROGRESS_COLUMNS = (
+    Run.id,
+    Run.completed_subtasks,
+    Run.total_subtasks,
+    Run.failed_subtasks,
+    Run.errored_entries,
+    Run.total_entries,
+    Run.subtasks_closed,
+    Run.inserted_entries,
+    Run.updated_entries,
+    Run.task_error,
+)
+
+
 class RunsService(BaseService):
     """Runs service."""
 
@@ -194,41 +314,70 @@ class RunsService(BaseService):
         run = get_run(job_id=job_id, run_id=run_id)
         return self.result_item(self, identity, run, links_tpl=self.links_item_tpl)
 
-    def search(self, identity, job_id, params):
-        """Search for runs."""
-        self.require_permission(identity, "search")
-
-        filters = [
-            Run.job_id == job_id,
-        ]
-        include_subtasks = params.get("include_subtasks") in ("true", "1", True)
-
-        if not include_subtasks:
+    def _projection(self, params, expand):
+        """Return the requested fields of the runs, and whether to expand them.
+
+        When only some fields are requested, the users who started the runs are
+        resolved if and only if ``started_by`` is among them.
+        """
+        if not params.get("fields"):
+            return None, expand
+        fields = {field.strip() for field in params["fields"].split(",")} - {""}
+        unknown = fields - set(self.schema.schema.fields)
+        if unknown:
+            raise ValidationError(
+                {"fields": [f"Unknown fields: {', '.join(sorted(unknown))}."]}
+            )
+        return fields, "started_by" in fields
+
+    def _search_runs(self, filters, params, expand=False, fields=None):
+        """Search for the runs matching filters and the search parameters.
+
+        With ``expand``, the users who started the runs are loaded along with
+        them in a single ``IN`` query. With ``fields``, only the columns of the
+        requested fields (and of the links and cursor) are loaded.
+        """
+        parent_run_id = params.get("parent_run_id")
+        if parent_run_id:
+            filters.append(Run.parent_run_id == parent_run_id)
+        elif params.get("include_subtasks") not in ("true", "1", True):
             filters.append(Run.parent_run_id == None)
 
+        # Time window of the creation of the runs
+        if params.get("created_after"):
+            filters.append(Run.created >= params["created_after"])
+        if params.get("created_before"):
+            filters.append(Run.created < params["created_before"])
+
         search_params = map_search_params(self.config.search, params)
 
         query_param = search_params["q"]
         if query_param:
-            filters.append(
-                sa.or_(
-                    Run.id.ilike(f"%{query_param}%"),
-                    Run.task_id.ilike(f"%{query_param}%"),
-                )
-            )
+            filters.append(runs_query_filter(query_param))
+
+        query, aggregations = self.filter_facets(Run.query.filter(*filters), params)
+        if fields is not None:
+            columns = {"id", "job_id", "created", "status"}
+            for field in fields:
+                field = {"started_by": "started_by_id"}.get(field, field)
+                if field in Run.__table__.columns:
+                    columns.add(field)
+            query = query.options(load_only(*(getattr(Run, c) for c in columns)))
+        if expand:
+            query = query.options(selectinload(Run._started_by))
+        # Load what the resume links need along with the page
+        query = query.options(undefer(Run.was_resumed), selectinload(Run.job))
+        runs = self.paginate(query, search_params, params)
+        runs.aggregations = aggregations
+        return runs, search_params
+
+    def search(self, identity, job_id, params, expand=False):
+        """Search for runs."""
+        self.require_permission(identity, "search")
 
-        runs = (
-            Run.query.filter(*filters)
-            .order_by(
-                search_params["sort_direction"](
-                    sa.text(",".join(search_params["sort"]))
-                )
-            )
-            .paginate(
-                page=search_params["page"],
-                per_page=search_params["size"],
-                error_out=False,
-            )
+        fields, expand = self._projection(params, expand)
+        runs, search_params = self._search_runs(
+            [Run.job_id == job_id], params, expand=expand, fields=fields
         )
 
         return self.result_list(
@@ -236,21 +385,89 @@ class RunsService(BaseService):
             identity,
             runs,
             params=search_params,
-            links_tpl=LinksTemplate(
-                self.config.links_search,
+            links_tpl=self.search_links_tpl(
+                runs,
                 context={
                     "args": params,
                     "job_id": job_id,
                 },
             ),
             links_item_tpl=self.links_item_tpl,
+            expand=expand,
+            fields=fields,
+        )
+
+    def search_all(self, identity, params, expand=False):
+        """Search for the runs of all jobs.
+
+        Runs are paged with a cursor unless a page is requested, so that polling
+        the latest runs does not count all of them.
+        """
+        self.require_permission(identity, "search")
+
+        if "page" not in params:
+            params = {"after": "", **params}
+        fields, expand = self._projection(params, expand)
+        filters = []
+        if params.get("job_id"):
+            filters.append(Run.job_id == params["job_id"])
+        runs, search_params = self._search_runs(
+            filters, params, expand=expand, fields=fields
         )
 
+        links = self.config.links_search_all
+        if isinstance(runs, KeysetPagination):
+            links = self.config.links_search_all_keyset
+        return self.result_list(
+            self,
+            identity,
+            runs,
+            params=search_params,
+            links_tpl=LinksTemplate(links, context={"args": params}),
+            links_item_tpl=self.links_item_tpl,
+            expand=expand,
+            fields=fields,
+        )
+
+    def read_tree(self, identity, job_id, run_id):
+        """Retrieve a run with the tree of its subtasks."""
+        self.require_permission(identity, "read")
+        get_run(job_id=job_id, run_id=run_id)
+        rows = get_run_tree(run_id)
+        return self.config.result_tree_cls(self, identity, rows)
+
+    def read_profile(self, identity, job_id, run_id):
+        """Retrieve the profiling statistics of a run."""
+        self.require_permission(identity, "read")
+        run = get_run(job_id=job_id, run_id=run_id)
+        if run.profile_stats is None:
+            raise RunProfileNotFoundError(run_id)
+        return run.profile_stats
+
+    def aggregate_timings(self, identity, job_id):
+        """Aggregate the per-phase timings of the latest finished runs of a job."""
+        self.require_permission(identity, "search")
+        get_job(job_id)
+
+        runs = (
+            Run.query.filter(
+                Run.job_id == job_id,
+                Run.parent_run_id.is_(None),
+                Run.finished_at.isnot(None),
+                Run.timings.isnot(None),
+            )
+            .order_by(Run.finished_at.desc())
+            .limit(current_app.config["JOBS_RUNS_TIMINGS_AGGREGATION_SIZE"])
+            .all()
+        )
+        return self.config.result_timings_cls(self, identity, runs, job_id=job_id)
+
     def read(self, identity, job_id, run_id):
         """Retrieve a run."""
         self.require_permission(identity, "read")
         run = get_run(job_id=job_id, run_id=run_id)
         run_dict = run.dump()
+        run_dict["was_resumed"] = run.was_resumed
         run_record = AttrDict(run_dict)
         return self.result_item(
             self, identity, run_record, links_tpl=self.links_item_tpl
@@ -269,19 +486,102 @@ class RunsService(BaseService):
             context={"identity": identity, "job": job},
             raise_errors=True,
         )
+        # Not a load default of the schema, which would reset it on updates
+        valid_data.setdefault("profile", False)
+
+        with collect_run_timings() as timings, run_span("args"):
+            run = Run.create(
+                job=job,
+                id=str(uuid.uuid4()),
+                task_id=str(uuid.uuid4()),
+                started_by_id=(
+                    None if identity.id == system_user_id else identity.id
+                ),  # None because column expects Integer FK but is nullable
+                status=RunStatusEnum.QUEUED,
+                **valid_data,
+            )
+        run.timings = timings
 
-        run = Run.create(
-            job=job,
+        uow.register(ModelCommitOp(run))
+        emit_run_event(run, uow=uow)
+        uow.register(
+            TaskOp.for_async_apply(
+                execute_run,
+                kwargs={"run_id": run.id, "identity_id": identity.id},
+                task_id=str(run.task_id),
+                queue=run.queue,
+            )
+        )
+        current_app.logger.debug("Run created")
+
+        return self.result_item(self, identity, run, links_tpl=self.links_item_tpl)
+
+    @with_job_context(EMPTY_JOB_CTX)
+    @unit_of_work()
+    def resume(self, identity, job_id, run_id, uow=None):
+        """Resume a failed or cancelled run, in a new run.
+
+        The new run is linked to the resumed run, and continues after its
+        checkpoint. Only the subtasks which didn't succeed (or didn't start) are
+        queued again, with their arguments, while the counters of the others are
+        carried over.
+        """
+        self.require_permission(identity, "create")
+        resumed = get_run(run_id=run_id, job_id=job_id)
+        job_type = current_jobs.registry.get(resumed.job.task)
+        if not job_type.resumable or resumed.status not in Run.resumable_statuses:
+            raise RunNotResumableError(resumed)
+        # Concurrent resumes of a run wait on the lock of its row
+        db.session.execute(
+            sa.select(Run.id).where(Run.id == resumed.id).with_for_update()
+        )
+        resumed_by_id = db.session.execute(
+            sa.select(Run.id).where(Run.resumed_run_id == resumed.id).limit(1)
+        ).scalar()
+        if resumed_by_id:
+            raise RunNotResumableError(resumed, resumed_by_id=resumed_by_id)
+
+        started_by_id = None if identity.id == system_user_id else identity.id
+        pending = resumed.subtasks.filter(
+            Run.status.in_(
+                [RunStatusEnum.FAILED, RunStatusEnum.CANCELLED, RunStatusEnum.QUEUED]
+            )
+        ).all()
+        succeeded = resumed.completed_subtasks - resumed.failed_subtasks
+        run = Run(
             id=str(uuid.uuid4()),
             task_id=str(uuid.uuid4()),
-            started_by_id=(
-                None if identity.id == system_user_id else identity.id
-            ),  # None because column expects Integer FK but is nullable
+            job=resumed.job,
+            title=resumed.title,
+            args=deepcopy(resumed.args),
+            queue=resumed.queue,
+            started_by_id=started_by_id,
             status=RunStatusEnum.QUEUED,
-            **valid_data,
+            resumed_run_id=resumed.id,
+            checkpoint=deepcopy(resumed.checkpoint),
+            total_subtasks=succeeded + len(pending),
+            completed_subtasks=succeeded,
+            **{counter: getattr(resumed, counter) for counter in Run.entry_counters},
         )
-
         uow.register(ModelCommitOp(run))
+        for subtask in pending:
+            uow.register(
+                ModelCommitOp(
+                    Run(
+                        id=str(uuid.uuid4()),
+                        task_id=str(uuid.uuid4()),
+                        job=resumed.job,
+                        parent_run=run,
+                        title=f"Run {run.id} — Subtask",
+                        args=deepcopy(subtask.args),
+                        queue=subtask.queue,
+                        started_by_id=started_by_id,
+                        status=RunStatusEnum.QUEUED,
+                    )
+                )
+            )
+
+        emit_run_event(run, uow=uow)
         uow.register(
             TaskOp.for_async_apply(
                 execute_run,
@@ -290,8 +590,6 @@ class RunsService(BaseService):
                 queue=run.queue,
             )
         )
-        current_app.logger.debug("Run created")
-
         return self.result_item(self, identity, run, links_tpl=self.links_item_tpl)
 
     @unit_of_work()
@@ -329,22 +627,25 @@ class RunsService(BaseService):
         parent_run = get_run(run_id=parent_run_id, job_id=job_id)
         job = parent_run.job
 
-        subtask_run = Run.create(
-            job=job,
-            id=str(uuid.uuid4()),
-            task_id=str(uuid.uuid4()),
-            started_by_id=(
-                None if identity.id == system_user_id else identity.id
-            ),  # None because column expects Integer FK but is nullable
-            status=RunStatusEnum.QUEUED,
-            title=f"Run {parent_run_id} — Subtask",
-            args=args or {},
-        )
+        with collect_run_timings() as timings, run_span("args"):
+            subtask_run = Run.create(
+                job=job,
+                id=str(uuid.uuid4()),
+                task_id=str(uuid.uuid4()),
+                started_by_id=(
+                    None if identity.id == system_user_id else identity.id
+                ),  # None because column expects Integer FK but is nullable
+                status=RunStatusEnum.QUEUED,
+                title=f"Run {parent_run_id} — Subtask",
+                args=args or {},
+            )
+        subtask_run.timings = timings
 
         parent_run.total_subtasks += 1
         subtask_run.parent_run_id = parent_run.id
         uow.register(ModelCommitOp(subtask_run))
         uow.register(ModelCommitOp(parent_run))
+        emit_run_event(subtask_run, uow=uow)
         return self.result_item(
             self, identity, subtask_run, links_tpl=self.links_item_tpl
         )
@@ -360,8 +661,31 @@ class RunsService(BaseService):
 
         run.status = RunStatusEnum.RUNNING
         run.started_at = datetime.now(timezone.utc)
+        run.attempts += 1
 
         uow.register(ModelCommitOp(run))
+        emit_run_event(run, uow=uow)
+        return self.result_item(self, identity, run, links_tpl=self.links_item_tpl)
+
+    @unit_of_work()
+    def retry_subtask(self, identity, run_id, job_id, message=None, uow=None):
+        """Queue a failed subtask again, without finalizing it.
+
+        The counters of the parent run are left untouched, so that they are
+        only updated once, when the last attempt of the subtask is finalized.
+        The caller sends the task of the subtask again.
+        """
+        self.require_permission(identity, "update")
+        run = get_run(run_id=run_id, job_id=job_id)
+
+        if run.status != RunStatusEnum.RUNNING:
+            raise RunStatusChangeError(run, RunStatusEnum.QUEUED)
+
+        run.status = RunStatusEnum.QUEUED
+        run.message = message
+
+        uow.register(ModelCommitOp(run))
+        emit_run_event(run, uow=uow)
         return self.result_item(self, identity, run, links_tpl=self.links_item_tpl)
 
     @unit_of_work()
@@ -374,14 +698,22 @@ class RunsService(BaseService):
         success=True,
         inserted_entries_count=0,
         updated_entries_count=0,
+        total_entries_count=0,
         uow=None,
     ):
-        """Finalize a subtask and update its parent."""
+        """Finalize a subtask and update its parent.
+
+        Subtasks which are already finished, e.g. cancelled with their run, are
+        left unchanged and don't report to their parent again.
+        """
         self.require_permission(identity, "update")
 
         # Child run: load and set its status
         run = get_run(run_id=run_id, job_id=job_id)
-        run.status = RunStatusEnum.SUCCESS if success else RunStatusEnum.FAILED
+        status = RunStatusEnum.SUCCESS if success else RunStatusEnum.FAILED
+        if run.status in Run.finished_statuses:
+            raise RunStatusChangeError(run, status)
+        run.status = status
 
         # Compute increments
         fail_inc = 0 if success else 1
@@ -399,18 +731,9 @@ class RunsService(BaseService):
                 failed_subtasks=Run.failed_subtasks + sa.bindparam("fail_inc"),
                 inserted_entries=Run.inserted_entries + sa.bindparam("ins_inc"),
                 updated_entries=Run.updated_entries + sa.bindparam("upd_inc"),
+                total_entries=Run.total_entries + sa.bindparam("tot_inc"),
             )
-            .returning(
-                Run.id,
-                Run.completed_subtasks,
-                Run.total_subtasks,
-                Run.failed_subtasks,
-                Run.errored_entries,
-                Run.total_entries,
-                Run.subtasks_closed,
-                Run.inserted_entries,
-                Run.updated_entries,
-            )
+            .returning(*SUBTASKS_PROGRESS_COLUMNS)
         )
         res = db.session.execute(
             parent_counters_stmt,
@@ -419,12 +742,56 @@ class RunsService(BaseService):
                 "fail_inc": fail_inc,
                 "ins_inc": ins_inc,
                 "upd_inc": upd_inc,
+                "tot_inc": int(total_entries_count or 0),
             },
         )
         row = res.first()
         if not row:
             raise RunNotFoundError(run.parent_run_id, job_id=job_id)
+        self._update_subtasks_progress(row, uow)
+
+        uow.register(ModelCommitOp(run))
+        emit_run_event(run, uow=uow)
+        metrics.observe_subtask_finalized(run, run.status)
+
+        return self.result_item(self, identity, run, links_tpl=self.links_item_tpl)
+
+    @unit_of_work()
+    def close_subtasks(self, identity, run_id, job_id, task_error=None, uow=None):
+        """Mark all the subtasks of a run as spawned.
 
+        The last subtask to be finalized then finalizes the run, or the run is
+        finalized right away if all its subtasks were finalized already.
+
+        :param task_error: The error of the run's task, if it failed after
+            spawning subtasks. The run then fails, or partially succeeds if
+            some of its subtasks succeeded.
+        """
+        self.require_permission(identity, "update")
+        values = {"subtasks_closed": True}
+        if task_error:
+            values["task_error"] = task_error
+        row = db.session.execute(
+            sa.update(Run)
+            .where(Run.id == run_id, Run.job_id == job_id)
+            .values(**values)
+            .returning(*SUBTASKS_PROGRESS_COLUMNS, Run.status)
+        ).first()
+        if not row:
+            raise RunNotFoundError(run_id, job_id=job_id)
+
+        if (
+            row.status == RunStatusEnum.RUNNING
+            and row.total_subtasks
+            and row.completed_subtasks == row.total_subtasks
+        ):
+            self._update_subtasks_progress(row[:-1], uow)
+
+    def _update_subtasks_progress(self, row, uow):
+        """Report the progress of the subtasks of a run, and finalize it when done.
+
+        :param row: The values of the ``SUBTASKS_PROGRESS_COLUMNS`` of the run.
+        """
         (
             parent_id,
             completed,
@@ -435,6 +802,7 @@ class RunsService(BaseService):
             subtasks_closed,
             parent_inserted,
             parent_updated,
+            task_error,
         ) = row
 
         parts = [f"{completed}/{total} subtasks completed."]
@@ -444,11 +812,19 @@ class RunsService(BaseService):
             parts.append(f" {parent_errored}/{total_entries} entries errored.")
         if parent_inserted or parent_updated:
             parts.append(f" {parent_inserted} inserted / {parent_updated} updated.")
+        if task_error:
+            parts.append(f" {task_error}")
         progress_msg = "".join(parts)
         # Only update parent status/finished_at if all subtasks are completed and them main job is not running.
         finished = completed == total
         if subtasks_closed and finished:
-            if failed == 0 and parent_errored == 0:
+            if task_error:
+                parent_status = (
+                    RunStatusEnum.PARTIAL_SUCCESS
+                    if failed < total
+                    else RunStatusEnum.FAILED
+                )
+            elif failed == 0 and parent_errored == 0:
                 parent_status = RunStatusEnum.SUCCESS
             elif failed < total or (
                 parent_errored > 0 and parent_errored < total_entries
@@ -461,25 +837,39 @@ class RunsService(BaseService):
             parent_status = RunStatusEnum.RUNNING
             finished_at_value = None
 
+        # Cancelled parents are finalized by their own task, or by ``stop``, and
+        # parents queued for a retry by their next attempt
         update_parent_stmt = (
             sa.update(Run)
-            .where(Run.id == parent_id)
+            .where(
+                Run.id == parent_id,
+                Run.status.notin_(CANCELLED_STATUSES + (RunStatusEnum.QUEUED,)),
+            )
             .values(
                 message=progress_msg,
                 status=parent_status,
                 finished_at=finished_at_value,
             )
         )
-        db.session.execute(update_parent_stmt)
+        parent_updated = db.session.execute(update_parent_stmt).rowcount > 0
         # Send email notification if parent run is finished
-        if subtasks_closed and finished:
+        if parent_updated and subtasks_closed and finished:
             parent_run = db.session.get(Run, parent_id)
             if parent_run:
-                send_run_notification(parent_run, parent_run.job)
-
-        uow.register(ModelCommitOp(run))
-
-        return self.result_item(self, identity, run, links_tpl=self.links_item_tpl)
+                # Time spent waiting on the subtasks after the task returned
+                timings = dict(parent_run.timings or {})
+                if parent_run.started_at:
+                    elapsed = finished_at_value - parent_run.started_at
+                    add_span(
+                        timings,
+                        "subtasks",
+                        elapsed.total_seconds() - timings.get("execute", 0),
+                    )
+                    parent_run.timings = timings
+                    uow.register(ModelCommitOp(parent_run))
+                metrics.observe_run_finished(parent_run, parent_status)
+                emit_run_event(parent_run, status=parent_status, uow=uow)
+                schedule_run_notification(parent_run, status=parent_status, uow=uow)
 
     @unit_of_work()
     def update(self, identity, job_id, run_id, data, uow=None):
@@ -513,16 +903,55 @@ class RunsService(BaseService):
 
     @unit_of_work()
     def stop(self, identity, job_id, run_id, uow=None):
-        """Stop a run."""
+        """Stop a run, and cancel its queued or running subtasks.
+
+        The tasks of the run and of its subtasks are revoked. A run whose task
+        is still executing is only marked as cancelling, until its task notices
+        the cancellation (see ``invenio_jobs.cancellation``) and cancels it.
+        """
         self.require_permission(identity, "stop")
         run = get_run(job_id=job_id, run_id=run_id)
 
         if run.status not in (RunStatusEnum.QUEUED, RunStatusEnum.RUNNING):
             raise RunStatusChangeError(run, RunStatusEnum.CANCELLING)
 
-        run.status = RunStatusEnum.CANCELLING
+        now = datetime.now(timezone.utc)
+        descendants = active_descendants(run)
+        if descendants:
+            db.session.execute(
+                sa.update(Run)
+                .where(
+                    Run.id.in_([id_ for id_, _ in descendants]),
+                    Run.status.in_([RunStatusEnum.QUEUED, RunStatusEnum.RUNNING]),
+                )
+                .values(
+                    status=RunStatusEnum.CANCELLED,
+                    finished_at=now,
+                    message=f"Cancelled with run {run.id}.",
+                ),
+                execution_options={"synchronize_session": False},
+            )
+
+        # Queued runs, and runs waiting for their subtasks, have no task to
+        # notice the cancellation. Nor do the runs dispatching their subtasks
+        # from the subtasks (e.g. the chunked jobs), whose task only spawns the
+        # first ones.
+        job_type = current_jobs.registry.get(run.job.task)
+        if (
+            run.status == RunStatusEnum.QUEUED
+            or run.subtasks_closed
+            or not job_type.subtasks_closed_on_return
+        ):
+            run.status = RunStatusEnum.CANCELLED
+            run.finished_at = now
+        else:
+            run.status = RunStatusEnum.CANCELLING
         uow.register(ModelCommitOp(run))
-        uow.register(TaskRevokeOp(str(run.task_id)))
+        emit_run_event(run, uow=uow)
+        if run.status == RunStatusEnum.CANCELLED:
+            schedule_run_notification(run, uow=uow)
+        task_ids = [run.task_id] + [task_id for _, task_id in descendants]
+        uow.register(TasksRevokeOp([str(id_) for id_ in task_ids if id_]))
 
         return self.result_item(self, identity, run, links_tpl=self.links_item_tpl)
 
@@ -609,3 +1038,43 @@ class JobLogService(BaseService):
             final_results,
             links_tpl=self.links_item_tpl,
         )
+
+    def aggregate(self, identity, run_id):
+        """Aggregate the logs of a run.
+
+        Computes the per-level counts, the per-task hierarchy (with counts and
+        first/last timestamps) and a date histogram of the run's logs using
+        search aggregations, so that summaries can be rendered without
+        transferring every log line.
+        """
+        self.require_permission(identity, "search")
+        max_tasks = current_app.config["JOBS_LOGS_AGGREGATION_MAX_TASKS"]
+        buckets = current_app.config["JOBS_LOGS_AGGREGATION_HISTOGRAM_BUCKETS"]
+
+        search = self._search(
+            "search",
+            identity,
+            {},
+            None,
+            extra_filter=dsl.Q("term", **{"context.run_id": str(run_id)}),
+            permission_action="read",
+        )
+        search = search.extra(size=0, track_total_hits=True)
+
+        search.aggs.bucket("levels", "terms", field="level")
+        search.aggs.metric("first", "min", field="@timestamp")
+        search.aggs.metric("last", "max", field="@timestamp")
+        tasks = search.aggs.bucket(
+            "tasks", "terms", field="context.task_id", size=max_tasks
+        )
+        tasks.metric("first", "min", field="@timestamp")
+        tasks.metric("last", "max", field="@timestamp")
+        tasks.bucket("levels", "terms", field="level")
+        tasks.bucket("parent", "terms", field="context.parent_task_id", size=1)
+        search.aggs.bucket(
+            "histogram", "auto_date_histogram", field="@timestamp", buckets=buckets
+        )
+
+        return self.config.result_aggregation_cls(
+            self, identity, search.execute(), run_id=run_id
+        )
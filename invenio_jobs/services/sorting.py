@@ -0,0 +1,113 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Sorting of DB-backed searches."""
+
+from collections import namedtuple
+
+import sqlalchemy as sa
+from invenio_accounts.models import User
+
+from ..models import Job, Run
+
+SortKey = namedtuple("SortKey", ["expression", "nullable"])
+"""Expression to order by, and whether it can be ``NULL``."""
+
+
+class SortPlanner:
+    """Map the sort fields of the search options to SQL expressions.
+
+    Each field is planned by a function receiving the query and returning the
+    query (e.g. joined to a subquery) together with the key to order it by.
+    Fields are resolved against this mapping only, so no user input ends up in
+    the ``ORDER BY`` clause.
+    """
+
+    def __init__(self, fields):
+        """Constructor."""
+        self.fields = fields
+
+    def plan(self, query, fields):
+        """Return the query and the keys to order it by."""
+        keys = []
+        for field in fields:
+            try:
+                plan_field = self.fields[field]
+            except KeyError:
+                raise ValueError(f"Sort field '{field}' is not supported.")
+            query, key = plan_field(query)
+            keys.append(key)
+        return query, keys
+
+    @staticmethod
+    def order_by(key, direction):
+        """Return the ordering clauses of a key (see :func:`nulls_last`)."""
+        return nulls_last(key.expression, direction, key.nullable)
+
+
+def nulls_last(expression, direction, nullable=True):
+    """Return the ordering clauses of an expression, with ``NULL`` values last.
+
+    ``NULLS LAST`` isn't supported by all databases (e.g. MySQL), so it is
+    emulated by ordering by whether the value is ``NULL`` first. This only
+    applies to nullable expressions, so that the ordering of the others can
+    be served by an index.
+    """
+    if not nullable:
+        return (direction(expression),)
+    return (expression.is_(None), direction(expression))
+
+
+def column(attribute):
+    """Plan a sort on a column of the searched model."""
+    key = SortKey(attribute, attribute.expression.nullable)
+    return lambda query: (query, key)
+
+
+def last_run_value(*columns, join=None):
+    """Return a value of the last run of the jobs, as a correlated subquery.
+
+    The last run of each job is selected by creation time, as in
+    ``Job.last_run``. The subquery is served by the index on the
+    ``(job_id, created, id)`` columns of the runs, reading a single entry per
+    job.
+    """
+    query = sa.select(*columns).select_from(Run)
+    if join is not None:
+        query = query.outerjoin(*join)
+    return (
+        query.where(Run.job_id == Job.id)
+        .order_by(Run.created.desc(), Run.id.desc())
+        .limit(1)
+        .correlate(Job)
+        .scalar_subquery()
+    )
+
+
+def last_run_start_time(query):
+    """Plan a sort on the start time of the last run of the jobs."""
+    return query, SortKey(last_run_value(Run.started_at), True)
+
+
+def last_run_user(query):
+    """Plan a sort on the user who started the last run of the jobs."""
+    email = last_run_value(User.email, join=(User, User.id == Run.started_by_id))
+    return query, SortKey(email, True)
+
+
+jobs_sort_planner = SortPlanner(
+    {
+        "title": column(Job.title),
+        "last_run_start_time": last_run_start_time,
+        "user": last_run_user,
+        "next_run": column(Job.next_run_at),
+    }
+)
+"""Sort planner of the jobs search."""
+
+runs_sort_planner = SortPlanner(
+    {
+        "created": column(Run.created),
+    }
+)
+"""Sort planner of the runs search."""
@@ -5,25 +5,44 @@
 """Tasks."""
 
 import traceback
-from datetime import datetime, timezone
+from contextlib import nullcontext
+from datetime import datetime, timedelta, timezone
 
 import sqlalchemy as sa
 from celery import shared_task
 from flask import current_app, g
+from invenio_access.permissions import system_identity, system_user_id
 from invenio_db import db
+from invenio_records_resources.services.uow import ModelCommitOp, TaskOp
 
-from invenio_jobs.errors import TaskExecutionError, TaskExecutionPartialError
-from invenio_jobs.logging.jobs import set_job_context
-from invenio_jobs.models import Run, RunStatusEnum
-from invenio_jobs.proxies import current_jobs
-from invenio_jobs.utils import send_run_notification
+from invenio_jobs import metrics
+from invenio_jobs.errors import (
+    RunCancelledError,
+    TaskExecutionError,
+    TaskExecutionPartialError,
+)
+from invenio_jobs.logging.jobs import EMPTY_JOB_CTX, job_context, set_job_context
+from invenio_jobs.models import Job, Run, RunEvent, RunStatusEnum
+from invenio_jobs.profiling import profile_run
+from invenio_jobs.proxies import current_jobs, current_runs_service
+from invenio_jobs.timings import add_span, collect_run_timings, run_span, run_timings
+from invenio_jobs.utils import (
+    send_run_notification,
+    send_run_notification_digest,
+    should_send_run_notification,
+)
 
 
 # TODO 1. Move to service? 2. Don't use kwargs?
 def update_run(run, **kwargs):
-    """Method to update and commit run updates."""
+    """Method to update and commit run updates.
+
+    Returns whether the run was updated, e.g. not if its subtasks are still
+    active or not all spawned yet, or if it was already finalized (by its last
+    subtask or by ``stop``).
+    """
     if not run:
-        return
+        return False
 
     has_active_subtasks = (
         run.subtasks.filter(
@@ -36,13 +55,37 @@ def update_run(run, **kwargs):
         f"Updating run {run.id} with status {run.status} and active subtasks: {has_active_subtasks}"
     )
 
+    # Store the spans collected so far, if executing the run
+    if (timings := run_timings.get()) is not None:
+        run.timings = dict(timings)
+
     new_status = kwargs.get("status")
-    if has_active_subtasks and new_status != RunStatusEnum.RUNNING:
+    spawning_subtasks = False
+    if new_status and new_status != RunStatusEnum.RUNNING:
+        status, subtasks_closed, total_subtasks = db.session.execute(
+            sa.select(Run.status, Run.subtasks_closed, Run.total_subtasks).where(
+                Run.id == run.id
+            )
+        ).one()
+        if status in Run.finished_statuses:
+            db.session.commit()
+            return False
+        # Runs which may still spawn subtasks (e.g. chunked runs dispatching
+        # their chunks) are finalized once their subtasks are closed
+        spawning_subtasks = (
+            new_status != RunStatusEnum.CANCELLED
+            and total_subtasks
+            and not subtasks_closed
+        )
+
+    if (
+        has_active_subtasks or spawning_subtasks
+    ) and new_status != RunStatusEnum.RUNNING:
         # If subtasks are active, only update errored_entries
         if errored_entries := kwargs.get("errored_entries"):
             run.errored_entries += errored_entries
         db.session.commit()
-        return
+        return False
 
     # Update all fields (either no active subtasks, or setting status to RUNNING)
     for kw, value in kwargs.items():
@@ -50,38 +93,275 @@ def update_run(run, **kwargs):
             run.errored_entries += value
         else:
             setattr(run, kw, value)
+    event = emit_run_event(run) if new_status else None
     db.session.commit()
+    if event:
+        schedule_run_events_dispatch()
+
+    if new_status == RunStatusEnum.RUNNING:
+        metrics.observe_run_started(run)
+    elif new_status:
+        metrics.observe_run_finished(run, new_status)
+    return True
+
+
+def retry_run(run, message):
+    """Queue a failed run again, to be retried.
+
+    Runs resuming from a checkpoint, or whose subtasks already reported to
+    them, keep their entry counters. The others start over, and so do their
+    counters.
+    """
+    run.status = RunStatusEnum.QUEUED
+    run.message = message
+    run.finished_at = None
+    if run.checkpoint is None and not run.subtasks.count():
+        for counter in Run.entry_counters:
+            setattr(run, counter, 0)
+    if (timings := run_timings.get()) is not None:
+        run.timings = dict(timings)
+    event = emit_run_event(run)
+    db.session.commit()
+    if event:
+        schedule_run_events_dispatch()
+
+
+def emit_run_event(run, status=None, uow=None):
+    """Record a lifecycle event for the current status of a run.
+
+    The event is written in the same transaction as the status change and
+    delivered to the sinks after the commit, either through the unit of work,
+    or by the caller calling :func:`schedule_run_events_dispatch` once it has
+    committed.
+    """
+    if not current_app.config["JOBS_RUN_EVENTS_SINKS"]:
+        return None
+
+    event = RunEvent.create(run, status=status)
+    if uow:
+        uow.register(ModelCommitOp(event))
+        uow.register(
+            TaskOp.for_async_apply(dispatch_run_events, **_run_events_celery_kwargs())
+        )
+    else:
+        db.session.add(event)
+    return event
+
+
+def _run_events_celery_kwargs():
+    """Return the Celery options of the run events dispatching task."""
+    queue = current_app.config["JOBS_RUN_EVENTS_QUEUE"]
+    return {"queue": queue} if queue else {}
+
+
+def schedule_run_events_dispatch():
+    """Enqueue the delivery of the pending run events."""
+    dispatch_run_events.apply_async(**_run_events_celery_kwargs())
+
+
+@shared_task(ignore_result=True)
+def dispatch_run_events():
+    """Deliver the pending run events to the configured sinks.
+
+    Events are delivered in batches, in the order they were recorded. Rows are
+    locked while being delivered (skipping rows locked by concurrent workers),
+    and are only marked as dispatched once all sinks accepted the batch. The
+    dispatch stops at the first failed batch, which is retried on the next one.
+    """
+    sinks = current_jobs.run_event_sinks
+    if not sinks:
+        return
+
+    batch_size = current_app.config["JOBS_RUN_EVENTS_BATCH_SIZE"]
+    max_attempts = current_app.config["JOBS_RUN_EVENTS_MAX_ATTEMPTS"]
+    while True:
+        events = (
+            RunEvent.query.filter(
+                RunEvent.dispatched_at.is_(None),
+                RunEvent.attempts < max_attempts,
+            )
+            .order_by(RunEvent.id)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+            .all()
+        )
+        if not events:
+            return
+
+        payload = [event.dump() for event in events]
+        try:
+            for sink in sinks:
+                sink.send(payload)
+        except Exception as e:
+            current_app.logger.warning(f"Failed to deliver run events: {e}")
+            for event in events:
+                event.attempts += 1
+                event.last_error = f"{e.__class__.__name__}: {e}"
+            # Keep the ordering of events, and don't hammer a failing sink
+            db.session.commit()
+            return
+
+        now = datetime.now(timezone.utc)
+        for event in events:
+            event.dispatched_at = now
+        db.session.commit()
+
+
+def _digest_window(finished_at):
+    """Return the start and end of the digest window a finish time falls in."""
+    window = current_app.config["JOBS_NOTIFICATIONS_DIGEST_WINDOW"]
+    if finished_at.tzinfo is None:
+        finished_at = finished_at.replace(tzinfo=timezone.utc)
+    start = finished_at.timestamp() // window * window
+    start = datetime.fromtimestamp(start, timezone.utc)
+    return start, start + timedelta(seconds=window)
+
+
+def schedule_run_notification(run, status=None, uow=None):
+    """Enqueue the email notification of a finished run.
+
+    The notification is only sent after the run's status change is committed,
+    either through the unit of work, or directly if no unit of work is given
+    (in which case the caller is expected to have committed already).
+    """
+    status = status or run.status
+    if not should_send_run_notification(run.job, status):
+        return
+
+    celery_kwargs = {}
+    if queue := current_app.config["JOBS_NOTIFICATIONS_QUEUE"]:
+        celery_kwargs["queue"] = queue
+    if current_app.config["JOBS_NOTIFICATIONS_DIGEST_WINDOW"]:
+        # Wait until the digest window closes, so that all the runs that
+        # finished within it can be sent together.
+        _, end = _digest_window(run.finished_at or datetime.now(timezone.utc))
+        delay = current_app.config["JOBS_NOTIFICATIONS_DIGEST_DELAY"]
+        celery_kwargs["eta"] = end + timedelta(seconds=delay)
+
+    if uow:
+        uow.register(
+            TaskOp.for_async_apply(
+                send_run_notifications, args=(str(run.id),), **celery_kwargs
+            )
+        )
+    else:
+        send_run_notifications.apply_async(args=(str(run.id),), **celery_kwargs)
+
+
+@shared_task(ignore_result=True)
+def send_run_notifications(run_id):
+    """Send the email notifications of a finished run.
+
+    If a digest window is configured, the runs which finished within the same
+    window are coalesced into a single email per recipient. The email is sent
+    by the task of the first run of the window, the tasks of the other runs are
+    no-ops.
+    """
+    run = db.session.get(Run, run_id)
+    if run is None:
+        return
+
+    if not current_app.config["JOBS_NOTIFICATIONS_DIGEST_WINDOW"] or not (
+        run.finished_at
+    ):
+        send_run_notification(run, run.job)
+        return
+
+    if not should_send_run_notification(run.job, run.status):
+        return
+
+    start, end = _digest_window(run.finished_at)
+    window_runs = [
+        r
+        for r in (
+            Run.query.join(Job)
+            .filter(
+                Run.parent_run_id.is_(None),
+                Run.finished_at >= start,
+                Run.finished_at < end,
+                Job.notifications.isnot(None),
+            )
+            .order_by(Run.finished_at, Run.id)
+        )
+        if should_send_run_notification(r.job, r.status)
+    ]
+    for recipient in run.job.notifications["emails"]:
+        runs = [r for r in window_runs if recipient in r.job.notifications["emails"]]
+        if not runs or runs[0].id != run.id:
+            continue
+        if len(runs) == 1:
+            send_run_notification(run, run.job, recipients=[recipient])
+        else:
+            send_run_notification_digest(runs, recipient)
 
 
 @shared_task(bind=True, ignore_result=True)
 def execute_run(self, run_id, identity_id, kwargs=None):
-    """Execute and manage a run state and task."""
+    """Execute and manage a run state and task.
+
+    Runs failing with an unexpected error are retried according to the retry
+    policy of their job type (see ``invenio_jobs.retries``). Runs cancelled
+    while executing are cancelled once their task notices it (see
+    ``invenio_jobs.cancellation``).
+    """
     run = Run.query.filter_by(id=run_id).one_or_none()
-    task = current_jobs.registry.get(run.job.task).task
+    job_type = current_jobs.registry.get(run.job.task)
+    task = job_type.task
 
-    with set_job_context(
-        {
-            "run_id": str(run_id),
-            "job_id": str(run.job.id),
-            "identity_id": str(identity_id),
-            "task_id": str(self.request.id),
-            "parent_task_id": (
-                str(self.request.parent_id) if self.request.parent_id else None
-            ),
-        }
+    # The run was stopped before its task started, or while it was retried
+    if run.status in (RunStatusEnum.CANCELLING, RunStatusEnum.CANCELLED):
+        current_app.logger.info(f"Run {run.id} was cancelled before it started.")
+        if run.status == RunStatusEnum.CANCELLING:
+            update_run(
+                run,
+                status=RunStatusEnum.CANCELLED,
+                finished_at=datetime.now(timezone.utc),
+            )
+        return
+    # The run was already finished, e.g. if its task was sent twice
+    if run.status in Run.finished_statuses:
+        current_app.logger.warning(f"Run {run.id} is already finished.")
+        return
+
+    with (
+        set_job_context(
+            {
+                "run_id": str(run_id),
+                "job_id": str(run.job.id),
+                "identity_id": str(identity_id),
+                "task_id": str(self.request.id),
+                "parent_task_id": (
+                    str(self.request.parent_id) if self.request.parent_id else None
+                ),
+            }
+        ),
+        collect_run_timings(dict(run.timings or {})) as timings,
     ):
+        started_at = datetime.now(timezone.utc)
+        add_span(timings, "queue", (started_at - run.created).total_seconds())
         update_run(
-            run, status=RunStatusEnum.RUNNING, started_at=datetime.now(timezone.utc)
+            run,
+            status=RunStatusEnum.RUNNING,
+            started_at=started_at,
+            attempts=run.attempts + 1,
         )
+        retry_countdown = None
+        close_subtasks = job_type.subtasks_closed_on_return
+        task_error = None
         try:
             current_app.logger.debug(
                 f"Executing run {run.id} with task {task.name} and args {kwargs}"
             )
-            result = task.apply(kwargs=run.args, throw=True)
+            with (
+                run_span("execute"),
+                profile_run(run) if run.profile else nullcontext(),
+            ):
+                result = task.apply(kwargs=run.args, throw=True)
             current_app.logger.debug(
                 f"Run {run.id} executed successfully with result: {result}"
             )
         except SystemExit as e:
+            close_subtasks = True
             current_app.logger.error(
                 f"Run {run.id} was cancelled by a SystemExit exception: {e}"
             )
@@ -91,15 +371,29 @@ def execute_run(self, run_id, identity_id, kwargs=None):
                 if sentry_event_id
                 else e.message
             )
-            update_run(
+            updated = update_run(
                 run,
                 status=RunStatusEnum.CANCELLED,
                 finished_at=datetime.now(timezone.utc),
                 message=message,
             )
             # Send email notification
-            send_run_notification(run, run.job)
+            if updated:
+                schedule_run_notification(run)
             raise e
+        except RunCancelledError as e:
+            close_subtasks = True
+            current_app.logger.info(e.message)
+            updated = update_run(
+                run,
+                status=RunStatusEnum.CANCELLED,
+                finished_at=datetime.now(timezone.utc),
+                message=e.message,
+            )
+            # Send email notification
+            if updated:
+                schedule_run_notification(run)
+            return
         except (TaskExecutionPartialError, TaskExecutionError) as e:
             sentry_event_id = getattr(g, "sentry_event_id", None)
             log_message = f"Run {run.id} encountered an error: {e.message}"
@@ -113,7 +407,8 @@ def execute_run(self, run_id, identity_id, kwargs=None):
                 if sentry_event_id
                 else e.message
             )
-            update_run(
+            close_subtasks = True
+            updated = update_run(
                 run,
                 status=RunStatusEnum.PARTIAL_SUCCESS,
                 finished_at=datetime.now(timezone.utc),
@@ -121,7 +416,11 @@ def execute_run(self, run_id, identity_id, kwargs=None):
                 errored_entries=errored_entries_count,
             )
             # Send email notification
-            send_run_notification(run, run.job)
+            if updated:
+                schedule_run_notification(run)
+            else:
+                # Reported by the last subtask, when it finalizes the run
+                task_error = message
             return
         except Exception as e:
             sentry_event_id = getattr(g, "sentry_event_id", None)
@@ -133,24 +432,131 @@ def execute_run(self, run_id, identity_id, kwargs=None):
             message = f"{e.__class__.__name__}: {str(e)}\n{traceback.format_exc()}"
             if sentry_event_id:
                 message += f" Sentry Event ID: {sentry_event_id}"
-            update_run(
+            policy = job_type.retry_policy
+            # Runs starting over would count the entries of their subtasks
+            # twice, unless they continue after their checkpoint
+            retryable = job_type.resumable or not run.subtasks.count()
+            if retryable and policy and policy.should_retry(e, run.attempts):
+                retry_countdown = policy.countdown(run.attempts)
+                current_app.logger.info(
+                    f"Retrying run {run.id} in {retry_countdown:.0f}s "
+                    f"(attempt {run.attempts} of {policy.max_attempts})"
+                )
+                retry_run(run, message)
+                return
+            close_subtasks = True
+            updated = update_run(
                 run,
                 status=RunStatusEnum.FAILED,
                 finished_at=datetime.now(timezone.utc),
                 message=message,
             )
             # Send email notification
-            send_run_notification(run, run.job)
+            if updated:
+                schedule_run_notification(run)
+            else:
+                # Reported by the last subtask, when it finalizes the run
+                task_error = f"{e.__class__.__name__}: {e}"
             return
         finally:
+            # Store the timings before closing the subtasks, so that they are
+            # available when the last subtask finalizes the run.
             db.session.execute(
-                sa.update(Run).where(Run.id == run.id).values(subtasks_closed=True)
+                sa.update(Run).where(Run.id == run.id).values(timings=dict(timings))
             )
             db.session.commit()
-        update_run(
+            # The subtasks of a retried run are left open, so that they don't
+            # finalize it while it waits for its retry
+            if close_subtasks and retry_countdown is None:
+                current_runs_service.close_subtasks(
+                    system_identity, run.id, run.job_id, task_error=task_error
+                )
+            if retry_countdown is not None:
+                # Sent once the run is closed, so that the retry starts afresh
+                execute_run.apply_async(
+                    kwargs={
+                        "run_id": run_id,
+                        "identity_id": identity_id,
+                        "kwargs": kwargs,
+                    },
+                    task_id=str(run.task_id),
+                    queue=run.queue,
+                    countdown=retry_countdown,
+                )
+        # Tasks which don't check for cancellations finish their stopped run
+        updated = update_run(
             run,
-            status=RunStatusEnum.SUCCESS,
+            status=(
+                RunStatusEnum.CANCELLED
+                if run.status == RunStatusEnum.CANCELLING
+                else RunStatusEnum.SUCCESS
+            ),
             finished_at=datetime.now(timezone.utc),
         )
         # Send email notification
-        send_run_notification(run, run.job)
+        if updated:
+            schedule_run_notification(run)
+
+
+@shared_task(ignore_result=True)
+def execute_chunks(**kwargs):
+    """Process the chunks of the run being executed.
+
+    This is the task of the chunked jobs (see ``invenio_jobs.chunks``), which
+    is applied by :func:`execute_run` with the arguments of the run.
+    """
+    context = job_context.get()
+    if context is EMPTY_JOB_CTX:
+        raise RuntimeError("Chunked jobs can only be executed as part of a run.")
+    run = Run.query.filter_by(id=context["run_id"]).one()
+    current_jobs.registry.get(run.job.task).run_chunks(run, **kwargs)
+
+
+@shared_task(bind=True, ignore_result=True)
+def execute_chunk(self, run_id, job_id):
+    """Process the chunk of a subtask of a chunked run."""
+    run = Run.query.filter_by(id=run_id).one()
+    with set_job_context(
+        {
+            "run_id": str(run_id),
+            "job_id": str(job_id),
+            "identity_id": str(system_user_id),
+            "task_id": str(self.request.id),
+            "parent_task_id": (
+                str(self.request.parent_id) if self.request.parent_id else None
+            ),
+        }
+    ):
+        current_jobs.registry.get(run.job.task).run_chunk(run)
+
+
+@shared_task(bind=True, ignore_result=True)
+def dispatch_run_chunks(self, run_id, job_id):
+    """Dispatch the next chunks of a chunked run, once one of its subtasks finished.
+
+    A failure to dispatch the chunks is reported by the last subtask of the
+    run, when it finalizes the run.
+    """
+    run = Run.query.filter_by(id=run_id).one()
+    with set_job_context(
+        {
+            "run_id": str(run_id),
+            "job_id": str(job_id),
+            "identity_id": str(system_user_id),
+            "task_id": str(self.request.id),
+            "parent_task_id": (
+                str(self.request.parent_id) if self.request.parent_id else None
+            ),
+        }
+    ):
+        try:
+            current_jobs.registry.get(run.job.task).dispatch_chunks(run)
+        except Exception as e:
+            db.session.rollback()
+            current_app.logger.error(f"Run {run_id} failed to dispatch chunks: {e}")
+            current_runs_service.close_subtasks(
+                system_identity,
+                run_id,
+                job_id,
+                task_error=f"{e.__class__.__name__}: {e}",
+            )
@@ -0,0 +1,60 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Per-phase timings of runs.
+
+The timings of a run are stored on its ``timings`` column, as a mapping of span
+names to their total duration in seconds. Some spans are recorded by the module
+itself (``args``, ``queue``, ``execute`` and ``subtasks``), and job types can
+record their own while executing:
+
+.. code-block:: python
+
+    from invenio_jobs.timings import run_span
+
+    @shared_task
+    def harvest(since=None):
+        with run_span("fetch"):
+            records = fetch(since)
+        with run_span("index"):
+            index(records)
+
+Spans with the same name are summed, and spans opened outside of a run are
+no-ops.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+run_timings = ContextVar("run_timings", default=None)
+
+
+def add_span(timings, name, duration):
+    """Add a duration (in seconds) to a span."""
+    timings[name] = round(timings.get(name, 0) + duration, 6)
+
+
+@contextmanager
+def collect_run_timings(timings=None):
+    """Collect the spans recorded within the context in a dictionary."""
+    token = run_timings.set({} if timings is None else timings)
+    try:
+        yield run_timings.get()
+    finally:
+        run_timings.reset(token)
+
+
+@contextmanager
+def run_span(name):
+    """Record the duration of the block as a span of the current run."""
+    timings = run_timings.get()
+    if timings is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        add_span(timings, name, time.perf_counter() - start)
@@ -4,23 +4,42 @@
 """Utilities."""
 
 import ast
+import json
 from datetime import datetime
+from functools import lru_cache
 
 from flask import current_app, render_template
 from invenio_i18n import lazy_gettext as _
 from invenio_mail.tasks import send_email
 from jinja2.sandbox import SandboxedEnvironment
+from marshmallow import fields
 
 jinja_env = SandboxedEnvironment()
 
+TPL_CACHE_SIZE = 1024
+"""Number of compiled templates kept by ``compile_tpl_str``."""
+
+TPL_MARKERS = ("{{", "{%", "{#")
+"""Delimiters of the Jinja blocks (expressions, statements and comments)."""
+
+
+@lru_cache(maxsize=TPL_CACHE_SIZE)
+def compile_tpl_str(val):
+    """Compile a Jinja template string, caching the templates by source."""
+    return jinja_env.from_string(val)
+
 
 def eval_tpl_str(val, ctx):
     """Evaluate a Jinja template string."""
     if not isinstance(val, str):
         return val
 
-    tpl = jinja_env.from_string(val)
-    res = tpl.render(**ctx)
+    # Strings without Jinja blocks render as themselves (except for a trailing
+    # newline, which is stripped by Jinja)
+    if val.endswith("\n") or any(marker in val for marker in TPL_MARKERS):
+        res = compile_tpl_str(val).render(**ctx)
+    else:
+        res = val
 
     try:
         res = ast.literal_eval(res)
@@ -31,19 +50,25 @@ def eval_tpl_str(val, ctx):
 
 
 def walk_values(obj, transform_fn):
-    """Recursively apply a function in-place to the value of dictionary or list."""
-    if isinstance(obj, dict):
-        items = obj.items()
-    elif isinstance(obj, list):
-        items = enumerate(obj)
-    else:
+    """Apply a function in-place to the values of nested dictionaries and lists.
+
+    Nested containers are walked iteratively, so deep structures do not hit the
+    recursion limit.
+    """
+    if not isinstance(obj, (dict, list)):
         return transform_fn(obj)
 
-    for key, val in items:
-        if isinstance(val, (dict, list)):
-            walk_values(val, transform_fn)
-        else:
-            obj[key] = transform_fn(val)
+    stack = [obj]
+    while stack:
+        container = stack.pop()
+        items = (
+            container.items() if isinstance(container, dict) else enumerate(container)
+        )
+        for key, val in items:
+            if isinstance(val, (dict, list)):
+                stack.append(val)
+            else:
+                container[key] = transform_fn(val)
 
 
 def job_arg_json_dumper(obj):
@@ -54,83 +79,141 @@ def job_arg_json_dumper(obj):
     return obj
 
 
-def send_run_notification(run, job):
-    """Send email notification for a job run.
+def normalize_job_args(obj):
+    """Convert the arguments of a job run to JSON values, in a single pass.
+
+    Equivalent to a round trip through ``json.dumps`` with
+    ``job_arg_json_dumper``, but without serializing the arguments: containers
+    are only copied when some of their values change, and are shared otherwise.
+    """
+    if isinstance(obj, dict):
+        items = {
+            key if isinstance(key, str) else json.dumps(key): normalize_job_args(val)
+            for key, val in obj.items()
+        }
+        unchanged = len(items) == len(obj) and all(
+            key in obj and obj[key] is val for key, val in items.items()
+        )
+        return obj if unchanged else items
+    if isinstance(obj, (list, tuple)):
+        items = [normalize_job_args(val) for val in obj]
+        unchanged = isinstance(obj, list) and all(
+            new is old for new, old in zip(items, obj)
+        )
+        return obj if unchanged else items
+    return job_arg_json_dumper(obj)
+
+
+def is_static_schema(schema):
+    """Return whether the JSON schema of an arguments schema never changes.
+
+    The JSON schema evaluates the callable defaults and the lazy choices (e.g.
+    of a ``LazyOneOf`` validator) of the fields, so it can only be cached for
+    schemas (including their nested schemas) without any of them.
+    """
+    for field in schema.fields.values():
+        if callable(field.load_default) or callable(field.dump_default):
+            return False
+        for validator in field.validators:
+            if isinstance(getattr(type(validator), "choices", None), property):
+                return False
+        nested = field.inner if isinstance(field, fields.List) else field
+        if isinstance(nested, fields.Nested) and not is_static_schema(nested.schema):
+            return False
+    return True
+
+
+def should_send_run_notification(job, status):
+    """Check if a notification should be sent for a run of a job with a status.
 
     Args:
-        run: The Run object.
         job: The Job object associated with the run.
+        status: The RunStatusEnum of the run.
     """
-    # Check if notifications should be sent
     notifications = job.notifications or {}
-    should_send_notification = notifications.get("emails") and notifications.get(
-        "statuses"
+    if not (notifications.get("emails") and notifications.get("statuses")):
+        return False
+    return status.name in notifications["statuses"]
+
+
+def get_run_status_info(run, job):
+    """Return the status-specific content of a run notification."""
+    status_messages = {
+        "SUCCESS": {
+            "title": _("Job Completed Successfully"),
+            "summary": _("Job '{title}' has completed successfully.").format(
+                title=job.title
+            ),
+            "user_message": _(
+                "Great news! The job '{title}' has finished running and completed successfully."
+            ).format(title=job.title),
+            "action": _("You can review the results by clicking the button below."),
+            "color": "#28a745",
+        },
+        "FAILED": {
+            "title": _("Job Failed"),
+            "summary": _("Job '{title}' has failed.").format(title=job.title),
+            "user_message": _(
+                "Unfortunately, the job '{title}' encountered an error and could not complete."
+            ).format(title=job.title),
+            "action": _(
+                "Please review the details below or contact your system administrator if you need assistance."
+            ),
+            "color": "#dc3545",
+        },
+        "PARTIAL_SUCCESS": {
+            "title": _("Job Completed with Errors"),
+            "summary": _("Job '{title}' completed but encountered errors.").format(
+                title=job.title
+            ),
+            "user_message": _(
+                "The job '{title}' has finished, but some items could not be processed."
+            ).format(title=job.title),
+            "action": _(
+                "Please review which items failed and take appropriate action if needed."
+            ),
+            "color": "#ffc107",
+        },
+    }
+
+    return status_messages.get(
+        run.status.name,
+        {
+            "title": _("Job Status: {status}").format(status=run.status.name),
+            "summary": _("Job '{title}' status: {status}").format(
+                title=job.title, status=run.status.name
+            ),
+            "user_message": _("The job '{title}' has a status update: {status}").format(
+                title=job.title, status=run.status.name
+            ),
+            "action": _("Please review the details below for more information."),
+            "color": "#6c757d",
+        },
     )
-    should_send_for_status = run.status.name in notifications.get("statuses", [])
 
-    if not (should_send_notification and should_send_for_status):
-        return
 
-    try:
-        # Prepare status-specific content
-        status_messages = {
-            "SUCCESS": {
-                "title": _("Job Completed Successfully"),
-                "summary": _("Job '{title}' has completed successfully.").format(
-                    title=job.title
-                ),
-                "user_message": _(
-                    "Great news! The job '{title}' has finished running and completed successfully."
-                ).format(title=job.title),
-                "action": _("You can review the results by clicking the button below."),
-                "color": "#28a745",
-            },
-            "FAILED": {
-                "title": _("Job Failed"),
-                "summary": _("Job '{title}' has failed.").format(title=job.title),
-                "user_message": _(
-                    "Unfortunately, the job '{title}' encountered an error and could not complete."
-                ).format(title=job.title),
-                "action": _(
-                    "Please review the details below or contact your system administrator if you need assistance."
-                ),
-                "color": "#dc3545",
-            },
-            "PARTIAL_SUCCESS": {
-                "title": _("Job Completed with Errors"),
-                "summary": _("Job '{title}' completed but encountered errors.").format(
-                    title=job.title
-                ),
-                "user_message": _(
-                    "The job '{title}' has finished, but some items could not be processed."
-                ).format(title=job.title),
-                "action": _(
-                    "Please review which items failed and take appropriate action if needed."
-                ),
-                "color": "#ffc107",
-            },
-        }
+def get_run_url(run):
+    """Return the administration URL of a run."""
+    ui_url = current_app.config.get("SITE_UI_URL", "")
+    return f"{ui_url}/administration/runs/{run.id}"
 
-        status_info = status_messages.get(
-            run.status.name,
-            {
-                "title": _("Job Status: {status}").format(status=run.status.name),
-                "summary": _("Job '{title}' status: {status}").format(
-                    title=job.title, status=run.status.name
-                ),
-                "user_message": _(
-                    "The job '{title}' has a status update: {status}"
-                ).format(title=job.title, status=run.status.name),
-                "action": _("Please review the details below for more information."),
-                "color": "#6c757d",
-            },
-        )
 
-        subject = f"{status_info['title']}: {job.title}"
+def send_run_notification(run, job, recipients=None):
+    """Send email notification for a job run.
+
+    Args:
+        run: The Run object.
+        job: The Job object associated with the run.
+        recipients: The email addresses to notify. Defaults to the job's
+            notification emails.
+    """
+    if not should_send_run_notification(job, run.status):
+        return
 
-        # Generate run URL
-        ui_url = current_app.config.get("SITE_UI_URL", "")
-        run_url = f"{ui_url}/administration/runs/{run.id}"
+    recipients = recipients or job.notifications["emails"]
+    try:
+        status_info = get_run_status_info(run, job)
+        subject = f"{status_info['title']}: {job.title}"
 
         # Calculate success count for partial success
         success_count = None
@@ -148,7 +231,7 @@ def send_run_notification(run, job):
             "status_info": status_info,
             "status_color": status_info["color"],
             "title": status_info["title"],
-            "run_url": run_url,
+            "run_url": get_run_url(run),
             "success_count": success_count,
         }
 
@@ -166,16 +249,67 @@ def send_run_notification(run, job):
                 "subject": subject,
                 "html": html_body,
                 "body": body,
-                "recipients": notifications.get("emails"),
+                "recipients": recipients,
                 "sender": current_app.config.get("MAIL_DEFAULT_SENDER"),
                 "reply_to": current_app.config.get("MAIL_DEFAULT_REPLY_TO"),
             }
         )
 
         current_app.logger.info(
-            f"Sent {run.status.name} notification for run {run.id} to {', '.join(notifications.get('emails', []))}"
+            f"Sent {run.status.name} notification for run {run.id} to {', '.join(recipients)}"
         )
     except Exception as e:
         current_app.logger.error(
             f"Failed to send email notification for run {run.id}: {e}"
         )
+
+
+def send_run_notification_digest(runs, recipient):
+    """Send a single email notification summarizing several finished runs.
+
+    Args:
+        runs: The list of Run objects to include in the digest.
+        recipient: The email address to notify.
+    """
+    try:
+        entries = [
+            {
+                "job": run.job,
+                "run": run,
+                "status_info": get_run_status_info(run, run.job),
+                "run_url": get_run_url(run),
+            }
+            for run in runs
+        ]
+        title = _("{count} Job Runs Finished").format(count=len(entries))
+        template_context = {
+            "entries": entries,
+            "title": title,
+            "status_color": "#6c757d",
+        }
+
+        html_body = render_template(
+            "invenio_jobs/emails/run_notification_digest.html", **template_context
+        )
+        body = render_template(
+            "invenio_jobs/emails/run_notification_digest.txt", **template_context
+        )
+
+        send_email(
+            {
+                "subject": str(title),
+                "html": html_body,
+                "body": body,
+                "recipients": [recipient],
+                "sender": current_app.config.get("MAIL_DEFAULT_SENDER"),
+                "reply_to": current_app.config.get("MAIL_DEFAULT_REPLY_TO"),
+            }
+        )
+
+        current_app.logger.info(
+            f"Sent notification digest of {len(entries)} runs to {recipient}"
+        )
+    except Exception as e:
+        current_app.logger.error(
+            f"Failed to send email notification digest to {recipient}: {e}"
+        )
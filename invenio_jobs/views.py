@@ -4,7 +4,9 @@
 
 """InvenioRDM module for jobs management."""
 
-from flask import Blueprint
+from flask import Blueprint, abort, current_app
+
+from . import metrics
 
 blueprint = Blueprint(
     "invenio_jobs",
@@ -35,3 +37,23 @@ def create_job_logs_bp(app):
     """Create job logs blueprint."""
     ext = app.extensions["invenio-jobs"]
     return ext.job_log_resource.as_blueprint()
+
+
+def create_metrics_bp(app):
+    """Create metrics blueprint."""
+    bp = Blueprint("invenio_jobs_metrics", __name__)
+
+    @bp.route("/metrics/jobs")
+    def jobs_metrics():
+        """Expose the jobs metrics in the Prometheus text format."""
+        if not current_app.config["JOBS_METRICS_ENABLED"]:
+            abort(404)
+        if metrics.prometheus_client is None:
+            abort(404)
+        return (
+            metrics.generate_latest(),
+            200,
+            {"Content-Type": metrics.prometheus_client.CONTENT_TYPE_LATEST},
+        )
+
+    return bp
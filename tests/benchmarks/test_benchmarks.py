@@ -0,0 +1,212 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Benchmarks of the jobs hot paths.
+
+The benchmarks use ``pytest-benchmark``, and are only run once without timing
+as part of the test suite (``--benchmark-disable``). To run them and store the
+results as JSON, e.g. to compare two versions before upgrading:
+
+.. code-block:: console
+
+    $ export JOBS_BENCHMARK_SCALE=10
+    $ python -m pytest tests/benchmarks --benchmark-enable --benchmark-json=out.json
+
+``JOBS_BENCHMARK_SCALE`` multiplies the volume of the seeded data (by default
+100 jobs with 20 runs each, and a subtask tree of 100 subtasks).
+"""
+
+import logging
+import os
+import uuid
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+import sqlalchemy as sa
+from invenio_db import db
+
+from invenio_jobs.jobs import JobType
+from invenio_jobs.logging.jobs import ContextAwareOSHandler, set_job_context
+from invenio_jobs.models import Job, Run, RunStatusEnum
+from invenio_jobs.proxies import current_jobs_service, current_runs_service
+from invenio_jobs.registry import JobsRegistry
+from invenio_jobs.services.scheduler import RunScheduler
+
+SCALE = float(os.environ.get("JOBS_BENCHMARK_SCALE", 1))
+
+
+def scaled(value):
+    """Scale a volume by ``JOBS_BENCHMARK_SCALE``."""
+    return max(int(value * SCALE), 1)
+
+
+@pytest.fixture()
+def seeded(db):
+    """Seed jobs and runs in bulk."""
+    now = datetime.now(timezone.utc)
+    statuses = list(RunStatusEnum)
+    jobs, runs = [], []
+    for i in range(scaled(100)):
+        job_id = uuid.uuid4()
+        jobs.append(
+            {
+                "id": job_id,
+                "created": now,
+                "updated": now,
+                "active": True,
+                "title": f"Benchmark job {i}",
+                "task": "update_expired_embargos",
+                "default_queue": "low",
+                "schedule": {"type": "interval", "hours": 1 + i % 24},
+                "run_args": {"since": None},
+            }
+        )
+        for j in range(scaled(20)):
+            created = now - timedelta(hours=j)
+            runs.append(
+                {
+                    "id": uuid.uuid4(),
+                    "job_id": job_id,
+                    "created": created,
+                    "updated": created,
+                    "started_at": created,
+                    "finished_at": created + timedelta(minutes=5),
+                    "task_id": uuid.uuid4(),
+                    "status": statuses[j % len(statuses)],
+                    "title": f"Run {j}",
+                    "args": {"since": None},
+                    "queue": "low",
+                }
+            )
+    db.session.execute(sa.insert(Job), jobs)
+    for start in range(0, len(runs), 10_000):
+        db.session.execute(sa.insert(Run), runs[start : start + 10_000])
+    db.session.commit()
+    return SimpleNamespace(
+        job_ids=[j["id"] for j in jobs], runs=len(runs), subtasks=scaled(100)
+    )
+
+
+class StubSearchClient:
+    """Search client discarding the indexed documents."""
+
+    def index(self, index, body):
+        """Discard the document."""
+
+
+def test_jobs_search(benchmark, app, seeded, anon_identity):
+    """Search jobs and serialize the hits of a page."""
+
+    def search():
+        return current_jobs_service.search(anon_identity, {"size": 25}).to_dict()
+
+    result = benchmark(search)
+    assert len(result["hits"]["hits"]) == 25
+
+
+def test_runs_search(benchmark, app, seeded, anon_identity):
+    """Search the runs of a job and serialize the hits of a page."""
+    job_id = seeded.job_ids[0]
+
+    def search():
+        return current_runs_service.search(
+            anon_identity, job_id, {"size": 25}
+        ).to_dict()
+
+    result = benchmark(search)
+    assert result["hits"]["hits"]
+
+
+def test_job_last_runs(benchmark, app, seeded):
+    """Compute the last run per status of a job."""
+    job = db.session.get(Job, seeded.job_ids[0])
+
+    result = benchmark(lambda: job.last_runs)
+    assert result
+
+
+def test_scheduler_sync(benchmark, app, seeded):
+    """Load the schedule entries of all the active jobs."""
+    scheduler = RunScheduler(app=app.extensions["invenio-celery"].celery, lazy=True)
+
+    benchmark(scheduler.sync)
+    assert len(scheduler.entries) == len(seeded.job_ids)
+
+
+def test_subtasks_lifecycle(benchmark, app, seeded, anon_identity):
+    """Create, start and finalize subtasks of the same parent run.
+
+    The subtasks are finalized one after the other, which exercises the update
+    of the parent counters that concurrent subtasks contend on.
+    """
+    job_id = seeded.job_ids[0]
+    with patch("invenio_jobs.services.services.TaskOp"):
+        parent = current_runs_service.create(anon_identity, job_id, {"title": "P"})
+
+    def lifecycle():
+        subtasks = [
+            current_runs_service.create_subtask_run(
+                anon_identity, parent_run_id=parent.id, job_id=job_id
+            )
+            for _ in range(seeded.subtasks)
+        ]
+        for subtask in subtasks:
+            current_runs_service.start_processing_subtask(
+                anon_identity, subtask.id, job_id
+            )
+        for i, subtask in enumerate(subtasks):
+            current_runs_service.finalize_subtask(
+                anon_identity, run_id=subtask.id, job_id=job_id, success=i % 10 != 0
+            )
+
+    benchmark.pedantic(lifecycle, rounds=3, iterations=1)
+
+
+def test_registry_lookups(benchmark):
+    """Look up a job type, and validate its id, among many registered types."""
+    registry = JobsRegistry()
+    job_types = [
+        JobType.create(f"Job{i}", None, f"job_{i}", None, "", f"Job {i}")
+        for i in range(scaled(500))
+    ]
+    for job_type in job_types:
+        registry.register(job_type)
+    registry.freeze()
+    last = job_types[-1]
+
+    def lookup():
+        return registry.get_job_id(last), last.id in registry.ids, registry.schemas
+
+    job_id, registered, _ = benchmark(lookup)
+    assert job_id == last.id
+    assert registered
+
+
+def test_log_handler_emit(benchmark, app):
+    """Enrich and ship a log record to a stub search client."""
+    handler = ContextAwareOSHandler()
+    record = logging.LogRecord(
+        "invenio_jobs",
+        logging.INFO,
+        __file__,
+        1,
+        "Processed %s",
+        ("record",),
+        None,
+        func="process",
+    )
+    context = {
+        "job_id": "job",
+        "run_id": "run",
+        "identity_id": "system",
+        "task_id": "task",
+        "parent_task_id": None,
+    }
+
+    with (
+        patch("invenio_jobs.logging.jobs.current_search_client", StubSearchClient()),
+        set_job_context(context),
+    ):
+        benchmark(handler.emit, record)
@@ -16,8 +16,11 @@ from invenio_access.permissions import any_user as any_user_need
 from invenio_app.factory import create_api
 from invenio_records_permissions.generators import AnyUser, SystemProcess
 from invenio_records_permissions.policies import BasePermissionPolicy
+from mock_module.jobs import MockChunkedJob
 
+from invenio_jobs import chunks
 from invenio_jobs.api import AttrDict
+from invenio_jobs.models import Run
 from invenio_jobs.proxies import current_jobs_service
 
 
@@ -28,6 +31,7 @@ def extra_entry_points():
     return {
         "invenio_jobs.jobs": [
             "mock_module = mock_module.jobs:MockJob",
+            "mock_chunked = mock_module.jobs:MockChunkedJob",
         ],
         "invenio_celery.tasks": [
             "mock_module = mock_module.tasks",
@@ -42,10 +46,10 @@ def app_config(app_config):
     class MockPermissionPolicy(BasePermissionPolicy):
         can_search = [AnyUser(), SystemProcess()]
         can_create = [AnyUser(), SystemProcess()]
-        can_read = [AnyUser()]
-        can_update = [AnyUser()]
+        can_read = [AnyUser(), SystemProcess()]
+        can_update = [AnyUser(), SystemProcess()]
         can_delete = [AnyUser()]
-        can_stop = [AnyUser()]
+        can_stop = [AnyUser(), SystemProcess()]
 
     app_config["REST_CSRF_ENABLED"] = False
 
@@ -144,6 +148,61 @@ def jobs(db, anon_identity):
     )
 
 
+@pytest.fixture()
+def chunked_job(request, db, anon_identity, monkeypatch):
+    """A job of the mock chunked job type.
+
+    Attributes of the job type (e.g. its ``retry_policy`` or its
+    ``max_parallel_chunks``) are set by parametrizing the fixture indirectly.
+    """
+    monkeypatch.setattr(MockChunkedJob, "processed", [])
+    for name, value in getattr(request, "param", {}).items():
+        monkeypatch.setattr(MockChunkedJob, name, value)
+    job = current_jobs_service.create(
+        anon_identity,
+        {"title": "Chunked job", "task": "mock_chunked", "default_queue": "celery"},
+    )
+    return job.id
+
+
+@pytest.fixture()
+def reload_run(db):
+    """Return a function reading a run afresh from the database."""
+
+    def reload(run_id):
+        db.session.expunge_all()
+        return db.session.get(Run, run_id)
+
+    return reload
+
+
+@pytest.fixture()
+def defer_task(monkeypatch):
+    """Return a function deferring the tasks sent by a module.
+
+    The arguments of the sent tasks are recorded in the returned list, so that
+    the tests execute them later, instead of eagerly.
+    """
+
+    def defer(module, name):
+        sent = []
+
+        class DeferredTask:
+            def apply_async(self, kwargs, **celery_kwargs):
+                sent.append(kwargs)
+
+        monkeypatch.setattr(module, name, DeferredTask())
+        return sent
+
+    return defer
+
+
+@pytest.fixture()
+def sent(defer_task):
+    """The arguments of the sent subtasks of chunked runs, executed by the tests."""
+    return defer_task(chunks, "execute_chunk")
+
+
 @pytest.fixture()
 def _make_hit():
     def _make_hit(idx):
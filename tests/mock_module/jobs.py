@@ -3,6 +3,7 @@
 
 """Mock module jobs."""
 
+from invenio_jobs.chunks import ChunkedJobType
 from invenio_jobs.jobs import JobType
 
 from .tasks import mock_task
@@ -20,3 +21,39 @@ class MockJob(JobType):
     def build_task_arguments(cls, job_obj, since=None, **kwargs):
         """Mock job using only the since argument."""
         return {"since": since}
+
+
+class MockChunkedJob(ChunkedJobType):
+    """Mock job processing a range of numbers by chunks."""
+
+    description = "Processes numbers by chunks"
+    id = "mock_chunked"
+    title = "Mock chunked job"
+    max_parallel_chunks = 2
+
+    processed = []
+    failing = ()
+    flaky = ()
+
+    @classmethod
+    def build_task_arguments(cls, job_obj, since=None, **kwargs):
+        """Process the numbers from 0 to 9, by chunks of 3."""
+        return {"size": 10, "chunk_size": 3}
+
+    @classmethod
+    def iter_chunks(cls, cursor=None, size=0, chunk_size=1, **kwargs):
+        """Yield the chunks of numbers, after the cursor."""
+        for start in range(cursor or 0, size, chunk_size):
+            chunk = list(range(start, min(start + chunk_size, size)))
+            yield chunk[-1] + 1, chunk
+
+    @classmethod
+    def process_chunk(cls, chunk, **kwargs):
+        """Process a chunk, failing on the failing (or once on the flaky) numbers."""
+        if set(chunk) & set(cls.failing):
+            raise ValueError(f"Failed to process {chunk}.")
+        if flaky := set(chunk) & set(cls.flaky):
+            cls.flaky = tuple(set(cls.flaky) - flaky)
+            raise ConnectionError(f"Failed to process {chunk}, temporarily.")
+        cls.processed.extend(chunk)
+        return {"inserted_entries": len(chunk)}
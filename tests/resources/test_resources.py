@@ -43,6 +43,7 @@ def test_simple_flow(mock_apply_async, app, db, client, user):
         "run_args": None,
         "args": {},
         "schedule": {"type": "interval", "hours": 4},
+        "next_run": None,
         "created": res.json["created"],
         "updated": res.json["updated"],
         "links": {
@@ -67,6 +68,8 @@ def test_simple_flow(mock_apply_async, app, db, client, user):
     assert res.status_code == 200
     expected_job["active"] = True
     expected_job["updated"] = res.json["updated"]
+    assert res.json["next_run"] is not None
+    expected_job["next_run"] = res.json["next_run"]
     expected_job["run_args"] = {}
     expected_job["args"] = {}
 
@@ -82,6 +85,7 @@ def test_simple_flow(mock_apply_async, app, db, client, user):
                 "failed_subtasks": 0,
                 "errored_entries": 0,
                 "total_entries": 0,
+                "attempts": 0,
             },
             "last_runs": {
                 "cancelled": {},
@@ -159,16 +163,22 @@ def test_simple_flow(mock_apply_async, app, db, client, user):
         "args": {"job_arg_schema": "custom"},
         "queue": "celery",
         "parent_run_id": None,
+        "resumed_run_id": None,
         "total_subtasks": 0,
         "completed_subtasks": 0,
         "failed_subtasks": 0,
         "errored_entries": 0,
         "total_entries": 0,
+        "timings": res.json["timings"],
+        "attempts": 0,
+        "checkpoint": None,
+        "profile": False,
         "subtasks": [],
         "links": {
             "self": f"https://127.0.0.1:5000/api/jobs/{job_id}/runs/{run_id}",
             "logs": f"https://127.0.0.1:5000/api/logs/jobs?q={run_id}",
             "stop": f"https://127.0.0.1:5000/api/jobs/{job_id}/runs/{run_id}/actions/stop",
+            "tree": f"https://127.0.0.1:5000/api/jobs/{job_id}/runs/{run_id}/tree",
         },
     }
 
@@ -208,16 +218,22 @@ def test_simple_flow(mock_apply_async, app, db, client, user):
         "created": res.json["created"],
         "updated": res.json["updated"],
         "parent_run_id": None,
+        "resumed_run_id": None,
         "total_subtasks": 0,
         "completed_subtasks": 0,
         "failed_subtasks": 0,
         "errored_entries": 0,
         "total_entries": 0,
+        "timings": res.json["timings"],
+        "attempts": 0,
+        "checkpoint": None,
+        "profile": False,
         "subtasks": [],
         "links": {
             "self": f"https://127.0.0.1:5000/api/jobs/{job_id}/runs/{run_id}",
             "logs": f"https://127.0.0.1:5000/api/logs/jobs?q={run_id}",
             "stop": f"https://127.0.0.1:5000/api/jobs/{job_id}/runs/{run_id}/actions/stop",
+            "tree": f"https://127.0.0.1:5000/api/jobs/{job_id}/runs/{run_id}/tree",
         },
     }
     assert "task_id" in res.json
@@ -245,10 +261,10 @@ def test_simple_flow(mock_apply_async, app, db, client, user):
     assert res.status_code == 200
     assert res.json == list_expected_run
 
-    # Stop run
+    # Stop run (queued, so it's cancelled right away)
     res = client.post(f"/jobs/{job_id}/runs/{run_id}/actions/stop")
     assert res.status_code == 202
-    assert res.json["status"] == "CANCELLING"
+    assert res.json["status"] == "CANCELLED"
 
     # edit the job args
     job_payload["args"] = {
@@ -370,6 +386,28 @@ def test_tasks_search(client):
     assert mock_task_res == res.json["hits"]["hits"][0]
 
 
+def test_tasks_arguments(app, client):
+    """Test the arguments schema of a task, revalidated with its ETag."""
+    res = client.get("/tasks/update_expired_embargos/args")
+    assert res.status_code == 200
+    assert "since" in res.json
+    etag = res.headers["ETag"]
+
+    res = client.get("/tasks/update_expired_embargos/args")
+    assert res.headers["ETag"] == etag
+    registry = app.extensions["invenio-jobs"].registry
+    schema = registry.schemas["PredefinedArgsSchema"]
+    assert isinstance(
+        registry.cached(("arguments_schema", "update_expired_embargos"), None), schema
+    )
+
+    res = client.get(
+        "/tasks/update_expired_embargos/args", headers={"If-None-Match": etag}
+    )
+    assert res.status_code == 304
+    assert res.data == b""
+
+
 def test_jobs_create(db, client):
     """Test job creation."""
     # Test minimal job payload
@@ -392,6 +430,7 @@ def test_jobs_create(db, client):
         "run_args": None,
         "args": {},
         "schedule": None,
+        "next_run": None,
         "created": res.json["created"],
         "updated": res.json["updated"],
         "links": {
@@ -428,6 +467,7 @@ def test_jobs_create(db, client):
         "run_args": None,
         "args": {},
         "schedule": {"type": "interval", "hours": 4},
+        "next_run": None,
         "created": res.json["created"],
         "updated": res.json["updated"],
         "links": {
@@ -469,6 +509,7 @@ def test_jobs_update(db, client, jobs):
         "run_args": {},
         "args": {},
         "schedule": {"type": "interval", "hours": 2},
+        "next_run": None,
         "created": jobs.simple["created"],
         "updated": res.json["updated"],
         "links": {
@@ -510,6 +551,7 @@ def test_jobs_search(client, jobs):
             "type": "interval",
             "hours": 4,
         },
+        "next_run": jobs.interval["next_run"],
         "last_run": {
             "title": "Manual run",
             "total_subtasks": 0,
@@ -517,6 +559,7 @@ def test_jobs_search(client, jobs):
             "failed_subtasks": 0,
             "errored_entries": 0,
             "total_entries": 0,
+            "attempts": 0,
         },
         "last_runs": {
             "cancelled": {},
@@ -558,6 +601,7 @@ def test_jobs_search(client, jobs):
             "day_of_month": "*",
             "month_of_year": "*",
         },
+        "next_run": jobs.crontab["next_run"],
         "last_run": {
             "title": "Manual run",
             "total_subtasks": 0,
@@ -565,6 +609,7 @@ def test_jobs_search(client, jobs):
             "failed_subtasks": 0,
             "errored_entries": 0,
             "total_entries": 0,
+            "attempts": 0,
         },
         "last_runs": {
             "cancelled": {},
@@ -599,6 +644,7 @@ def test_jobs_search(client, jobs):
         "run_args": None,
         "args": {},
         "schedule": None,
+        "next_run": None,
         "last_run": {
             "title": "Manual run",
             "total_subtasks": 0,
@@ -606,6 +652,7 @@ def test_jobs_search(client, jobs):
             "failed_subtasks": 0,
             "errored_entries": 0,
             "total_entries": 0,
+            "attempts": 0,
         },
         "last_runs": {
             "cancelled": {},
@@ -737,6 +784,7 @@ def test_job_template_args(mock_apply_async, app, db, client, user):
             "self": f"https://127.0.0.1:5000/api/jobs/{job_id}/runs/{run_id}",
             "logs": f"https://127.0.0.1:5000/api/logs/jobs?q={run_id}",
             "stop": f"https://127.0.0.1:5000/api/jobs/{job_id}/runs/{run_id}/actions/stop",
+            "tree": f"https://127.0.0.1:5000/api/jobs/{job_id}/runs/{run_id}/tree",
         },
     }
     assert res.json == expected_run
@@ -779,6 +827,7 @@ def test_job_template_args(mock_apply_async, app, db, client, user):
             "self": f"https://127.0.0.1:5000/api/jobs/{job_id}/runs/{run_id}",
             "logs": f"https://127.0.0.1:5000/api/logs/jobs?q={run_id}",
             "stop": f"https://127.0.0.1:5000/api/jobs/{job_id}/runs/{run_id}/actions/stop",
+            "tree": f"https://127.0.0.1:5000/api/jobs/{job_id}/runs/{run_id}/tree",
         },
     }
     assert res.json == expected_run
@@ -0,0 +1,84 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Tests for the cooperative cancellation of runs."""
+
+import pytest
+from invenio_access.permissions import system_identity
+from mock_module.jobs import MockChunkedJob
+
+from invenio_jobs.logging.jobs import job_context
+from invenio_jobs.models import Run, RunStatusEnum
+from invenio_jobs.proxies import current_runs_service
+
+
+@pytest.fixture()
+def stopping_chunks(app, monkeypatch):
+    """Stop the runs of the mock chunked job type on the number 1."""
+    monkeypatch.setitem(app.config, "JOBS_RUNS_CANCELLATION_CHECK_INTERVAL", 0)
+    process_chunk = MockChunkedJob.process_chunk
+
+    def stopping_process_chunk(chunk, **kwargs):
+        counters = process_chunk(chunk, **kwargs)
+        if 1 in chunk:
+            run = Run.query.filter_by(id=job_context.get()["run_id"]).one()
+            run = run.parent_run or run
+            current_runs_service.stop(system_identity, run.job_id, run.id)
+        return counters
+
+    monkeypatch.setattr(MockChunkedJob, "process_chunk", stopping_process_chunk)
+
+
+@pytest.mark.parametrize("chunked_job", [{"max_parallel_chunks": 0}], indirect=True)
+def test_cancel_inline(
+    app, db, anon_identity, chunked_job, stopping_chunks, reload_run
+):
+    """Runs stop processing chunks once they are stopped."""
+    res = current_runs_service.create(anon_identity, chunked_job, {})
+    run = reload_run(res.id)
+    assert run.status == RunStatusEnum.CANCELLED
+    assert run.finished_at
+    assert MockChunkedJob.processed == [0, 1, 2]
+    assert run.checkpoint == 3
+
+
+def test_cancel_subtasks(
+    app, db, anon_identity, chunked_job, stopping_chunks, reload_run
+):
+    """Stopping a run cancels its subtasks, and no more chunks are dispatched."""
+    res = current_runs_service.create(anon_identity, chunked_job, {})
+    run = reload_run(res.id)
+    assert run.status == RunStatusEnum.CANCELLED
+    assert MockChunkedJob.processed == [0, 1, 2]
+    assert run.total_subtasks == 2
+
+    # The subtask which stopped the run processed its chunk, but stays
+    # cancelled and doesn't report to the run, and the other one was cancelled
+    # before processing it
+    subtasks = run.subtasks.order_by(Run.created).all()
+    assert [subtask.status for subtask in subtasks] == [
+        RunStatusEnum.CANCELLED,
+        RunStatusEnum.CANCELLED,
+    ]
+    assert (run.completed_subtasks, run.inserted_entries) == (0, 0)
+
+
+def test_stop_queued(app, db, anon_identity, jobs, reload_run):
+    """Queued runs, and their queued subtasks, are cancelled right away."""
+    run = Run(job_id=jobs.simple.id, status=RunStatusEnum.QUEUED, queue="celery")
+    db.session.add(run)
+    db.session.flush()
+    subtask = Run(
+        job_id=jobs.simple.id,
+        status=RunStatusEnum.QUEUED,
+        queue="celery",
+        parent_run_id=run.id,
+    )
+    db.session.add(subtask)
+    db.session.commit()
+    run_id, subtask_id = run.id, subtask.id
+
+    res = current_runs_service.stop(anon_identity, jobs.simple.id, run_id)
+    assert res.data["status"] == "CANCELLED"
+    assert reload_run(run_id).finished_at
+    assert reload_run(subtask_id).status == RunStatusEnum.CANCELLED
@@ -0,0 +1,178 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Tests for the chunked execution of jobs."""
+
+import pytest
+from invenio_access.permissions import system_user_id
+from mock_module.jobs import MockChunkedJob
+
+from invenio_jobs import chunks
+from invenio_jobs.models import Run, RunStatusEnum
+from invenio_jobs.proxies import current_runs_service
+from invenio_jobs.tasks import dispatch_run_chunks, execute_chunk, execute_run
+
+
+@pytest.mark.parametrize("chunked_job", [{"max_parallel_chunks": 0}], indirect=True)
+def test_chunks_inline(app, db, anon_identity, chunked_job, reload_run, monkeypatch):
+    """Chunks are processed by the run, which resumes from its checkpoint."""
+    monkeypatch.setattr(MockChunkedJob, "failing", (7,))
+
+    res = current_runs_service.create(anon_identity, chunked_job, {})
+    run = reload_run(res.id)
+    assert run.status == RunStatusEnum.FAILED
+    assert run.checkpoint == 6
+    assert (run.inserted_entries, run.total_entries) == (6, 6)
+    assert run.subtasks.count() == 0
+
+    # Finished runs are not executed again
+    execute_run.apply(kwargs={"run_id": res.id, "identity_id": system_user_id})
+    run = reload_run(res.id)
+    assert run.status == RunStatusEnum.FAILED
+
+    # The run is executed again, after the last processed chunk
+    monkeypatch.setattr(MockChunkedJob, "failing", ())
+    run.status = RunStatusEnum.QUEUED
+    db.session.commit()
+    execute_run.apply(kwargs={"run_id": res.id, "identity_id": system_user_id})
+    run = reload_run(res.id)
+    assert run.status == RunStatusEnum.SUCCESS
+    assert run.checkpoint == 10
+    assert (run.inserted_entries, run.total_entries) == (10, 10)
+    assert MockChunkedJob.processed == list(range(10))
+
+
+def test_chunks_subtasks(app, db, anon_identity, chunked_job, reload_run, monkeypatch):
+    """Chunks are fanned out as subtasks, which report their counters."""
+    res = current_runs_service.create(anon_identity, chunked_job, {})
+    run = reload_run(res.id)
+    assert run.status == RunStatusEnum.SUCCESS
+    assert run.checkpoint == 10
+    assert (run.total_subtasks, run.completed_subtasks) == (4, 4)
+    assert (run.inserted_entries, run.total_entries) == (10, 10)
+    assert [subtask.args for subtask in run.subtasks.order_by(Run.created)] == [
+        {"chunk": [0, 1, 2]},
+        {"chunk": [3, 4, 5]},
+        {"chunk": [6, 7, 8]},
+        {"chunk": [9]},
+    ]
+    assert sorted(MockChunkedJob.processed) == list(range(10))
+
+    # Runs with failed chunks succeed partially
+    monkeypatch.setattr(MockChunkedJob, "failing", (4,))
+    res = current_runs_service.create(anon_identity, chunked_job, {})
+    run = reload_run(res.id)
+    assert run.status == RunStatusEnum.PARTIAL_SUCCESS
+    assert (run.completed_subtasks, run.failed_subtasks) == (4, 1)
+    assert run.inserted_entries == 7
+
+
+def test_chunks_subtasks_resume(app, db, anon_identity, chunked_job, reload_run):
+    """Resumed runs send the subtasks left queued again, and continue after them."""
+    res = current_runs_service.create(anon_identity, chunked_job, {})
+    run = reload_run(res.id)
+    # As if the run had been interrupted after dispatching its second chunk
+    run.status = RunStatusEnum.RUNNING
+    subtask = run.subtasks.order_by(Run.created).all()[1]
+    subtask.status = RunStatusEnum.QUEUED
+    run.checkpoint = 6
+    run.completed_subtasks = 1
+    run.inserted_entries = run.total_entries = 3
+    for later in run.subtasks.order_by(Run.created).all()[2:]:
+        db.session.delete(later)
+    run.total_subtasks = 2
+    db.session.commit()
+    MockChunkedJob.processed.clear()
+
+    execute_run.apply(kwargs={"run_id": res.id, "identity_id": system_user_id})
+    run = reload_run(res.id)
+    assert run.status == RunStatusEnum.SUCCESS
+    assert MockChunkedJob.processed == [3, 4, 5, 6, 7, 8, 9]
+    assert (run.total_subtasks, run.completed_subtasks) == (4, 4)
+    assert (run.inserted_entries, run.total_entries) == (10, 10)
+
+
+def test_chunks_subtasks_db_error(
+    app, db, anon_identity, chunked_job, reload_run, monkeypatch
+):
+    """Subtasks failing on a database error are still reported as failed."""
+    process_chunk = MockChunkedJob.process_chunk
+
+    def failing_process_chunk(chunk, **kwargs):
+        if 4 in chunk:
+            db.session.add(Run(job_id=chunked_job))  # Missing queue
+            db.session.flush()
+        return process_chunk(chunk, **kwargs)
+
+    monkeypatch.setattr(MockChunkedJob, "process_chunk", failing_process_chunk)
+    res = current_runs_service.create(anon_identity, chunked_job, {})
+    run = reload_run(res.id)
+    assert run.status == RunStatusEnum.PARTIAL_SUCCESS
+    assert (run.completed_subtasks, run.failed_subtasks) == (4, 1)
+
+
+def test_chunks_subtasks_deferred(
+    app, db, anon_identity, chunked_job, sent, reload_run, monkeypatch
+):
+    """Subtasks finishing after the run's task returned report its failure."""
+    iter_chunks = MockChunkedJob.iter_chunks
+
+    def failing_iter_chunks(cursor=None, **kwargs):
+        for chunk_cursor, chunk in iter_chunks(cursor=cursor, **kwargs):
+            if 6 in chunk:
+                raise RuntimeError("Index unavailable.")
+            yield chunk_cursor, chunk
+
+    monkeypatch.setattr(MockChunkedJob, "iter_chunks", failing_iter_chunks)
+    res = current_runs_service.create(anon_identity, chunked_job, {})
+    run = reload_run(res.id)
+    # The chunks iterated before the error were dispatched
+    assert run.status == RunStatusEnum.RUNNING
+    assert run.subtasks_closed
+    assert run.checkpoint == 6
+    assert len(sent) == 2
+
+    for kwargs in sent:
+        execute_chunk.apply(kwargs=kwargs)
+    run = reload_run(res.id)
+    assert run.status == RunStatusEnum.PARTIAL_SUCCESS
+    assert "RuntimeError: Index unavailable." in run.message
+    assert run.finished_at
+    assert (run.completed_subtasks, run.failed_subtasks) == (2, 0)
+    assert MockChunkedJob.processed == [0, 1, 2, 3, 4, 5]
+
+
+def test_chunks_subtasks_dispatch(
+    app, db, anon_identity, chunked_job, sent, reload_run
+):
+    """The next chunks are dispatched by the subtasks, as they finish."""
+    res = current_runs_service.create(anon_identity, chunked_job, {})
+    assert len(sent) == 2
+    assert not reload_run(res.id).subtasks_closed
+
+    while sent:
+        execute_chunk.apply(kwargs=sent.pop(0))
+        run = reload_run(res.id)
+        assert run.subtasks.filter(Run.status == RunStatusEnum.QUEUED).count() <= 2
+    assert run.status == RunStatusEnum.SUCCESS
+    assert (run.total_subtasks, run.completed_subtasks) == (4, 4)
+    assert MockChunkedJob.processed == list(range(10))
+
+
+def test_chunks_subtasks_deferred_dispatch(
+    app, db, anon_identity, chunked_job, defer_task, reload_run
+):
+    """Runs whose subtasks finished before the next chunks are not finalized."""
+    dispatches = defer_task(chunks, "dispatch_run_chunks")
+    res = current_runs_service.create(anon_identity, chunked_job, {})
+    run = reload_run(res.id)
+    assert run.status == RunStatusEnum.RUNNING
+    assert (run.completed_subtasks, run.checkpoint) == (2, 6)
+    assert not run.subtasks_closed
+
+    while dispatches:
+        dispatch_run_chunks.apply(kwargs=dispatches.pop(0))
+    run = reload_run(res.id)
+    assert run.status == RunStatusEnum.SUCCESS
+    assert (run.total_subtasks, run.completed_subtasks) == (4, 4)
+    assert sorted(MockChunkedJob.processed) == list(range(10))
@@ -11,9 +11,11 @@ from invenio_jobs.cli import (
     list_job_types,
     list_jobs,
     print_run_log,
+    print_run_tree,
     schedule_job,
     update_job,
 )
+from invenio_jobs.models import Run
 from invenio_jobs.proxies import current_jobs_logs_service
 
 
@@ -42,6 +44,7 @@ def test_jobs_cli(monkeypatch, app, client, _make_hit, FakeSearch):
         "┃ Title                   ┃ Task name               ┃\n"
         "┡━━━━━━━━━━━━━━━━━━━━━━━━━╇━━━━━━━━━━━━━━━━━━━━━━━━━┩\n"
         "│ Update expired embargos │ update_expired_embargos │\n"
+        "│ Mock chunked job        │ mock_chunked            │\n"
         "└─────────────────────────┴─────────────────────────┘\n"
     )
 
@@ -143,3 +146,24 @@ def test_update_job(app):
     runner = app.test_cli_runner()
     result = runner.invoke(update_job, args="jobid")
     assert result.exit_code == 0
+
+
+def test_print_run_tree(app, db, jobs):
+    """Print the tree of the subtasks of a run."""
+    root = Run(job_id=jobs.simple.id, queue="celery", title="root")
+    child = Run(
+        job_id=jobs.simple.id,
+        queue="celery",
+        title="child",
+        parent_run=root,
+        total_entries=4,
+    )
+    db.session.add_all([root, child])
+    db.session.commit()
+
+    runner = app.test_cli_runner()
+    result = runner.invoke(print_run_tree, args=[str(root.id)])
+    assert result.exit_code == 0
+    assert "root" in result.output
+    assert "  child" in result.output
+    assert "0/4" in result.output
@@ -0,0 +1,103 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Tests for the facets of searches."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from marshmallow import ValidationError
+
+from invenio_jobs.models import Run, RunStatusEnum
+from invenio_jobs.proxies import current_jobs_service, current_runs_service
+
+
+def _buckets(res, name):
+    return {
+        bucket["key"]: (bucket["doc_count"], bucket["is_selected"])
+        for bucket in res["aggregations"][name]["buckets"]
+    }
+
+
+def test_jobs_facets(app, anon_identity, jobs):
+    """Jobs are aggregated and filtered by their state, queue and task."""
+    res = current_jobs_service.search(anon_identity, {}).to_dict()
+    assert _buckets(res, "active") == {"true": (3, False)}
+    assert _buckets(res, "task") == {"update_expired_embargos": (3, False)}
+    assert res["aggregations"]["active"]["buckets"][0]["label"] == "Active"
+
+    params = {"facets": {"active": ["false"]}}
+    res = current_jobs_service.search(anon_identity, params).to_dict()
+    assert res["hits"]["total"] == 0
+    # Aggregations count the jobs regardless of the selected values
+    assert _buckets(res, "active") == {"true": (3, False)}
+
+    with pytest.raises(ValidationError):
+        current_jobs_service.search(anon_identity, {"facets": {"active": ["maybe"]}})
+
+
+def test_runs_facets(app, db, anon_identity, user, jobs):
+    """Runs are aggregated and filtered by status, user and creation time."""
+    job_id = jobs.simple.id
+    now = datetime.now(timezone.utc)
+    db.session.add_all(
+        [
+            Run(job_id=job_id, status=RunStatusEnum.SUCCESS, queue="low"),
+            Run(
+                job_id=job_id,
+                status=RunStatusEnum.FAILED,
+                started_by_id=user.id,
+                queue="celery",
+            ),
+            Run(
+                job_id=job_id,
+                status=RunStatusEnum.FAILED,
+                created=now - timedelta(days=3),
+                queue="celery",
+            ),
+        ]
+    )
+    db.session.commit()
+
+    res = current_runs_service.search(anon_identity, job_id, {}).to_dict()
+    assert _buckets(res, "status") == {"FAILED": (2, False), "SUCCESS": (1, False)}
+    assert _buckets(res, "queue") == {"celery": (2, False), "low": (1, False)}
+    assert _buckets(res, "created") == {
+        "day": (2, False),
+        "week": (3, False),
+        "month": (3, False),
+    }
+    started_by = res["aggregations"]["started_by"]["buckets"]
+    assert started_by == [
+        {
+            "key": str(user.id),
+            "doc_count": 1,
+            "label": user.email,
+            "is_selected": False,
+        }
+    ]
+
+    params = {"facets": {"status": ["FAILED"], "created": ["day"]}}
+    res = current_runs_service.search(anon_identity, job_id, params).to_dict()
+    assert res["hits"]["total"] == 1
+    assert res["hits"]["hits"][0]["started_by_id"] == int(user.id)
+    assert _buckets(res, "status")["FAILED"] == (2, True)
+
+    # Pages following a cursor are not aggregated again
+    params = {"size": 1, "after": ""}
+    res = current_runs_service.search(anon_identity, job_id, params).to_dict()
+    assert "aggregations" in res
+    params["after"] = res["hits"]["after"]
+    res = current_runs_service.search(anon_identity, job_id, params).to_dict()
+    assert "aggregations" not in res
+
+
+def test_facets_request_args(app, client, jobs):
+    """Facets are selected through the query string."""
+    res = client.get("/jobs?active=true&task=update_expired_embargos")
+    assert res.status_code == 200
+    assert res.json["hits"]["total"] == 3
+    assert res.json["aggregations"]["active"]["buckets"][0]["is_selected"]
+
+    res = client.get(f"/jobs/{jobs.simple.id}/runs?status=UNKNOWN")
+    assert res.status_code == 400
@@ -3,9 +3,15 @@
 
 """Module tests."""
 
+from unittest.mock import patch
+
+import pytest
 from flask import Flask
 
 from invenio_jobs import InvenioJobs
+from invenio_jobs.jobs import JobType, PredefinedArgsSchema
+from invenio_jobs.models import Job, Run, RunStatusEnum
+from invenio_jobs.registry import JobsRegistry
 
 
 def test_version():
@@ -26,3 +32,42 @@ def test_init():
     assert "invenio-jobs" not in app.extensions
     ext.init_app(app)
     assert "invenio-jobs" in app.extensions
+
+
+def test_registry():
+    """Test the registry lookups, before and after it is frozen."""
+    registry = JobsRegistry()
+    job = JobType.create(
+        "CustomJob", PredefinedArgsSchema, "custom_job", None, "", "Custom job"
+    )
+    registry.register(job)
+    assert registry.get_job_id(job) == "custom_job"
+    assert "custom_job" in registry.ids
+    assert registry.schemas == {"PredefinedArgsSchema": PredefinedArgsSchema}
+
+    registry.freeze()
+    assert registry.get("custom_job") is job
+    with pytest.raises(RuntimeError):
+        registry.register(job, job_id="other_job")
+    with pytest.raises(KeyError):
+        registry.get_job_id(object())
+
+
+def test_default_args_cache(app, db, jobs, monkeypatch):
+    """Default arguments are computed once per revision of a job, if cacheable."""
+    job = db.session.get(Job, jobs.simple.id)
+    job_type = app.extensions["invenio-jobs"].registry.get(job.task)
+    with patch.object(Job, "default_args", property(lambda job: {"since": None})):
+        assert job.default_args_json == '{"since": null}'
+        assert job.normalized_default_args is not job.normalized_default_args
+
+        monkeypatch.setattr(job_type, "cache_default_args", True)
+        assert job.normalized_default_args is job.normalized_default_args
+
+    # A new successful run is a new revision
+    run = Run(job_id=job.id, status=RunStatusEnum.SUCCESS, queue="low")
+    db.session.add(run)
+    db.session.commit()
+    run.started_at = run.created
+    db.session.commit()
+    assert job.normalized_default_args == {"since": run.started_at.isoformat()}
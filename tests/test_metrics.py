@@ -0,0 +1,74 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Tests for the jobs metrics."""
+
+from prometheus_client import REGISTRY
+
+from invenio_jobs.models import Run
+from invenio_jobs.proxies import current_runs_service
+
+
+def _sample(name, **labels):
+    """Return the sum of the metric samples matching the labels."""
+    return sum(
+        sample.value
+        for metric in REGISTRY.collect()
+        for sample in metric.samples
+        if sample.name == name and labels.items() <= sample.labels.items()
+    )
+
+
+def test_run_metrics(app, db, anon_identity, jobs):
+    """Executing runs and finalizing subtasks updates the metrics."""
+    task = jobs.simple.data["task"]
+    finished = _sample("invenio_jobs_runs_finished_total", task=task)
+    subtasks = _sample(
+        "invenio_jobs_subtasks_finalized_total", task=task, status="FAILED"
+    )
+
+    # Executed eagerly
+    parent_run = current_runs_service.create(
+        anon_identity, jobs.simple.id, {"title": "Parent run"}
+    )
+    status = db.session.get(Run, parent_run.id).status.name
+    assert (
+        _sample("invenio_jobs_runs_finished_total", task=task, status=status)
+        == finished + 1
+    )
+    assert _sample("invenio_jobs_run_duration_seconds_count", task=task, status=status)
+    assert _sample(
+        "invenio_jobs_run_queue_wait_seconds_count",
+        task=task,
+        queue=parent_run.data["queue"],
+    )
+
+    subtask = current_runs_service.create_subtask_run(
+        anon_identity, parent_run_id=parent_run.id, job_id=jobs.simple.id
+    )
+    current_runs_service.start_processing_subtask(
+        anon_identity, subtask.id, jobs.simple.id
+    )
+    current_runs_service.finalize_subtask(
+        anon_identity, run_id=subtask.id, job_id=jobs.simple.id, success=False
+    )
+    assert (
+        _sample("invenio_jobs_subtasks_finalized_total", task=task, status="FAILED")
+        == subtasks + 1
+    )
+
+
+def test_metrics_endpoint(app, db, client, jobs):
+    """The scrape endpoint is only available when enabled."""
+    assert client.get("/metrics/jobs").status_code == 404
+
+    app.config["JOBS_METRICS_ENABLED"] = True
+    try:
+        res = client.get("/metrics/jobs")
+    finally:
+        app.config["JOBS_METRICS_ENABLED"] = False
+
+    assert res.status_code == 200
+    body = res.get_data(as_text=True)
+    assert "invenio_jobs_runs_finished_total" in body
+    assert 'invenio_jobs_runs{status="QUEUED"}' in body
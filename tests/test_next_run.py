@@ -0,0 +1,63 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Tests for the persisted next run time of scheduled jobs."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+from invenio_jobs.models import Job
+from invenio_jobs.proxies import current_jobs_service
+from invenio_jobs.services.scheduler import JobEntry, RunScheduler
+
+
+def test_next_run_at(app, db, anon_identity, jobs):
+    """The next run time follows the schedule and the state of the job."""
+    now = datetime.now(timezone.utc)
+    interval = db.session.get(Job, jobs.interval.id)
+    assert now + timedelta(hours=3) < interval.next_run_at < (now + timedelta(hours=5))
+    crontab = db.session.get(Job, jobs.crontab.id)
+    assert crontab.next_run_at.time() == datetime.min.time()
+    assert db.session.get(Job, jobs.simple.id).next_run_at is None
+
+    # Deactivating a job unschedules it
+    data = {
+        "title": "Test interval job",
+        "task": "update_expired_embargos",
+        "schedule": {"type": "interval", "hours": 4},
+        "active": False,
+    }
+    res = current_jobs_service.update(anon_identity, jobs.interval.id, data)
+    assert res.data["next_run"] is None
+
+    # Jobs which never ran are listed last
+    res = current_jobs_service.search(
+        anon_identity, {"sort": "next_run", "sort_direction": "asc"}
+    ).to_dict()
+    assert [hit["id"] for hit in res["hits"]["hits"]][0] == jobs.crontab.id
+
+
+def test_scheduler_next_run_at(app, db, jobs):
+    """The scheduler uses and maintains the next run time of the jobs."""
+    job = db.session.get(Job, jobs.interval.id)
+    job.next_run_at = None
+    db.session.commit()
+
+    celery = app.extensions["invenio-celery"].celery
+    scheduler = RunScheduler(app=celery, lazy=True)
+    # The Celery app is shared, and bound to the application of the first test
+    with patch.object(celery, "flask_app", app):
+        scheduler.sync()
+    # Jobs without a next run time are backfilled
+    job = db.session.get(Job, jobs.interval.id)
+    assert job.next_run_at is not None
+    entry = scheduler.entries[job.id]
+    assert not entry.is_due().is_due
+
+    entry.next_run_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+    assert entry.is_due().is_due
+
+    previous = job.next_run_at
+    run = scheduler.create_run(entry)
+    assert run.job.next_run_at > previous
+    assert isinstance(next(entry), JobEntry)
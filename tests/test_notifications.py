@@ -0,0 +1,120 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Tests for run email notifications."""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+from invenio_jobs.models import Job, Run, RunStatusEnum
+from invenio_jobs.proxies import current_runs_service
+from invenio_jobs.tasks import send_run_notifications
+
+
+def _enable_notifications(db, job_id, statuses):
+    """Enable email notifications on a job."""
+    job = db.session.get(Job, job_id)
+    job.notifications = {"emails": ["admin@example.org"], "statuses": statuses}
+    db.session.commit()
+    return job
+
+
+def _finished_run(db, job, status, finished_at):
+    """Create a finished top-level run."""
+    run = Run.create(
+        job=job,
+        id=str(uuid.uuid4()),
+        task_id=str(uuid.uuid4()),
+        status=status,
+        finished_at=finished_at,
+    )
+    db.session.add(run)
+    db.session.commit()
+    return run
+
+
+@patch("invenio_jobs.utils.render_template")
+@patch("invenio_jobs.utils.send_email")
+def test_finalize_subtask_notifies_after_commit(
+    mock_send_email, mock_render_template, app, db, anon_identity, jobs
+):
+    """Finalizing the last subtask sends one notification for the parent run."""
+    parent_run = current_runs_service.create(
+        anon_identity, jobs.simple.id, {"title": "Parent run"}
+    )
+    subtask = current_runs_service.create_subtask_run(
+        anon_identity, parent_run_id=parent_run.id, job_id=jobs.simple.id
+    )
+    _enable_notifications(db, jobs.simple.id, ["SUCCESS"])
+    current_runs_service.start_processing_subtask(
+        anon_identity, subtask.id, jobs.simple.id
+    )
+    mock_send_email.reset_mock()
+
+    current_runs_service.finalize_subtask(
+        anon_identity, run_id=subtask.id, job_id=jobs.simple.id, success=True
+    )
+
+    assert mock_send_email.call_count == 1
+    email = mock_send_email.call_args[0][0]
+    assert email["recipients"] == ["admin@example.org"]
+    assert email["subject"] == "Job Completed Successfully: Test unscheduled job"
+    assert str(mock_render_template.call_args.kwargs["run"].id) == parent_run.id
+
+
+@patch("invenio_jobs.utils.render_template")
+@patch("invenio_jobs.utils.send_email")
+def test_notifications_digest(mock_send_email, mock_render_template, app, db, jobs):
+    """Runs finishing within the same window are sent as one email."""
+    app.config["JOBS_NOTIFICATIONS_DIGEST_WINDOW"] = 300
+    try:
+        interval_job = _enable_notifications(db, jobs.interval.id, ["FAILED"])
+        crontab_job = _enable_notifications(db, jobs.crontab.id, ["FAILED"])
+
+        window_start = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+        runs = [
+            # Finished in the previous window
+            _finished_run(
+                db,
+                interval_job,
+                RunStatusEnum.FAILED,
+                window_start - timedelta(seconds=10),
+            ),
+            _finished_run(
+                db,
+                interval_job,
+                RunStatusEnum.FAILED,
+                window_start + timedelta(seconds=10),
+            ),
+            _finished_run(
+                db,
+                crontab_job,
+                RunStatusEnum.FAILED,
+                window_start + timedelta(seconds=20),
+            ),
+            # Not notified for this status
+            _finished_run(
+                db,
+                crontab_job,
+                RunStatusEnum.SUCCESS,
+                window_start + timedelta(seconds=30),
+            ),
+        ]
+        mock_send_email.reset_mock()
+        mock_render_template.reset_mock()
+
+        for run in runs:
+            send_run_notifications(str(run.id))
+    finally:
+        app.config["JOBS_NOTIFICATIONS_DIGEST_WINDOW"] = 0
+
+    # The first run is alone in its window, the next two are coalesced
+    assert mock_send_email.call_count == 2
+    single, digest = [c.args[0] for c in mock_send_email.call_args_list]
+    assert single["subject"] == "Job Failed: Test interval job"
+    assert digest["subject"] == "2 Job Runs Finished"
+    assert digest["recipients"] == ["admin@example.org"]
+
+    entries = mock_render_template.call_args.kwargs["entries"]
+    assert [e["run"].id for e in entries] == [runs[1].id, runs[2].id]
@@ -0,0 +1,66 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Tests for the keyset pagination of searches."""
+
+from unittest.mock import patch
+
+from invenio_jobs.models import Run
+from invenio_jobs.proxies import current_runs_service
+
+
+def test_runs_keyset_pagination(app, db, client, anon_identity, jobs):
+    """Runs are paged through with a cursor, without counting the total."""
+    job_id = jobs.simple.id
+    with patch("invenio_jobs.services.services.TaskOp"):
+        for i in range(5):
+            current_runs_service.create(anon_identity, job_id, {"title": f"Run {i}"})
+    expected = [
+        str(run.id)
+        for run in sorted(
+            Run.query.filter_by(job_id=job_id),
+            key=lambda run: (run.created, run.id),
+            reverse=True,
+        )
+    ]
+
+    seen = []
+    after = ""
+    while after is not None:
+        res = client.get(f"/jobs/{job_id}/runs?size=2&after={after}")
+        assert res.status_code == 200
+        assert res.json["hits"]["total"] is None
+        assert "page" not in res.json
+        assert "prev" not in res.json["links"]
+        seen.extend(hit["id"] for hit in res.json["hits"]["hits"])
+        after = res.json["hits"]["after"]
+        if after:
+            assert f"after={after}" in res.json["links"]["next"]
+        else:
+            assert "next" not in res.json["links"]
+    assert seen == expected
+
+    res = current_runs_service.search(
+        anon_identity,
+        job_id,
+        {"size": 2, "after": "", "total": True, "sort_direction": "asc"},
+    ).to_dict()
+    assert res["hits"]["total"] == 5
+    assert [hit["id"] for hit in res["hits"]["hits"]] == expected[::-1][:2]
+
+    res = client.get(f"/jobs/{job_id}/runs?after=invalid")
+    assert res.status_code == 400
+
+
+def test_jobs_keyset_pagination(app, db, client, jobs):
+    """Jobs are paged through with a cursor as well."""
+    res = client.get("/jobs?size=2&after=")
+    assert res.status_code == 200
+    first = [hit["id"] for hit in res.json["hits"]["hits"]]
+    assert len(first) == 2
+
+    res = client.get(f"/jobs?size=2&after={res.json['hits']['after']}")
+    assert res.status_code == 200
+    second = [hit["id"] for hit in res.json["hits"]["hits"]]
+    assert second
+    assert not set(first) & set(second)
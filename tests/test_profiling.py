@@ -0,0 +1,54 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Tests for the on-demand profiling of runs."""
+
+import marshal
+from unittest.mock import patch
+
+from mock_module.tasks import mock_task
+
+from invenio_jobs.models import Run
+from invenio_jobs.proxies import current_runs_service
+
+
+def _work(**kwargs):
+    """Task body doing some work."""
+    return sorted(range(1000), reverse=True)
+
+
+def test_run_profile(app, db, client, jobs, anon_identity):
+    """A run created with the profile flag stores downloadable statistics."""
+    job_id = jobs.simple.id
+
+    res = client.post(f"/jobs/{job_id}/runs", json={"title": "Unprofiled run"})
+    assert res.status_code == 201
+    assert res.json["profile"] is False
+    res = client.get(f"/jobs/{job_id}/runs/{res.json['id']}/profile")
+    assert res.status_code == 404
+
+    with patch.object(mock_task, "run", side_effect=_work):
+        res = client.post(
+            f"/jobs/{job_id}/runs", json={"title": "Profiled run", "profile": True}
+        )
+    assert res.status_code == 201
+    run_id = res.json["id"]
+    assert db.session.get(Run, run_id).profile_stats is not None
+
+    res = client.get(f"/jobs/{job_id}/runs/{run_id}/profile")
+    assert res.status_code == 200
+    assert res.mimetype == "application/octet-stream"
+    stats = marshal.loads(res.data)
+    assert any(func[2] == "_work" for func in stats)
+
+    res = client.get(f"/jobs/{job_id}/runs/{run_id}/profile?format=text&limit=5")
+    assert res.status_code == 200
+    assert "function calls" in res.get_data(as_text=True)
+
+    res = client.get(f"/jobs/{job_id}/runs/{run_id}/profile?sort=invalid")
+    assert res.status_code == 400
+
+    # Updates keep the profile flag
+    current_runs_service.update(anon_identity, job_id, run_id, {"title": "Renamed"})
+    db.session.expunge_all()
+    assert db.session.get(Run, run_id).profile is True
@@ -0,0 +1,68 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Tests for the rate limits of the job types."""
+
+import pytest
+from mock_module.jobs import MockChunkedJob
+from sqlalchemy.exc import OperationalError
+
+from invenio_jobs import ratelimits
+from invenio_jobs.errors import RateLimitExceededError
+from invenio_jobs.models import RateLimitBucket
+from invenio_jobs.ratelimits import (
+    DatabaseRateLimitBackend,
+    LocalRateLimitBackend,
+    RateLimit,
+)
+
+
+def test_local_backend():
+    """Buckets hold up to a burst of tokens, and are refilled at a rate."""
+    backend = LocalRateLimitBackend()
+    assert backend.consume("orcid", 1, 2, 1) == 0
+    assert backend.consume("orcid", 1, 2, 1) == 0
+    assert 0.5 < backend.consume("orcid", 1, 2, 1) <= 1
+
+    # Buckets are independent
+    assert backend.consume("ror", 1, 2, 2) == 0
+
+
+def test_database_backend(app, db, monkeypatch):
+    """Buckets are shared by all the processes, through the database."""
+    worker1, worker2 = DatabaseRateLimitBackend(), DatabaseRateLimitBackend()
+    assert worker1.consume("orcid", 1, 2, 1) == 0
+    assert worker2.consume("orcid", 1, 2, 1) == 0
+    assert 0.5 < worker1.consume("orcid", 1, 2, 1) <= 1
+    assert db.session.get(RateLimitBucket, "orcid").tokens < 1
+
+    # Processes fall back to their own buckets if the database fails
+    def failing_consume(*args):
+        raise OperationalError("SELECT", {}, Exception("Connection refused"))
+
+    monkeypatch.setattr(worker1, "_consume", failing_consume)
+    assert worker1.consume("orcid", 1, 2, 1) == 0
+
+
+def test_job_type_acquire(app, db, monkeypatch):
+    """Job types wait for their rate limit before calling a service."""
+    waits = []
+    sleep = ratelimits.time.sleep
+
+    def recording_sleep(seconds):
+        waits.append(seconds)
+        sleep(seconds)
+
+    monkeypatch.setattr(ratelimits.time, "sleep", recording_sleep)
+    MockChunkedJob.acquire()  # No rate limit
+
+    monkeypatch.setattr(MockChunkedJob, "rate_limit", RateLimit(rate=100, burst=2))
+    for _ in range(3):
+        MockChunkedJob.acquire()
+    assert waits and max(waits) <= 0.01
+    assert db.session.get(RateLimitBucket, "mock_chunked")
+
+    with pytest.raises(RateLimitExceededError):
+        MockChunkedJob.acquire(timeout=0)
+    with pytest.raises(ValueError):
+        MockChunkedJob.acquire(tokens=3)
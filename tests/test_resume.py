@@ -0,0 +1,104 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Tests for the resumption of failed runs."""
+
+import pytest
+from invenio_access.permissions import system_identity
+from mock_module.jobs import MockChunkedJob
+
+from invenio_jobs.cli import resume_run
+from invenio_jobs.models import Run, RunStatusEnum
+from invenio_jobs.proxies import current_runs_service
+from invenio_jobs.services.errors import RunNotResumableError
+
+
+def test_resume_subtasks(app, db, anon_identity, chunked_job, reload_run, monkeypatch):
+    """Only the failed subtasks are queued again, and counters are carried over."""
+    monkeypatch.setattr(MockChunkedJob, "failing", (4,))
+    failed = current_runs_service.create(anon_identity, chunked_job, {})
+    assert reload_run(failed.id).status == RunStatusEnum.PARTIAL_SUCCESS
+
+    monkeypatch.setattr(MockChunkedJob, "failing", ())
+    MockChunkedJob.processed.clear()
+    res = current_runs_service.resume(anon_identity, chunked_job, failed.id)
+    assert res.data["resumed_run_id"] == failed.id
+
+    run = reload_run(res.id)
+    assert run.status == RunStatusEnum.SUCCESS
+    assert MockChunkedJob.processed == [3, 4, 5]
+    assert run.subtasks.count() == 1
+    assert (run.total_subtasks, run.completed_subtasks) == (4, 4)
+    assert run.failed_subtasks == 0
+    assert (run.inserted_entries, run.total_entries) == (10, 10)
+
+    # Successful runs can't be resumed
+    with pytest.raises(RunNotResumableError):
+        current_runs_service.resume(anon_identity, chunked_job, res.id)
+
+
+@pytest.mark.parametrize("chunked_job", [{"max_parallel_chunks": 0}], indirect=True)
+def test_resume_inline(app, db, anon_identity, chunked_job, reload_run, monkeypatch):
+    """Runs without subtasks continue after their checkpoint."""
+    monkeypatch.setattr(MockChunkedJob, "failing", (7,))
+    failed_id = current_runs_service.create(anon_identity, chunked_job, {}).id
+
+    monkeypatch.setattr(MockChunkedJob, "failing", ())
+    MockChunkedJob.processed.clear()
+    res = current_runs_service.resume(system_identity, chunked_job, failed_id)
+
+    run = reload_run(res.id)
+    assert run.status == RunStatusEnum.SUCCESS
+    assert MockChunkedJob.processed == [6, 7, 8, 9]
+    assert (run.inserted_entries, run.total_entries) == (10, 10)
+    assert reload_run(failed_id).status == RunStatusEnum.FAILED
+
+
+def test_resume_not_resumable(app, db, anon_identity, jobs):
+    """Runs of job types which can't resume are not resumed."""
+    run = Run(job_id=jobs.simple.id, status=RunStatusEnum.FAILED, queue="celery")
+    db.session.add(run)
+    db.session.commit()
+
+    with pytest.raises(RunNotResumableError):
+        current_runs_service.resume(anon_identity, jobs.simple.id, run.id)
+    res = current_runs_service.read(anon_identity, jobs.simple.id, run.id)
+    assert "resume" not in res.to_dict()["links"]
+
+
+def test_resume_resource(app, db, client, chunked_job, monkeypatch):
+    """Failed runs are resumed through their resume link, or the CLI."""
+    monkeypatch.setattr(MockChunkedJob, "failing", (4,))
+    res = client.post(f"/jobs/{chunked_job}/runs", json={})
+    run_id = res.json["id"]
+
+    res = client.get(f"/jobs/{chunked_job}/runs/{run_id}")
+    resume_link = res.json["links"]["resume"]
+    assert resume_link.endswith(f"/runs/{run_id}/actions/resume")
+
+    monkeypatch.setattr(MockChunkedJob, "failing", ())
+    res = client.post(f"/jobs/{chunked_job}/runs/{run_id}/actions/resume")
+    assert res.status_code == 202
+    assert res.json["resumed_run_id"] == run_id
+    resumed_id = res.json["id"]
+
+    # Runs are only resumed once, and no longer offer to
+    res = client.get(f"/jobs/{chunked_job}/runs/{run_id}")
+    assert "resume" not in res.json["links"]
+    res = client.get(f"/jobs/{chunked_job}/runs")
+    hits = {hit["id"]: hit for hit in res.json["hits"]["hits"]}
+    assert "resume" not in hits[run_id]["links"]
+    res = client.post(f"/jobs/{chunked_job}/runs/{run_id}/actions/resume")
+    assert res.status_code == 400
+    assert f"already resumed by run {resumed_id}" in res.json["message"]
+
+    res = client.post(f"/jobs/{chunked_job}/runs/{resumed_id}/actions/resume")
+    assert res.status_code == 400
+
+    # From the CLI
+    monkeypatch.setattr(MockChunkedJob, "failing", (4,))
+    failed_id = current_runs_service.create(system_identity, chunked_job, {}).id
+    monkeypatch.setattr(MockChunkedJob, "failing", ())
+    result = app.test_cli_runner().invoke(resume_run, [failed_id])
+    assert result.exit_code == 0
+    assert f"Run {failed_id} resumed successfully" in result.output
@@ -0,0 +1,150 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Tests for the retries of failed runs."""
+
+import pytest
+from mock_module.jobs import MockChunkedJob
+
+from invenio_jobs.models import Run, RunStatusEnum
+from invenio_jobs.proxies import current_runs_service
+from invenio_jobs.retries import RetryPolicy
+from invenio_jobs.tasks import execute_chunk, execute_run
+
+RETRY_POLICY = RetryPolicy(max_attempts=2, backoff=0, retry_on=(ConnectionError,))
+"""Retry policy of the mock chunked job type, retrying connection errors."""
+
+retrying = pytest.mark.parametrize(
+    "chunked_job", [{"retry_policy": RETRY_POLICY}], indirect=True
+)
+
+
+@pytest.fixture()
+def flaky_dispatch(monkeypatch):
+    """Fail once to iterate the chunks of the mock chunked job, after two chunks."""
+    iter_chunks = MockChunkedJob.iter_chunks
+    failed = []
+
+    def flaky_iter_chunks(cursor=None, **kwargs):
+        for chunk_cursor, chunk in iter_chunks(cursor=cursor, **kwargs):
+            if 6 in chunk and not failed:
+                failed.append(chunk)
+                raise ConnectionError("Index unavailable.")
+            yield chunk_cursor, chunk
+
+    monkeypatch.setattr(MockChunkedJob, "iter_chunks", flaky_iter_chunks)
+
+
+def test_retry_policy(monkeypatch):
+    """Retryable errors are retried after an exponential backoff."""
+    policy = RetryPolicy(max_attempts=3, backoff=10, max_backoff=30, jitter=False)
+    assert policy.should_retry(ValueError(), 2)
+    assert not policy.should_retry(ValueError(), 3)
+    assert [policy.countdown(attempts) for attempts in (1, 2, 3)] == [10, 20, 30]
+
+    policy = RetryPolicy(backoff=10, retry_on=(ConnectionError,))
+    assert not policy.should_retry(ValueError(), 1)
+    assert 10 <= policy.countdown(2) <= 20
+
+
+@pytest.mark.parametrize(
+    "chunked_job",
+    [{"retry_policy": RETRY_POLICY, "max_parallel_chunks": 0}],
+    indirect=True,
+)
+def test_retry_run(app, db, anon_identity, chunked_job, reload_run, monkeypatch):
+    """Runs are retried, and resume from their checkpoint."""
+    monkeypatch.setattr(MockChunkedJob, "flaky", (7,))
+
+    res = current_runs_service.create(anon_identity, chunked_job, {})
+    run = reload_run(res.id)
+    assert run.status == RunStatusEnum.SUCCESS
+    assert run.attempts == 2
+    assert (run.inserted_entries, run.total_entries) == (10, 10)
+    assert MockChunkedJob.processed == list(range(10))
+
+    # Errors which are not retryable fail the run
+    monkeypatch.setattr(MockChunkedJob, "failing", (7,))
+    res = current_runs_service.create(anon_identity, chunked_job, {})
+    run = reload_run(res.id)
+    assert run.status == RunStatusEnum.FAILED
+    assert run.attempts == 1
+
+
+@retrying
+def test_retry_subtasks(app, db, anon_identity, chunked_job, reload_run, monkeypatch):
+    """Subtasks are retried, and report their counters to their run once."""
+    monkeypatch.setattr(MockChunkedJob, "flaky", (4,))
+    monkeypatch.setattr(MockChunkedJob, "failing", (9,))
+
+    res = current_runs_service.create(anon_identity, chunked_job, {})
+    run = reload_run(res.id)
+    assert run.status == RunStatusEnum.PARTIAL_SUCCESS
+    assert (run.total_subtasks, run.completed_subtasks) == (4, 4)
+    assert run.failed_subtasks == 1
+    assert (run.inserted_entries, run.total_entries) == (9, 9)
+
+    subtasks = run.subtasks.order_by(Run.created).all()
+    assert [subtask.attempts for subtask in subtasks] == [1, 2, 1, 1]
+    assert [subtask.status for subtask in subtasks] == [
+        RunStatusEnum.SUCCESS,
+        RunStatusEnum.SUCCESS,
+        RunStatusEnum.SUCCESS,
+        RunStatusEnum.FAILED,
+    ]
+
+
+@pytest.mark.parametrize(
+    "chunked_job", [{"retry_policy": RetryPolicy(backoff=60)}], indirect=True
+)
+def test_retry_run_subtasks(
+    app, db, anon_identity, chunked_job, flaky_dispatch, sent, reload_run, monkeypatch
+):
+    """Subtasks finishing while their run waits for its retry don't finalize it."""
+    retries = []
+    apply_async = execute_run.apply_async
+
+    def deferred_apply_async(countdown=None, **kwargs):
+        if countdown is None:
+            return apply_async(**kwargs)
+        retries.append(kwargs)
+
+    monkeypatch.setattr(execute_run, "apply_async", deferred_apply_async)
+    res = current_runs_service.create(anon_identity, chunked_job, {})
+    assert len(sent) == 2 and len(retries) == 1
+
+    while sent:
+        execute_chunk.apply(kwargs=sent.pop(0))
+    run = reload_run(res.id)
+    assert run.status == RunStatusEnum.QUEUED
+    assert not run.subtasks_closed
+    assert (run.completed_subtasks, run.inserted_entries) == (2, 6)
+
+    # The retry continues after the dispatched chunks
+    execute_run.apply(kwargs=retries[0]["kwargs"])
+    while sent:
+        execute_chunk.apply(kwargs=sent.pop(0))
+    run = reload_run(res.id)
+    assert run.status == RunStatusEnum.SUCCESS
+    assert (run.total_subtasks, run.completed_subtasks) == (4, 4)
+    assert (run.inserted_entries, run.total_entries) == (10, 10)
+
+
+@pytest.mark.parametrize(
+    "chunked_job",
+    [{"retry_policy": RETRY_POLICY, "resumable": False}],
+    indirect=True,
+)
+def test_retry_run_not_resumable(
+    app, db, anon_identity, chunked_job, flaky_dispatch, sent, reload_run, monkeypatch
+):
+    """Runs with subtasks are only retried if they continue after a checkpoint."""
+
+    res = current_runs_service.create(anon_identity, chunked_job, {})
+    while sent:
+        execute_chunk.apply(kwargs=sent.pop(0))
+    run = reload_run(res.id)
+    assert run.status == RunStatusEnum.PARTIAL_SUCCESS
+    assert "ConnectionError: Index unavailable." in run.message
+    assert run.attempts == 1
+    assert (run.total_subtasks, run.inserted_entries) == (2, 6)
@@ -0,0 +1,77 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Tests for run lifecycle events."""
+
+import pytest
+
+from invenio_jobs.events import CallbackSink
+from invenio_jobs.models import RunEvent
+from invenio_jobs.proxies import current_runs_service
+from invenio_jobs.tasks import dispatch_run_events
+
+
+@pytest.fixture()
+def sink(app):
+    """Configure a sink collecting the delivered events."""
+
+    class CollectingSink(CallbackSink):
+        fail = False
+        events = []
+
+        def __init__(self):
+            super().__init__(self.collect)
+
+        def collect(self, events):
+            if self.fail:
+                raise RuntimeError("Sink is down")
+            self.events.extend(events)
+
+    sink = CollectingSink()
+    app.config["JOBS_RUN_EVENTS_SINKS"] = [sink]
+    yield sink
+    app.config["JOBS_RUN_EVENTS_SINKS"] = []
+
+
+def test_run_events_delivered(app, db, anon_identity, jobs, sink):
+    """Run status changes are delivered to the sinks after commit."""
+    parent_run = current_runs_service.create(
+        anon_identity, jobs.simple.id, {"title": "Parent run"}
+    )
+    subtask = current_runs_service.create_subtask_run(
+        anon_identity, parent_run_id=parent_run.id, job_id=jobs.simple.id
+    )
+    current_runs_service.start_processing_subtask(
+        anon_identity, subtask.id, jobs.simple.id
+    )
+    current_runs_service.finalize_subtask(
+        anon_identity, run_id=subtask.id, job_id=jobs.simple.id, success=True
+    )
+
+    subtask_events = [e["type"] for e in sink.events if e["run_id"] == subtask.id]
+    assert subtask_events == ["run.queued", "run.running", "run.success"]
+    parent_events = [e["type"] for e in sink.events if e["run_id"] == parent_run.id]
+    # The parent run is executed eagerly, then finalized by its subtask
+    assert parent_events[0] == "run.queued"
+    assert parent_events[-1] == "run.success"
+    assert [e["id"] for e in sink.events] == sorted(e["id"] for e in sink.events)
+    assert RunEvent.query.filter(RunEvent.dispatched_at.is_(None)).count() == 0
+
+
+def test_run_events_retried(app, db, anon_identity, jobs, sink):
+    """Events which failed to be delivered are retried on the next dispatch."""
+    sink.fail = True
+    run = current_runs_service.create(
+        anon_identity, jobs.simple.id, {"title": "Test run"}
+    )
+
+    pending = RunEvent.query.filter(RunEvent.run_id == run.id).all()
+    assert pending
+    assert all(e.dispatched_at is None for e in pending)
+    assert all(e.attempts > 0 and "Sink is down" in e.last_error for e in pending)
+    assert sink.events == []
+
+    sink.fail = False
+    dispatch_run_events()
+    assert [e["run_id"] for e in sink.events] == [run.id] * len(pending)
+    assert RunEvent.query.filter(RunEvent.dispatched_at.is_(None)).count() == 0
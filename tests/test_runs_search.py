@@ -0,0 +1,179 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Tests for the search of the runs of all jobs."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import sqlalchemy as sa
+from invenio_accounts.models import User
+
+from invenio_jobs.models import Run, RunStatusEnum
+from invenio_jobs.proxies import current_runs_service
+
+
+@pytest.fixture()
+def runs(db, user, jobs):
+    """Runs of several jobs, one of them with a subtask."""
+    now = datetime.now(timezone.utc)
+    parent = Run(
+        job_id=jobs.simple.id,
+        status=RunStatusEnum.FAILED,
+        queue="celery",
+        started_by_id=user.id,
+    )
+    runs = [
+        parent,
+        Run(job_id=jobs.interval.id, status=RunStatusEnum.SUCCESS, queue="low"),
+        Run(
+            job_id=jobs.crontab.id,
+            status=RunStatusEnum.FAILED,
+            queue="low",
+            created=now - timedelta(days=2),
+        ),
+        Run(
+            job_id=jobs.simple.id,
+            parent_run=parent,
+            status=RunStatusEnum.FAILED,
+            queue="celery",
+        ),
+    ]
+    db.session.add_all(runs)
+    db.session.commit()
+    return runs
+
+
+def _ids(res):
+    return sorted(hit["id"] for hit in res["hits"]["hits"])
+
+
+def test_search_all(app, anon_identity, jobs, runs):
+    """Runs of all jobs are filtered by status, time window and parent run."""
+    parent, success, old, subtask = [str(run.id) for run in runs]
+
+    res = current_runs_service.search_all(anon_identity, {}).to_dict()
+    assert _ids(res) == sorted([parent, success, old])
+    # Runs are paged with a cursor, without counting them
+    assert res["hits"]["after"] is None
+    assert res["hits"]["total"] is None
+    assert "started_by" not in res["hits"]["hits"][0]
+
+    params = {
+        "facets": {"status": ["FAILED"]},
+        "created_after": datetime.now(timezone.utc) - timedelta(days=1),
+    }
+    res = current_runs_service.search_all(anon_identity, params).to_dict()
+    assert _ids(res) == [parent]
+
+    params = {"parent_run_id": runs[0].id}
+    res = current_runs_service.search_all(anon_identity, params).to_dict()
+    assert _ids(res) == [subtask]
+
+    params = {"job_id": jobs.simple.id, "include_subtasks": True}
+    res = current_runs_service.search_all(anon_identity, params).to_dict()
+    assert _ids(res) == sorted([parent, subtask])
+
+
+def test_search_all_resource(app, client, user, runs):
+    """Runs of all jobs are paged through with a cursor."""
+    res = client.get("/runs?size=2&queue=low")
+    assert res.status_code == 200
+    assert len(res.json["hits"]["hits"]) == 2
+    assert res.json["links"]["self"].startswith("https://127.0.0.1:5000/api/runs")
+
+    res = client.get("/runs?size=1&status=FAILED&expand=true")
+    hits = res.json["hits"]["hits"]
+    assert hits[0]["started_by"]["id"] == str(user.id)
+    assert "next" in res.json["links"]
+
+    res = client.get(f"/runs?size=1&status=FAILED&after={res.json['hits']['after']}")
+    assert res.json["hits"]["hits"][0]["id"] == str(runs[2].id)
+    assert res.json["hits"]["after"] is None
+
+    # Runs can still be paged by number
+    res = client.get("/runs?page=2&size=2")
+    assert res.json["hits"]["total"] == 3
+    assert len(res.json["hits"]["hits"]) == 1
+
+
+def test_search_started_by_batched(app, db, anon_identity, jobs):
+    """The users who started the runs are loaded in a single query."""
+    job_id = jobs.simple.id
+    users = [User(email=f"user{i}@example.org", active=True) for i in range(3)]
+    db.session.add_all(users)
+    db.session.flush()
+    user_ids = {str(user.id) for user in users}
+    # Two runs per user
+    db.session.add_all(
+        [
+            Run(job_id=job_id, queue="celery", started_by_id=user.id)
+            for user in users * 2
+        ]
+    )
+    db.session.commit()
+    db.session.expunge_all()
+
+    statements = []
+
+    def count(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    sa.event.listen(db.engine, "before_cursor_execute", count)
+    try:
+        res = current_runs_service.search(
+            anon_identity, job_id, {"after": ""}, expand=True
+        ).to_dict()
+    finally:
+        sa.event.remove(db.engine, "before_cursor_execute", count)
+
+    assert {hit["started_by"]["id"] for hit in res["hits"]["hits"]} == user_ids
+    # Users are not loaded one by one
+    assert not [s for s in statements if "WHERE accounts_user.id = ?" in s]
+    # Users are projected once each
+    assert len([s for s in statements if "FROM accounts_useridentity" in s]) == 3
+
+
+def test_search_fields(app, db, client, user, runs):
+    """Runs are projected on the requested fields, loading only their columns."""
+    statements = []
+
+    def count(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    sa.event.listen(db.engine, "before_cursor_execute", count)
+    try:
+        res = client.get("/runs?fields=id,status,started_by&status=FAILED")
+    finally:
+        sa.event.remove(db.engine, "before_cursor_execute", count)
+
+    assert res.status_code == 200
+    hits = res.json["hits"]["hits"]
+    assert {tuple(sorted(hit)) for hit in hits} == {
+        ("id", "links", "started_by", "status")
+    }
+    assert {hit["started_by"]["id"] for hit in hits if hit["started_by"]} == {
+        str(user.id)
+    }
+    page = [s for s in statements if "ORDER BY sort_value" in s]
+    assert len(page) == 1 and "jobs_run.args" not in page[0]
+
+    # The links of the hits don't load their other fields one by one
+    statements.clear()
+    sa.event.listen(db.engine, "before_cursor_execute", count)
+    try:
+        res = client.get("/runs?fields=id,title")
+    finally:
+        sa.event.remove(db.engine, "before_cursor_execute", count)
+    assert res.status_code == 200
+    assert not [s for s in statements if "WHERE jobs_run.id =" in s]
+    assert not [s for s in statements if "WHERE jobs_job.id =" in s]
+
+    res = client.get(f"/jobs/{runs[0].job_id}/runs?fields=args,title")
+    assert res.json["hits"]["hits"][0]["args"] == {
+        "args": {},
+        "job_arg_schema": "custom",
+    }
+
+    res = client.get("/runs?fields=id,unknown")
+    assert res.status_code == 400
@@ -0,0 +1,48 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Tests for the query string matching of searches."""
+
+from unittest.mock import patch
+
+from invenio_jobs.proxies import current_jobs_service, current_runs_service
+from invenio_jobs.services.query import uuid_prefix_range
+
+
+def test_uuid_prefix_range():
+    """Hexadecimal prefixes map to a range of UUIDs."""
+    low, high = uuid_prefix_range("3FA8-5f")
+    assert str(low) == "3fa85f00-0000-0000-0000-000000000000"
+    assert str(high) == "3fa85fff-ffff-ffff-ffff-ffffffffffff"
+    assert uuid_prefix_range("manual") is None
+    assert uuid_prefix_range("") is None
+
+
+def test_jobs_query(app, anon_identity, jobs):
+    """Jobs are matched by a substring of their title, or by their id."""
+
+    def search(q):
+        hits = current_jobs_service.search(anon_identity, {"q": q}).to_dict()
+        return sorted(hit["id"] for hit in hits["hits"]["hits"])
+
+    assert search("CRONTAB") == [jobs.crontab.id]
+    assert search(jobs.interval.id) == [jobs.interval.id]
+    # Wildcards are matched literally
+    assert search("%") == []
+
+
+def test_runs_query(app, anon_identity, jobs):
+    """Runs are matched by id, by a prefix of their task id, or by title."""
+    job_id = jobs.simple.id
+    with patch("invenio_jobs.services.services.TaskOp"):
+        first = current_runs_service.create(anon_identity, job_id, {"title": "First"})
+        second = current_runs_service.create(anon_identity, job_id, {"title": "2nd"})
+
+    def search(q):
+        hits = current_runs_service.search(anon_identity, job_id, {"q": q}).to_dict()
+        return sorted(hit["id"] for hit in hits["hits"]["hits"])
+
+    assert search(first.id) == [first.id]
+    assert search(second["task_id"]) == [second.id]
+    assert search(second["task_id"][:8].upper()) == [second.id]
+    assert search("first") == [first.id]
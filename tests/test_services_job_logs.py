@@ -5,6 +5,7 @@
 from datetime import datetime, timezone
 
 import pytest
+from invenio_search.engine import dsl
 
 from invenio_jobs.api import AttrDict
 from invenio_jobs.proxies import current_jobs_logs_service
@@ -173,3 +174,104 @@ def test_job_logs_search_with_task_lineage(monkeypatch, anon_identity, app, Fake
     first_hit = payload["hits"]["hits"][0]
     assert "task_id" in first_hit["context"]
     assert "parent_task_id" in first_hit["context"]
+
+
+def _ts_agg(idx):
+    """Build a min/max timestamp aggregation value."""
+    timestamp = datetime(2025, 1, 1, tzinfo=timezone.utc).timestamp() + idx
+    return {
+        "value": timestamp * 1000,
+        "value_as_string": datetime.fromtimestamp(timestamp, timezone.utc).isoformat(),
+    }
+
+
+@pytest.mark.usefixtures("app")
+def test_job_logs_aggregate(monkeypatch, anon_identity, app):
+    """Service aggregates levels, task hierarchy and histogram of a run."""
+    service = current_jobs_logs_service
+    executed = []
+
+    raw = {
+        "hits": {"total": {"value": 6}, "hits": []},
+        "aggregations": {
+            "levels": {
+                "buckets": [
+                    {"key": "INFO", "doc_count": 5},
+                    {"key": "ERROR", "doc_count": 1},
+                ]
+            },
+            "first": _ts_agg(1),
+            "last": _ts_agg(6),
+            "tasks": {
+                "buckets": [
+                    {
+                        "key": "task-B",
+                        "doc_count": 2,
+                        "first": _ts_agg(3),
+                        "last": _ts_agg(4),
+                        "levels": {"buckets": [{"key": "INFO", "doc_count": 2}]},
+                        "parent": {"buckets": [{"key": "task-A", "doc_count": 2}]},
+                    },
+                    {
+                        "key": "task-A",
+                        "doc_count": 4,
+                        "first": _ts_agg(1),
+                        "last": _ts_agg(6),
+                        "levels": {
+                            "buckets": [
+                                {"key": "INFO", "doc_count": 3},
+                                {"key": "ERROR", "doc_count": 1},
+                            ]
+                        },
+                        "parent": {"buckets": []},
+                    },
+                ]
+            },
+            "histogram": {
+                "interval": "1s",
+                "buckets": [
+                    {
+                        "key_as_string": "2025-01-01T00:00:01.000Z",
+                        "key": 1735689601000,
+                        "doc_count": 6,
+                    }
+                ],
+            },
+        },
+    }
+
+    class FakeAggSearch(dsl.Search):
+        def execute(self):
+            executed.append(self.to_dict())
+            return dsl.response.Response(self, raw)
+
+    def fake_search(self, *args, **kwargs):
+        return FakeAggSearch()
+
+    monkeypatch.setattr(service.__class__, "_search", fake_search)
+
+    with app.app_context():
+        payload = service.aggregate(anon_identity, "run-456").to_dict()
+
+    # Only aggregations are requested, no log lines are transferred
+    assert executed[0]["size"] == 0
+    assert set(executed[0]["aggs"]) == {"levels", "first", "last", "tasks", "histogram"}
+
+    assert payload["run_id"] == "run-456"
+    assert payload["total"] == 6
+    assert payload["levels"] == {"INFO": 5, "ERROR": 1}
+    assert payload["first"] == _ts_agg(1)["value_as_string"]
+    assert payload["last"] == _ts_agg(6)["value_as_string"]
+    assert payload["histogram"] == {
+        "interval": "1s",
+        "buckets": [{"timestamp": "2025-01-01T00:00:01.000Z", "count": 6}],
+    }
+
+    # task-B is nested under its parent task-A
+    assert len(payload["tasks"]) == 1
+    root = payload["tasks"][0]
+    assert root["task_id"] == "task-A"
+    assert root["count"] == 4
+    assert root["levels"] == {"INFO": 3, "ERROR": 1}
+    assert [c["task_id"] for c in root["children"]] == ["task-B"]
+    assert root["children"][0]["parent_task_id"] == "task-A"
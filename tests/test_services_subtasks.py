@@ -307,3 +307,69 @@ def test_finalize_subtask_nonexistent_run(app, db, anon_identity, jobs):
         current_runs_service.finalize_subtask(
             anon_identity, run_id=invalid_run_id, job_id=jobs.simple.id, success=True
         )
+
+
+def test_finalize_subtask_cancelled(app, db, anon_identity, jobs):
+    """Cancelled subtasks are not finalized, nor reported to their parent."""
+    parent_run = current_runs_service.create(
+        anon_identity, jobs.simple.id, {"title": "Parent run"}
+    )
+    subtask_run = current_runs_service.create_subtask_run(
+        anon_identity, parent_run_id=parent_run.id, job_id=jobs.simple.id
+    )
+    run_model = db.session.get(Run, subtask_run.id)
+    run_model.status = RunStatusEnum.CANCELLED
+    db.session.commit()
+
+    with pytest.raises(RunStatusChangeError):
+        current_runs_service.finalize_subtask(
+            anon_identity,
+            run_id=subtask_run.id,
+            job_id=jobs.simple.id,
+            inserted_entries_count=3,
+        )
+
+    assert db.session.get(Run, subtask_run.id).status == RunStatusEnum.CANCELLED
+    parent = db.session.get(Run, parent_run.id)
+    assert (parent.completed_subtasks, parent.inserted_entries) == (0, 0)
+
+
+def test_read_tree(app, db, anon_identity, jobs):
+    """The tree of the subtasks of a run is read with its counters summed up."""
+    job_id = jobs.simple.id
+    root = Run(job_id=job_id, queue="celery", title="root", total_subtasks=2)
+    child = Run(
+        job_id=job_id,
+        queue="celery",
+        parent_run=root,
+        title="child",
+        total_subtasks=1,
+        total_entries=5,
+    )
+    grandchild = Run(
+        job_id=job_id,
+        queue="celery",
+        parent_run=child,
+        title="grandchild",
+        status=RunStatusEnum.FAILED,
+        total_entries=3,
+        errored_entries=1,
+    )
+    sibling = Run(job_id=job_id, queue="celery", parent_run=root, title="sibling")
+    db.session.add_all([root, child, grandchild, sibling])
+    db.session.commit()
+
+    tree = current_runs_service.read_tree(anon_identity, job_id, root.id).to_dict()
+    assert tree["id"] == str(root.id)
+    assert [node["title"] for node in tree["children"]] == ["child", "sibling"]
+    grandchild_node = tree["children"][0]["children"][0]
+    assert grandchild_node["status"] == "FAILED"
+    assert grandchild_node["depth"] == 2
+    assert tree["totals"]["total_subtasks"] == 3
+    assert tree["totals"]["total_entries"] == 8
+    assert tree["totals"]["errored_entries"] == 1
+    assert tree["children"][0]["totals"]["total_entries"] == 8
+    assert tree["children"][1]["totals"]["total_entries"] == 0
+
+    with pytest.raises(RunNotFoundError):
+        current_runs_service.read_tree(anon_identity, jobs.interval.id, root.id)
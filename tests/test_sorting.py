@@ -0,0 +1,64 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Tests for the sorting of searches."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from invenio_jobs.models import Run
+from invenio_jobs.proxies import current_jobs_service
+
+
+@pytest.fixture()
+def last_runs(db, user, jobs):
+    """Runs of the interval and crontab jobs, the simple job never ran."""
+    now = datetime.now(timezone.utc)
+    db.session.add_all(
+        [
+            Run(
+                job_id=jobs.interval.id,
+                started_at=now - timedelta(hours=1),
+                started_by_id=user.id,
+                queue="low",
+            ),
+            Run(job_id=jobs.crontab.id, started_at=now, queue="low"),
+        ]
+    )
+    db.session.commit()
+    return jobs
+
+
+def _titles(hits):
+    return [hit["title"] for hit in hits]
+
+
+@pytest.mark.parametrize(
+    "sort,direction,expected",
+    [
+        ("last_run_start_time", "desc", ["crontab", "interval", "unscheduled"]),
+        ("last_run_start_time", "asc", ["interval", "crontab", "unscheduled"]),
+        ("user", "asc", ["interval"]),
+        ("jobs", "asc", ["crontab", "interval", "unscheduled"]),
+    ],
+)
+def test_jobs_sort(app, anon_identity, last_runs, sort, direction, expected):
+    """Jobs are sorted by their last run, with jobs without a value last."""
+    params = {"sort": sort, "sort_direction": direction}
+    expected = [f"Test {title} job" for title in expected]
+
+    res = current_jobs_service.search(anon_identity, params).to_dict()
+    assert _titles(res["hits"]["hits"])[: len(expected)] == expected
+    assert res["hits"]["total"] == 3
+
+    # Paging through with a cursor yields the same ordering
+    hits, after = [], ""
+    while after is not None:
+        res = current_jobs_service.search(
+            anon_identity, {**params, "size": 1, "after": after}
+        ).to_dict()
+        hits.extend(res["hits"]["hits"])
+        after = res["hits"]["after"]
+    assert _titles(hits)[: len(expected)] == expected
+    assert len(hits) == 3
@@ -0,0 +1,71 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Tests for the per-phase timings of runs."""
+
+from unittest.mock import patch
+
+from mock_module.tasks import mock_task
+
+from invenio_jobs.models import Run
+from invenio_jobs.proxies import current_runs_service
+from invenio_jobs.timings import collect_run_timings, run_span
+
+
+def _fetch(**kwargs):
+    """Task body recording a custom span."""
+    with run_span("fetch"):
+        pass
+    with run_span("fetch"):
+        pass
+
+
+def test_run_span():
+    """Spans are summed by name, and are no-ops outside of a run."""
+    with run_span("noop"):
+        pass
+
+    with collect_run_timings() as timings:
+        with run_span("fetch"):
+            pass
+        with run_span("fetch"):
+            pass
+    assert list(timings) == ["fetch"]
+    assert timings["fetch"] >= 0
+
+
+def test_run_timings(app, db, client, anon_identity, jobs):
+    """Executing a run records its timings, including the job's own spans."""
+    with patch.object(mock_task, "run", side_effect=_fetch):
+        parent_run = current_runs_service.create(
+            anon_identity, jobs.simple.id, {"title": "Parent run"}
+        )
+
+    run = db.session.get(Run, parent_run.id)
+    assert set(run.timings) == {"args", "queue", "execute", "fetch"}
+    assert run.timings["execute"] >= run.timings["fetch"]
+
+    data = current_runs_service.read(
+        anon_identity, jobs.simple.id, parent_run.id
+    ).to_dict()
+    assert data["timings"] == run.timings
+
+    # Waiting on the subtasks is recorded when the last one finishes
+    subtask = current_runs_service.create_subtask_run(
+        anon_identity, parent_run_id=parent_run.id, job_id=jobs.simple.id
+    )
+    current_runs_service.start_processing_subtask(
+        anon_identity, subtask.id, jobs.simple.id
+    )
+    current_runs_service.finalize_subtask(
+        anon_identity, run_id=subtask.id, job_id=jobs.simple.id, success=True
+    )
+    run = db.session.get(Run, parent_run.id)
+    assert "subtasks" in run.timings
+
+    res = client.get(f"/jobs/{jobs.simple.id}/runs/timings")
+    assert res.status_code == 200
+    summary = res.json
+    assert summary["runs"] == 1
+    assert summary["spans"]["fetch"]["count"] == 1
+    assert summary["spans"]["fetch"]["max"] == run.timings["fetch"]
@@ -4,7 +4,18 @@
 import json
 from datetime import datetime, timedelta, timezone
 
-from invenio_jobs.utils import job_arg_json_dumper
+from marshmallow import Schema, fields
+from marshmallow_utils.validators import LazyOneOf
+
+from invenio_jobs.jobs import PredefinedArgsSchema
+from invenio_jobs.utils import (
+    compile_tpl_str,
+    eval_tpl_str,
+    is_static_schema,
+    job_arg_json_dumper,
+    normalize_job_args,
+    walk_values,
+)
 
 
 def test_job_arg_json_dumper():
@@ -37,3 +48,68 @@ def test_job_arg_json_dumper():
         """Python <3.10 cannot parse ISO timestamps with the "Z" shorthand (instead of "+00:00"),
         so we make 100% sure we aren't sending such a timestamp to the task implementation"""
         assert "Z" not in timestamp
+
+
+def test_eval_tpl_str():
+    ctx = {"job": {"title": "Job"}}
+    assert eval_tpl_str("{{ 1 + 1 }}", ctx) == 2
+    assert eval_tpl_str("{{ job.title | upper }}", ctx) == "JOB"
+    assert eval_tpl_str("{# comment #}plain", ctx) == "plain"
+    # Strings without Jinja blocks are not rendered, but still evaluated
+    assert eval_tpl_str("[1, 2]", ctx) == [1, 2]
+    assert eval_tpl_str("plain", ctx) == "plain"
+    assert eval_tpl_str("plain\n", ctx) == "plain"
+    assert eval_tpl_str(3, ctx) == 3
+
+    compile_tpl_str.cache_clear()
+    for _ in range(3):
+        eval_tpl_str("{{ job.title }}", ctx)
+    assert compile_tpl_str.cache_info().misses == 1
+
+
+def test_walk_values():
+    obj = {"a": "{{ 1 }}", "b": ["{{ 2 }}", {"c": "{{ 3 }}"}]}
+    walk_values(obj, lambda val: eval_tpl_str(val, {}))
+    assert obj == {"a": 1, "b": [2, {"c": 3}]}
+
+    # Deep structures don't hit the recursion limit
+    deep = leaf = []
+    for _ in range(5000):
+        leaf.append([])
+        leaf = leaf[0]
+    leaf.append("{{ 4 }}")
+    walk_values(deep, lambda val: eval_tpl_str(val, {}))
+    assert leaf == [4]
+
+
+def test_normalize_job_args():
+    since = datetime(2025, 7, 10, 5, 0, tzinfo=timezone.utc)
+    ids = list(range(10))
+    args = {"since": since, "ids": ids, "nested": [{"at": since}, (1, 2)], 3: None}
+    normalized = normalize_job_args(args)
+    # Same values as a round trip through JSON
+    assert normalized == json.loads(json.dumps(args, default=job_arg_json_dumper))
+    # Unchanged containers are shared, and the arguments are left untouched
+    assert normalized["ids"] is ids
+    assert args["since"] is since
+
+    plain = {"ids": ids, "title": "Job"}
+    assert normalize_job_args(plain) is plain
+
+
+def test_is_static_schema():
+    """Schemas with callable defaults or lazy choices are not static."""
+
+    class DynamicDefaultSchema(Schema):
+        since = fields.DateTime(load_default=lambda: datetime.now(timezone.utc))
+
+    class LazyChoicesSchema(Schema):
+        queue = fields.String(validate=LazyOneOf(choices=lambda: ["celery"]))
+
+    class NestedSchema(Schema):
+        items = fields.List(fields.Nested(LazyChoicesSchema))
+
+    assert is_static_schema(PredefinedArgsSchema())
+    assert not is_static_schema(DynamicDefaultSchema())
+    assert not is_static_schema(LazyChoicesSchema())
+    assert not is_static_schema(NestedSchema())